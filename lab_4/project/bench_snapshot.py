@@ -0,0 +1,52 @@
+import os
+import sys
+import time
+from part4 import Company, Department, Project, Manager, Developer
+from snapshot import save_snapshot, load_snapshot
+
+LEVELS = ["junior", "middle", "senior"]
+
+
+def build_company(count: int, departments: int = 20) -> Company:
+    company = Company("TechCorp")
+    depts = [Department(f"Отдел {i}") for i in range(departments)]
+    for i in range(1, count + 1):
+        dept = depts[i % departments]
+        if i % 4 == 0:
+            dept.add_employee(Manager(i, f"Сотрудник {i}", dept.name, 70000, 20000))
+        else:
+            dept.add_employee(Developer(i, f"Сотрудник {i}", dept.name, 60000, LEVELS[i % 3]))
+    for dept in depts:
+        company.add_department(dept)
+    project = Project(1, "Портал", "Корпоративный сайт", "2026-03-01", "active")
+    for emp in depts[0].get_employees()[:1000]:
+        project.add_team_member(emp)
+    company.add_project(project)
+    return company
+
+
+def timed(label: str, func, *args, filename: str = None):
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    size = f", {os.path.getsize(filename) / 2**20:.1f} МБ" if filename else ""
+    print(f"{label:<32} {seconds:7.2f} с{size}")
+    return result
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    company = build_company(count)
+    print(f"Сотрудников: {count}")
+    timed("save_to_json (сводка)", company.save_to_json, "bench.json", filename="bench.json")
+    timed("save_to_json (с сотрудниками)", lambda: company.save_to_json("bench.json", None, True), filename="bench.json")
+    timed("export_employees_csv", company.export_employees_csv, "bench.csv", filename="bench.csv")
+    timed("export_employees_csv (extended)", company.export_employees_csv, "bench.csv", True, filename="bench.csv")
+    timed("save_snapshot (zlib)", save_snapshot, company, "bench.snap", filename="bench.snap")
+    timed("save_snapshot (без сжатия)", lambda: save_snapshot(company, "bench.raw", False), filename="bench.raw")
+    timed("import_employees_csv", Company("Копия").import_employees_csv, "bench.csv")
+    restored = timed("load_snapshot (zlib)", load_snapshot, "bench.snap")
+    timed("load_snapshot (без сжатия)", load_snapshot, "bench.raw")
+    assert restored.calculate_total_monthly_cost() == company.calculate_total_monthly_cost()
+    for name in ("bench.json", "bench.csv", "bench.snap", "bench.raw"):
+        os.remove(name)
@@ -0,0 +1,221 @@
+"""Потоковая запись JSON и инкрементальное чтение событий (в стиле ijson)."""
+
+import json
+import re
+from contextlib import contextmanager
+from json.decoder import scanstring
+from typing import Any, Iterator, List, Optional, TextIO, Tuple
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class JsonStreamWriter:
+    def __init__(self, stream: TextIO, indent: Optional[int] = None):
+        self.stream = stream
+        self.indent = indent
+        self.__key_separator = ": " if indent is not None else ":"
+        self.__separators = (",", ": ") if indent is not None else (",", ":")
+        self.__counts: List[int] = []
+        self.__after_key = False
+
+    def __newline(self) -> None:
+        if self.indent is not None:
+            self.stream.write("\n" + " " * (self.indent * len(self.__counts)))
+
+    def __before_value(self) -> None:
+        if self.__after_key:
+            self.__after_key = False
+        elif self.__counts:
+            if self.__counts[-1]:
+                self.stream.write(",")
+            self.__counts[-1] += 1
+            self.__newline()
+
+    def __begin(self, bracket: str) -> None:
+        self.__before_value()
+        self.stream.write(bracket)
+        self.__counts.append(0)
+
+    def __end(self, bracket: str) -> None:
+        if self.__counts.pop():
+            self.__newline()
+        self.stream.write(bracket)
+
+    @contextmanager
+    def object(self) -> Iterator[None]:
+        self.__begin("{")
+        yield
+        self.__end("}")
+
+    @contextmanager
+    def array(self) -> Iterator[None]:
+        self.__begin("[")
+        yield
+        self.__end("]")
+
+    def key(self, name: str) -> None:
+        self.__before_value()
+        self.stream.write(json.dumps(name, ensure_ascii=False) + self.__key_separator)
+        self.__after_key = True
+
+    def value(self, value: Any) -> None:
+        # Небольшие значения (словарь сотрудника) сериализуются целиком
+        self.__before_value()
+        text = json.dumps(value, ensure_ascii=False, indent=self.indent, separators=self.__separators)
+        if self.indent is not None and self.__counts:
+            text = text.replace("\n", "\n" + " " * (self.indent * len(self.__counts)))
+        self.stream.write(text)
+
+    def field(self, name: str, value: Any) -> None:
+        self.key(name)
+        self.value(value)
+
+
+class JsonEventReader:
+    # События: start_map, map_key, end_map, start_array, end_array,
+    # string, number, boolean, null
+    def __init__(self, stream: TextIO, chunk_size: int = 65536):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.__buffer = ""
+        self.__pos = 0
+        self.__eof = False
+
+    def __fill(self) -> None:
+        if self.__eof:
+            raise ValueError("Неожиданный конец JSON")
+        chunk = self.stream.read(self.chunk_size)
+        self.__buffer = self.__buffer[self.__pos:] + chunk
+        self.__pos = 0
+        self.__eof = not chunk
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        containers: List[str] = []
+        expect_key = False
+        while True:
+            self.__pos = _WHITESPACE.match(self.__buffer, self.__pos).end()
+            if self.__pos == len(self.__buffer):
+                if self.__eof:
+                    if containers:
+                        raise ValueError("Неожиданный конец JSON")
+                    return
+                self.__fill()
+                continue
+            buffer, pos = self.__buffer, self.__pos
+            char = buffer[pos]
+            if char in "{[":
+                containers.append(char)
+                expect_key = char == "{"
+                self.__pos += 1
+                yield ("start_map" if char == "{" else "start_array"), None
+            elif char in "}]":
+                containers.pop()
+                self.__pos += 1
+                yield ("end_map" if char == "}" else "end_array"), None
+            elif char == ",":
+                expect_key = containers[-1] == "{"
+                self.__pos += 1
+            elif char == ":":
+                self.__pos += 1
+            elif char == '"':
+                try:
+                    value, end = scanstring(buffer, pos + 1)
+                except json.JSONDecodeError:
+                    self.__fill()
+                    continue
+                self.__pos = end
+                yield ("map_key" if expect_key else "string"), value
+                expect_key = False
+            elif char in "tfn":
+                word = buffer[pos:pos + 5] if char == "f" else buffer[pos:pos + 4]
+                if word not in _LITERALS:
+                    if len(buffer) - pos < 5 and not self.__eof:
+                        self.__fill()
+                        continue
+                    raise ValueError(f"Неверный JSON в позиции {pos}")
+                self.__pos += len(word)
+                yield ("null" if word == "null" else "boolean"), _LITERALS[word]
+            else:
+                match = _NUMBER.match(buffer, pos)
+                # Число может продолжаться в следующей порции
+                end = match.end() if match else pos
+                if not self.__eof and (end == len(buffer) or buffer[end] in ".eE+-"):
+                    self.__fill()
+                    continue
+                if match is None:
+                    raise ValueError(f"Неверный JSON в позиции {pos}")
+                text = match.group()
+                self.__pos = match.end()
+                yield "number", float(text) if any(c in text for c in ".eE") else int(text)
+
+
+def iter_prefixed_events(stream: TextIO, chunk_size: int = 65536) -> Iterator[Tuple[str, str, Any]]:
+    # Префикс как в ijson: "departments.item.employees.item.name"
+    path: List[Optional[str]] = []
+    for event, value in JsonEventReader(stream, chunk_size):
+        if event == "map_key":
+            prefix = ".".join(path[:-1])
+            path[-1] = value
+        elif event in ("start_map", "start_array"):
+            prefix = ".".join(path)
+            path.append(None if event == "start_map" else "item")
+        elif event in ("end_map", "end_array"):
+            path.pop()
+            prefix = ".".join(path)
+        else:
+            prefix = ".".join(path)
+        yield prefix, event, value
+
+
+class _Builder:
+    def __init__(self):
+        self.value = None
+        self.__containers: list = []
+        self.__keys: list = []
+
+    def __put(self, value: Any) -> None:
+        if not self.__containers:
+            self.value = value
+        elif isinstance(self.__containers[-1], list):
+            self.__containers[-1].append(value)
+        else:
+            self.__containers[-1][self.__keys[-1]] = value
+
+    def event(self, event: str, value: Any) -> None:
+        if event == "map_key":
+            self.__keys[-1] = value
+        elif event in ("start_map", "start_array"):
+            container = {} if event == "start_map" else []
+            self.__put(container)
+            self.__containers.append(container)
+            self.__keys.append(None)
+        elif event in ("end_map", "end_array"):
+            self.__containers.pop()
+            self.__keys.pop()
+        else:
+            self.__put(value)
+
+
+def iter_items(stream: TextIO, prefix: str, chunk_size: int = 65536) -> Iterator[Any]:
+    # Объекты по префиксу по одному, например iter_items(f, "employees.item")
+    events = iter_prefixed_events(stream, chunk_size)
+    for current, event, value in events:
+        if current != prefix or event in ("map_key", "end_map", "end_array"):
+            continue
+        if event not in ("start_map", "start_array"):
+            yield value
+            continue
+        builder = _Builder()
+        builder.event(event, value)
+        depth = 1
+        for _, event, value in events:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+                if not depth:
+                    break
+        yield builder.value
@@ -133,12 +133,14 @@ class Salesperson(AbstractEmployee):
         return f"Продавец {self.name}: ставка={self.rate:.1%}, продажи={self.sales:.0f}, итого={self.calculate_salary():.2f}"
 
 class EmployeeFactory:
-    @staticmethod
-    def create_employee(emp_type: str, **kwargs) -> AbstractEmployee:
-        types = {"employee": RegularEmployee, "manager": Manager, "developer": Developer, "salesperson": Salesperson}
-        if emp_type.lower() not in types:
+    TYPES = {"employee": RegularEmployee, "manager": Manager, "developer": Developer, "salesperson": Salesperson}
+    
+    @classmethod
+    def create_employee(cls, emp_type: str, **kwargs) -> AbstractEmployee:
+        employee_type = cls.TYPES.get(emp_type.lower())
+        if employee_type is None:
             raise ValueError("Неизвестный тип")
-        return types[emp_type.lower()](**kwargs)
+        return employee_type(**kwargs)
 
 if __name__ == "__main__":
     emp1 = RegularEmployee(1, "Иван", "IT", 5000)
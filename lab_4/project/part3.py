@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
-import json
+from typing import Iterator, List, Optional
+from json_stream import JsonStreamWriter, iter_items
 
 class Employee:
     def __init__(self, emp_id: int, name: str, department: str, base_salary: float):
@@ -78,23 +78,35 @@ class Department:
     def __iter__(self):
         return iter(self.__employees)
     
+    @staticmethod
+    def employee_to_dict(emp: AbstractEmployee) -> dict:
+        return {
+            "type": type(emp).__name__,
+            "id": emp.id,
+            "name": emp.name,
+            "salary": emp.calculate_salary()
+        }
+    
     def to_dict(self) -> dict:
         return {
             "name": self.name,
-            "employees": [
-                {
-                    "type": type(emp).__name__,
-                    "id": emp.id,
-                    "name": emp.name,
-                    "salary": emp.calculate_salary()
-                }
-                for emp in self.__employees
-            ]
+            "employees": [self.employee_to_dict(emp) for emp in self.__employees]
         }
     
-    def save_to_file(self, filename: str) -> None:
+    def save_to_file(self, filename: str, indent: Optional[int] = 2) -> None:
         with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+            writer = JsonStreamWriter(f, indent)
+            with writer.object():
+                writer.field("name", self.name)
+                writer.key("employees")
+                with writer.array():
+                    for emp in self.__employees:
+                        writer.value(self.employee_to_dict(emp))
+    
+    @staticmethod
+    def iter_saved_employees(filename: str) -> Iterator[dict]:
+        with open(filename, encoding='utf-8') as f:
+            yield from iter_items(f, "employees.item")
 
 def make_eq(self, other):
     return self.id == other.id if isinstance(other, AbstractEmployee) else False
@@ -142,4 +154,5 @@ if __name__ == "__main__":
     print("\nСериализация:")
     dept.save_to_file("dept.json")
     print("Сохранено в dept.json")
+    print(f"Прочитано из dept.json: {[e['name'] for e in Department.iter_saved_employees('dept.json')]}")
 
@@ -1,9 +1,19 @@
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 from datetime import datetime
-import json
+from itertools import chain, islice
 import csv
+import time
+from json_stream import JsonStreamWriter, iter_items
+from part2 import EmployeeFactory as BaseEmployeeFactory
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 
 class Employee:
@@ -18,6 +28,8 @@ class Employee:
     @property
     def name(self) -> str: return self.__name
     @property
+    def department(self) -> str: return self.__department
+    @property
     def base_salary(self) -> float: return self.__base_salary
 
 class AbstractEmployee(Employee, ABC):
@@ -28,6 +40,8 @@ class Manager(AbstractEmployee):
     def __init__(self, emp_id: int, name: str, department: str, base_salary: float, bonus: float):
         super().__init__(emp_id, name, department, base_salary)
         self.__bonus = bonus
+    @property
+    def bonus(self) -> float: return self.__bonus
     def calculate_salary(self) -> float: return self.base_salary + self.__bonus
 
 class Developer(AbstractEmployee):
@@ -35,8 +49,26 @@ class Developer(AbstractEmployee):
     def __init__(self, emp_id: int, name: str, department: str, base_salary: float, level: str):
         super().__init__(emp_id, name, department, base_salary)
         self.__level = level
+    @property
+    def level(self) -> str: return self.__level
     def calculate_salary(self) -> float: return self.base_salary * self.SENIORITY[self.__level]
 
+# create_employee() из part2 работает с TYPES класса, здесь - типы part4
+class EmployeeFactory(BaseEmployeeFactory):
+    TYPES = {"manager": Manager, "developer": Developer}
+
+    @classmethod
+    def from_csv_row(cls, row: List[str]) -> AbstractEmployee:
+        emp_id, name, department, _, emp_type, base_salary, param = row
+        kwargs = {"emp_id": int(emp_id), "name": name, "department": department, "base_salary": float(base_salary)}
+        if emp_type == "manager":
+            kwargs["bonus"] = float(param)
+        elif emp_type == "developer":
+            kwargs["level"] = param
+        else:
+            raise ValueError(f"Неизвестный тип в CSV: {emp_type!r}")
+        return cls.create_employee(emp_type, **kwargs)
+
 class Department:
     def __init__(self, name: str):
         self.name = name
@@ -45,9 +77,19 @@ class Department:
     def add_employee(self, employee: AbstractEmployee) -> None:
         self.__employees.append(employee)
     
+    def add_employees(self, employees: Iterable[AbstractEmployee]) -> None:
+        self.__employees.extend(employees)
+    
     def get_employees(self) -> List[AbstractEmployee]:
         return self.__employees[:]
     
+    def iter_employees(self) -> Iterator[AbstractEmployee]:
+        return iter(self.__employees)
+    
+    @property
+    def employee_count(self) -> int:
+        return len(self.__employees)
+    
     def calculate_total_salary(self) -> float:
         return sum(emp.calculate_salary() for emp in self.__employees)
 
@@ -92,6 +134,11 @@ class Project:
         return self.__team[:]
 
 class Company:
+    # Первые четыре колонки - прежний отчет; Тип, Оклад и Параметр (бонус
+    # менеджера или уровень разработчика) пишутся при extended=True
+    # и нужны для import_employees_csv()
+    CSV_HEADER = ['ID', 'Имя', 'Отдел', 'Зарплата', 'Тип', 'Оклад', 'Параметр']
+
     def __init__(self, name: str):
         self.name = name
         self.__departments: List[Department] = []
@@ -103,12 +150,22 @@ class Company:
     def add_project(self, project: Project) -> None:
         self.__projects.append(project)
     
+    def get_departments(self) -> List[Department]:
+        return self.__departments[:]
+    
+    def get_projects(self) -> List[Project]:
+        return self.__projects[:]
+    
     def get_all_employees(self) -> List[AbstractEmployee]:
         employees = []
         for dept in self.__departments:
             employees.extend(dept.get_employees())
         return employees
     
+    def iter_employees(self) -> Iterator[AbstractEmployee]:
+        for dept in self.__departments:
+            yield from dept.iter_employees()
+    
     def find_employee_by_id(self, emp_id: int) -> Optional[AbstractEmployee]:
         for dept in self.__departments:
             for emp in dept.get_employees():
@@ -127,24 +184,94 @@ class Company:
     def get_projects_by_status(self, status: str) -> List[Project]:
         return [p for p in self.__projects if p.status == status]
     
-    def export_employees_csv(self, filename: str) -> None:
-        employees = self.get_all_employees()
-        if employees:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['ID', 'Имя', 'Отдел', 'Зарплата'])
-                for emp in employees:
-                    writer.writerow([emp.id, emp.name, emp.department, emp.calculate_salary()])
-    
-    def save_to_json(self, filename: str) -> None:
-        data = {
-            "name": self.name,
-            "departments": [{"name": d.name, "employee_count": len(d.get_employees())} for d in self.__departments],
-            "projects": [{"id": p.project_id, "name": p.name, "status": p.status} for p in self.__projects],
-            "total_cost": self.calculate_total_monthly_cost()
-        }
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+    @staticmethod
+    def _csv_row(emp: AbstractEmployee) -> list:
+        return [emp.id, emp.name, emp.department, emp.calculate_salary()]
+    
+    @staticmethod
+    def _extended_csv_row(emp: AbstractEmployee) -> list:
+        if isinstance(emp, Manager):
+            emp_type, param = "manager", emp.bonus
+        elif isinstance(emp, Developer):
+            emp_type, param = "developer", emp.level
+        else:
+            raise ValueError(f"Тип {type(emp).__name__} не поддерживается в CSV")
+        return [emp.id, emp.name, emp.department, emp.calculate_salary(), emp_type, emp.base_salary, param]
+    
+    @staticmethod
+    def _throughput(rows: int, start: float) -> dict:
+        seconds = time.perf_counter() - start
+        return {"rows": rows, "seconds": seconds, "rows_per_sec": rows / seconds if seconds else 0.0}
+    
+    # extended=False - прежний отчет из четырех колонок для любых
+    # сотрудников; extended=True - все колонки CSV_HEADER (только
+    # Manager и Developer, иначе ValueError)
+    def export_employees_csv(self, filename: str, extended: bool = False, chunk_size: int = 10000) -> None:
+        employees = self.iter_employees()
+        first = next(employees, None)
+        if first is None:
+            return
+        header = self.CSV_HEADER if extended else self.CSV_HEADER[:4]
+        to_row = self._extended_csv_row if extended else self._csv_row
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            for chunk in chunked(chain([first], employees), chunk_size):
+                writer.writerows([to_row(emp) for emp in chunk])
+    
+    # Читает файл, выгруженный с extended=True. Все строки проверяются
+    # до изменения отделов: ошибка в любой строке не оставляет частичного
+    # импорта
+    def import_employees_csv(self, filename: str, chunk_size: int = 10000) -> dict:
+        start = time.perf_counter()
+        by_department = {}
+        rows = 0
+        with open(filename, newline='', encoding='utf-8', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            if next(reader, None) != self.CSV_HEADER:
+                raise ValueError("Нужен CSV, выгруженный с extended=True")
+            for chunk in chunked(reader, chunk_size):
+                for line, row in enumerate(chunk, start=rows + 2):
+                    try:
+                        emp = EmployeeFactory.from_csv_row(row)
+                    except (TypeError, ValueError) as e:
+                        raise ValueError(f"Строка {line}: {e}") from e
+                    by_department.setdefault(emp.department, []).append(emp)
+                rows += len(chunk)
+        departments = {d.name: d for d in self.__departments}
+        for name, employees in by_department.items():
+            if name not in departments:
+                departments[name] = Department(name)
+                self.add_department(departments[name])
+            departments[name].add_employees(employees)
+        return self._throughput(rows, start)
+    
+    def save_to_json(self, filename: str, indent: Optional[int] = 2, include_employees: bool = False) -> None:
+        with open(filename, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            writer = JsonStreamWriter(f, indent)
+            with writer.object():
+                writer.field("name", self.name)
+                writer.key("departments")
+                with writer.array():
+                    for d in self.__departments:
+                        with writer.object():
+                            writer.field("name", d.name)
+                            writer.field("employee_count", d.employee_count)
+                            if include_employees:
+                                writer.key("employees")
+                                with writer.array():
+                                    for emp in d.iter_employees():
+                                        writer.value({"type": type(emp).__name__, "id": emp.id, "name": emp.name, "salary": emp.calculate_salary()})
+                writer.key("projects")
+                with writer.array():
+                    for p in self.__projects:
+                        writer.value({"id": p.project_id, "name": p.name, "status": p.status})
+                writer.field("total_cost", self.calculate_total_monthly_cost())
+    
+    @staticmethod
+    def iter_saved_employees(filename: str) -> Iterator[dict]:
+        with open(filename, encoding='utf-8') as f:
+            yield from iter_items(f, "departments.item.employees.item")
 
 
 if __name__ == "__main__":
@@ -184,5 +311,10 @@ if __name__ == "__main__":
     
     print("\nЭкспорт:")
     company.export_employees_csv("employees.csv")
+    company.export_employees_csv("employees_full.csv", extended=True)
     company.save_to_json("company.json")
-    print("Сохранено: employees.csv, company.json")
+    print("Сохранено: employees.csv, employees_full.csv, company.json")
+    
+    imported = Company("TechCorp (копия)")
+    stats = imported.import_employees_csv("employees_full.csv")
+    print(f"Импорт CSV: {stats['rows']} строк, {stats['rows_per_sec']:,.0f} строк/с")
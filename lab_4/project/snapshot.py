@@ -0,0 +1,172 @@
+"""Двоичный снимок Company из part4: секции из struct/array, опционально zlib."""
+
+import struct
+import sys
+import zlib
+from array import array
+from typing import Dict, List
+from part4 import Company, Department, Project, Manager, Developer, AbstractEmployee
+
+MAGIC = b"CSNP"
+VERSION = 1
+FLAG_ZLIB = 1
+KIND_MANAGER = 0
+KIND_DEVELOPER = 1
+
+# magic, версия, флаги, количество секций
+_HEADER = struct.Struct("<4sHHI")
+# тег секции, длина данных на диске
+_SECTION = struct.Struct("<4sQ")
+# тип массива, количество элементов
+_ARRAY = struct.Struct("<cQ")
+
+
+class _Strings:
+    def __init__(self):
+        self.ids: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def add(self, value: str) -> int:
+        sid = self.ids.get(value)
+        if sid is None:
+            sid = self.ids[value] = len(self.values)
+            self.values.append(value)
+        return sid
+
+
+def _pack_arrays(*arrays: array) -> bytes:
+    parts = []
+    for arr in arrays:
+        if sys.byteorder != "little" and arr.itemsize > 1:
+            arr = array(arr.typecode, arr)
+            arr.byteswap()
+        parts.append(_ARRAY.pack(arr.typecode.encode(), len(arr)))
+        parts.append(arr.tobytes())
+    return b"".join(parts)
+
+
+def _unpack_arrays(data: bytes) -> List[array]:
+    arrays = []
+    offset = 0
+    while offset < len(data):
+        typecode, count = _ARRAY.unpack_from(data, offset)
+        offset += _ARRAY.size
+        arr = array(typecode.decode())
+        end = offset + count * arr.itemsize
+        arr.frombytes(data[offset:end])
+        if sys.byteorder != "little" and arr.itemsize > 1:
+            arr.byteswap()
+        arrays.append(arr)
+        offset = end
+    return arrays
+
+
+def _pack_strings(values: List[str]) -> bytes:
+    # Длины в символах: таблица декодируется одним вызовом decode()
+    return _pack_arrays(array("I", map(len, values)), array("B", "".join(values).encode("utf-8")))
+
+
+def _unpack_strings(data: bytes) -> List[str]:
+    lengths, blob = _unpack_arrays(data)
+    text = blob.tobytes().decode("utf-8")
+    values = []
+    offset = 0
+    for length in lengths:
+        values.append(text[offset:offset + length])
+        offset += length
+    return values
+
+
+def save_snapshot(company: Company, filename: str, compress: bool = True) -> None:
+    strings = _Strings()
+    records: Dict[int, int] = {}
+    kinds, ids, names, departments = array("B"), array("q"), array("I"), array("I")
+    base_salaries, bonuses, levels = array("d"), array("d"), array("I")
+
+    def record(emp: AbstractEmployee) -> int:
+        index = records.get(emp.id)
+        if index is None:
+            index = records[emp.id] = len(ids)
+            manager = isinstance(emp, Manager)
+            kinds.append(KIND_MANAGER if manager else KIND_DEVELOPER)
+            ids.append(emp.id)
+            names.append(strings.add(emp.name))
+            departments.append(strings.add(emp.department))
+            base_salaries.append(emp.base_salary)
+            bonuses.append(emp.bonus if manager else 0.0)
+            levels.append(0 if manager else strings.add(emp.level))
+        return index
+
+    dept_names, dept_sizes, dept_members = array("I"), array("I"), array("I")
+    for dept in company.get_departments():
+        dept_names.append(strings.add(dept.name))
+        dept_sizes.append(dept.employee_count)
+        dept_members.extend(map(record, dept.iter_employees()))
+
+    proj_ids, proj_fields, team_sizes, team_members = array("q"), array("I"), array("I"), array("I")
+    for proj in company.get_projects():
+        proj_ids.append(proj.project_id)
+        proj_fields.extend(strings.add(v) for v in (proj.name, proj.description, proj.deadline, proj.status))
+        team = proj.get_team()
+        team_sizes.append(len(team))
+        team_members.extend(map(record, team))
+
+    company_name = array("I", [strings.add(company.name)])
+    sections = [
+        (b"STRS", _pack_strings(strings.values)),
+        (b"META", _pack_arrays(company_name)),
+        (b"EMPS", _pack_arrays(kinds, ids, names, departments, base_salaries, bonuses, levels)),
+        (b"DEPT", _pack_arrays(dept_names, dept_sizes, dept_members)),
+        (b"PROJ", _pack_arrays(proj_ids, proj_fields, team_sizes, team_members)),
+    ]
+    with open(filename, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, FLAG_ZLIB if compress else 0, len(sections)))
+        for tag, payload in sections:
+            if compress:
+                payload = zlib.compress(payload, 1)
+            f.write(_SECTION.pack(tag, len(payload)))
+            f.write(payload)
+
+
+def load_snapshot(filename: str) -> Company:
+    with open(filename, "rb") as f:
+        magic, version, flags, count = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != MAGIC:
+            raise ValueError("Файл не является снимком компании")
+        if version != VERSION:
+            raise ValueError(f"Неподдерживаемая версия снимка: {version}")
+        sections = {}
+        for _ in range(count):
+            tag, length = _SECTION.unpack(f.read(_SECTION.size))
+            payload = f.read(length)
+            sections[tag] = zlib.decompress(payload) if flags & FLAG_ZLIB else payload
+
+    strings = _unpack_strings(sections[b"STRS"])
+    (company_name,) = _unpack_arrays(sections[b"META"])
+    kinds, ids, names, departments, base_salaries, bonuses, levels = _unpack_arrays(sections[b"EMPS"])
+    employees = [
+        Manager(emp_id, strings[name], strings[dept], base, bonus) if kind == KIND_MANAGER
+        else Developer(emp_id, strings[name], strings[dept], base, strings[level])
+        for kind, emp_id, name, dept, base, bonus, level
+        in zip(kinds, ids, names, departments, base_salaries, bonuses, levels)
+    ]
+
+    company = Company(strings[company_name[0]])
+    dept_names, dept_sizes, dept_members = _unpack_arrays(sections[b"DEPT"])
+    offset = 0
+    for name, size in zip(dept_names, dept_sizes):
+        dept = Department(strings[name])
+        dept.add_employees([employees[i] for i in dept_members[offset:offset + size]])
+        company.add_department(dept)
+        offset += size
+
+    proj_ids, proj_fields, team_sizes, team_members = _unpack_arrays(sections[b"PROJ"])
+    offset = 0
+    for i, (proj_id, size) in enumerate(zip(proj_ids, team_sizes)):
+        name, description, deadline, status = (strings[sid] for sid in proj_fields[4 * i:4 * i + 4])
+        proj = Project(proj_id, name, description, deadline, status)
+        for member in team_members[offset:offset + size]:
+            proj.add_team_member(employees[member])
+        company.add_project(proj)
+        offset += size
+    return company
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Tuple
 import sqlite3
 
 # ==================== БАЗОВЫЕ КЛАССЫ ====================
@@ -200,34 +200,47 @@ class EmployeeBuilder:
 # ==================== ПАТТЕРН 4: DECORATOR ====================
 
 class SalaryDecorator(ABC):
-    """Абстрактный декоратор для зарплаты"""
+    """Абстрактный декоратор для зарплаты: слой salary * scale + offset"""
     
-    def __init__(self, employee: AbstractEmployee):
+    def __init__(self, employee: AbstractEmployee, scale: float = 1.0, offset: float = 0.0):
         self._employee = employee
+        self._scale = scale
+        self._offset = offset
+        self.__transform = None
+    
+    def compile(self) -> Tuple[AbstractEmployee, float, float]:
+        # Стек слоев сворачивается в одно преобразование base * a + b;
+        # слои неизменяемы, поэтому свертка выполняется один раз
+        if self.__transform is None:
+            layer, scale, offset = self, 1.0, 0.0
+            while isinstance(layer, SalaryDecorator) and type(layer).calculate_salary is SalaryDecorator.calculate_salary:
+                offset += layer._offset * scale
+                scale *= layer._scale
+                layer = layer._employee
+            self.__transform = (layer, scale, offset)
+        return self.__transform
     
-    @abstractmethod
     def calculate_salary(self) -> float:
-        pass
+        base, scale, offset = self.compile()
+        if base is self:
+            # Наследник переопределил calculate_salary() и вызвал super():
+            # свертка остановилась на нем, применяем только его слой
+            return self._employee.calculate_salary() * self._scale + self._offset
+        return base.calculate_salary() * scale + offset
 
 class BonusDecorator(SalaryDecorator):
     """Decorator - добавляет фиксированный бонус"""
     
     def __init__(self, employee: AbstractEmployee, bonus_amount: float):
-        super().__init__(employee)
+        super().__init__(employee, offset=bonus_amount)
         self.__bonus_amount = bonus_amount
-    
-    def calculate_salary(self) -> float:
-        return self._employee.calculate_salary() + self.__bonus_amount
 
 class TrainingDecorator(SalaryDecorator):
     """Decorator - добавляет процент за обучение"""
     
     def __init__(self, employee: AbstractEmployee, training_bonus: float):
-        super().__init__(employee)
+        super().__init__(employee, scale=1 + training_bonus)
         self.__training_bonus = training_bonus
-    
-    def calculate_salary(self) -> float:
-        return self._employee.calculate_salary() * (1 + self.__training_bonus)
 
 # ==================== ПАТТЕРН 5: STRATEGY ====================
 
@@ -108,7 +108,9 @@ squares_gen = (x*x for x in numbers)
 # 5. ДЕКОРАТОРЫ
 
 
+import threading
 import time
+from collections import OrderedDict
 from functools import wraps
 
 def timer(func):
@@ -145,18 +147,77 @@ def expensive_operation(x):
     time.sleep(0.5)
     return x * x
 
-# Кэширующий декоратор
-def cache(func):
-    cached_results = {}
-    @wraps(func)
-    def wrapper(*args):
-        if args in cached_results:
-            print(f"Из кэша: {args}")
-            return cached_results[args]
-        result = func(*args)
-        cached_results[args] = result
-        return result
-    return wrapper
+# Кэширующий декоратор: LRU с ограничением размера и времени жизни,
+# ключ учитывает именованные аргументы, словарь защищен блокировкой.
+# Одновременные промахи по одному ключу выполняют функцию один раз:
+# первый поток считает, остальные ждут его результат или исключение
+def cache(func=None, *, maxsize=128, ttl=None):
+    def decorator(func):
+        cached_results = OrderedDict()
+        pending = {}
+        stats = {"hits": 0, "misses": 0, "evictions": 0}
+        # Номер очистки: результат, начатый до cache_clear(), не сохраняется
+        generation = [0]
+        lock = threading.Lock()
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            now = time.monotonic()
+            with lock:
+                entry = cached_results.get(key)
+                if entry is not None and (ttl is None or now - entry[1] < ttl):
+                    cached_results.move_to_end(key)
+                    stats["hits"] += 1
+                    return entry[0]
+                stats["misses"] += 1
+                started = generation[0]
+                flight = pending.get(key)
+                leader = flight is None
+                if leader:
+                    flight = pending[key] = {
+                        "done": threading.Event(),
+                        "owner": threading.get_ident(),
+                        "result": None,
+                        "error": None,
+                    }
+            if not leader:
+                if flight["owner"] == threading.get_ident():
+                    # Рекурсивный вызов с теми же аргументами
+                    return func(*args, **kwargs)
+                flight["done"].wait()
+                if flight["error"] is not None:
+                    raise flight["error"]
+                return flight["result"]
+            try:
+                flight["result"] = func(*args, **kwargs)
+            except BaseException as error:
+                flight["error"] = error
+                raise
+            finally:
+                with lock:
+                    if pending.get(key) is flight:
+                        del pending[key]
+                    if flight["error"] is None and generation[0] == started:
+                        # Срок жизни отсчитывается от готовности результата
+                        cached_results[key] = (flight["result"], time.monotonic())
+                        cached_results.move_to_end(key)
+                        if len(cached_results) > maxsize:
+                            cached_results.popitem(last=False)
+                            stats["evictions"] += 1
+                flight["done"].set()
+            return flight["result"]
+        def cache_info():
+            with lock:
+                return dict(stats, size=len(cached_results))
+        def cache_clear():
+            with lock:
+                cached_results.clear()
+                pending.clear()
+                generation[0] += 1
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator(func) if func is not None else decorator
 
 @cache
 def fibonacci(n):
@@ -246,6 +307,7 @@ def main():
     print("\n6. КЭШИРОВАНИЕ:")
     print(f"  fibonacci(10) = {fibonacci(10)}")
     print(f"  fibonacci(10) = {fibonacci(10)}")  # Из кэша
+    print(f"  fibonacci.cache_info() = {fibonacci.cache_info()}")
 
     print("\n7. ПРАКТИЧЕСКИЕ ЗАДАНИЯ:")
     analysis = analyze_students(students)
@@ -0,0 +1,147 @@
+"""Инкрементально поддерживаемые агрегаты зарплат."""
+
+import heapq
+import math
+from typing import Dict, List, Optional
+
+
+class SalaryAggregate:
+    """Сумма, количество, минимум и максимум набора зарплат.
+
+    Значения хранятся как мультимножество. Минимум и максимум берутся
+    из куч с ленивым удалением, поэтому чтение любого агрегата -
+    амортизированное O(1), а изменение - O(log n).
+
+    Сумма хранится без накопления погрешности: целые складываются
+    точно, дробные - в неперекрывающихся частичных суммах (как в
+    ``math.fsum``), поэтому после любых добавлений и удалений ``total``
+    равен правильно округленной сумме текущих значений.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустого агрегата."""
+        self.count = 0
+        self._int_total = 0
+        self._partials: List[float] = []
+        self._values: Dict[float, int] = {}
+        self._min_heap: List[float] = []
+        self._max_heap: List[float] = []
+
+    def add(self, value: float) -> None:
+        """Добавить значение.
+
+        Args:
+            value: Зарплата
+        """
+        self._add_to_total(value)
+        self.count += 1
+        if value in self._values:
+            self._values[value] += 1
+            return
+        self._values[value] = 1
+        heapq.heappush(self._min_heap, value)
+        heapq.heappush(self._max_heap, -value)
+        if len(self._min_heap) > 2 * len(self._values) + 16:
+            self._rebuild_heaps()
+
+    def remove(self, value: float) -> None:
+        """Удалить значение.
+
+        Args:
+            value: Зарплата
+
+        Raises:
+            KeyError: Если значения нет в агрегате
+        """
+        left = self._values[value] - 1
+        if left:
+            self._values[value] = left
+        else:
+            del self._values[value]
+        self.count -= 1
+        self._add_to_total(-value)
+
+    def replace(self, old: float, new: float) -> None:
+        """Заменить одно значение другим.
+
+        Args:
+            old: Прежняя зарплата
+            new: Новая зарплата
+        """
+        if old != new:
+            self.remove(old)
+            self.add(new)
+
+    def _add_to_total(self, value: float) -> None:
+        """Точно прибавить значение к сумме.
+
+        Args:
+            value: Слагаемое (со знаком)
+        """
+        if isinstance(value, int):
+            self._int_total += value
+            return
+        # Частичные суммы Шевчука: hi + lo == x + y точно
+        partials = self._partials
+        i = 0
+        for partial in partials:
+            if abs(value) < abs(partial):
+                value, partial = partial, value
+            hi = value + partial
+            lo = partial - (hi - value)
+            if lo:
+                partials[i] = lo
+                i += 1
+            value = hi
+        partials[i:] = [value] if value else []
+
+    @property
+    def total(self) -> float:
+        """Сумма значений."""
+        if not self._partials:
+            return self._int_total
+        return math.fsum([self._int_total, *self._partials])
+
+    @property
+    def average(self) -> float:
+        """Среднее значение или 0."""
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    @property
+    def minimum(self) -> Optional[float]:
+        """Минимальное значение или None."""
+        heap = self._min_heap
+        while heap and heap[0] not in self._values:
+            heapq.heappop(heap)
+        return heap[0] if heap else None
+
+    @property
+    def maximum(self) -> Optional[float]:
+        """Максимальное значение или None."""
+        heap = self._max_heap
+        while heap and -heap[0] not in self._values:
+            heapq.heappop(heap)
+        return -heap[0] if heap else None
+
+    def _rebuild_heaps(self) -> None:
+        """Пересобрать кучи без удаленных значений."""
+        self._min_heap = list(self._values)
+        self._max_heap = [-value for value in self._values]
+        heapq.heapify(self._min_heap)
+        heapq.heapify(self._max_heap)
+
+    def as_dict(self) -> dict:
+        """Все агрегаты одним словарем.
+
+        Returns:
+            Словарь с ключами total, count, average, min, max
+        """
+        return {
+            "total": self.total,
+            "count": self.count,
+            "average": self.average,
+            "min": self.minimum,
+            "max": self.maximum,
+        }
@@ -0,0 +1,221 @@
+"""Асинхронный интерфейс хранилищ сотрудников и пакетная загрузка."""
+
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from repositories import EmployeeRepository
+
+
+class AsyncEmployeeRepository(ABC):
+    """Асинхронный интерфейс хранилища сотрудников.
+
+    Операции работают с пакетами: один вызов get_many() или
+    save_many() обслуживает любое количество сотрудников.
+    """
+
+    @abstractmethod
+    async def get_many(self, emp_ids: Iterable[int]) -> List[Optional[Any]]:
+        """Получить сотрудников по списку ID.
+
+        Args:
+            emp_ids: ID сотрудников
+
+        Returns:
+            Сотрудники в порядке ID (None для ненайденных)
+        """
+
+    @abstractmethod
+    async def save_many(self, employees: Iterable[Any]) -> None:
+        """Сохранить нескольких сотрудников.
+
+        Args:
+            employees: Объекты сотрудников
+        """
+
+    @abstractmethod
+    def iterate(self) -> AsyncIterator[Any]:
+        """Асинхронный итератор по всем сотрудникам."""
+
+    async def get(self, emp_id: int) -> Optional[Any]:
+        """Получить одного сотрудника.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Сотрудник или None
+        """
+        (employee,) = await self.get_many([emp_id])
+        return employee
+
+
+class ExecutorEmployeeRepository(AsyncEmployeeRepository):
+    """Асинхронная обертка над синхронным хранилищем.
+
+    Блокирующий ввод-вывод файлового и SQLite хранилищ выполняется в
+    пуле потоков, цикл событий не блокируется. Пакет сотрудников
+    обрабатывается одним вызовом в пуле. Обращения к хранилищу
+    выполняются по одному, поэтому подходят и хранилища без
+    собственной синхронизации.
+    """
+
+    def __init__(
+        self,
+        repository: EmployeeRepository,
+        executor: Optional[Executor] = None,
+        page_size: int = 1000,
+    ):
+        """Инициализация обертки.
+
+        Args:
+            repository: Синхронное хранилище
+            executor: Пул для блокирующих вызовов (None - пул цикла событий)
+            page_size: Количество сотрудников в одной порции iterate()
+
+        Raises:
+            ValueError: Если page_size не положителен
+        """
+        if page_size <= 0:
+            raise ValueError("Размер порции должен быть положительным")
+        self.repository = repository
+        self.executor = executor
+        self.page_size = page_size
+        self._lock = threading.Lock()
+
+    def _call(self, method, *args):
+        """Вызов метода хранилища под блокировкой (выполняется в пуле)."""
+        with self._lock:
+            return method(*args)
+
+    async def _run(self, method, *args):
+        """Выполнить метод хранилища в пуле потоков."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._call, method, *args)
+
+    async def get_many(self, emp_ids: Iterable[int]) -> List[Optional[Any]]:
+        """Получить сотрудников одним вызовом в пуле."""
+        return await self._run(self.repository.get_employees, list(emp_ids))
+
+    async def save_many(self, employees: Iterable[Any]) -> None:
+        """Сохранить сотрудников одним вызовом в пуле."""
+        await self._run(self.repository.save_employees, list(employees))
+
+    async def iterate(self) -> AsyncIterator[Any]:
+        """Сотрудники порциями по page_size.
+
+        Список ID и каждая порция читаются отдельными вызовами в пуле,
+        между вызовами хранилище не держит ни курсоров, ни блокировок.
+        Сотрудники, удаленные во время перебора, пропускаются.
+        """
+        emp_ids = await self._run(self.repository.get_employee_ids)
+        for start in range(0, len(emp_ids), self.page_size):
+            page = await self._run(
+                self.repository.get_employees, emp_ids[start : start + self.page_size]
+            )
+            for employee in page:
+                if employee is not None:
+                    yield employee
+
+
+class EmployeeLoader:
+    """Объединение одиночных запросов сотрудников в пакеты.
+
+    Все вызовы load(), сделанные за один шаг цикла событий, выполняются
+    одним вызовом ``get_many`` хранилища. Повторные запросы того же ID
+    получают уже загруженный результат, если включен кэш.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncEmployeeRepository,
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+    ):
+        """Инициализация загрузчика.
+
+        Args:
+            repository: Асинхронное хранилище
+            max_batch_size: Максимум ID в одном запросе (None - без ограничения)
+            cache: Запоминать результаты загрузки
+
+        Raises:
+            ValueError: Если max_batch_size не положителен
+        """
+        if max_batch_size is not None and max_batch_size <= 0:
+            raise ValueError("Размер пакета должен быть положительным")
+        self.repository = repository
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self._futures: Dict[int, asyncio.Future] = {}
+        self._queue: List[Tuple[int, asyncio.Future]] = []
+
+    def load(self, emp_id: int) -> "asyncio.Future[Optional[Any]]":
+        """Запросить сотрудника.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Future с сотрудником или None
+        """
+        if self.cache and emp_id in self._futures:
+            return self._futures[emp_id]
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self.cache:
+            self._futures[emp_id] = future
+        if not self._queue:
+            # Пакет отправляется после остальных запросов этого шага цикла
+            loop.call_soon(self._dispatch)
+        self._queue.append((emp_id, future))
+        return future
+
+    async def load_many(self, emp_ids: Iterable[int]) -> List[Optional[Any]]:
+        """Запросить нескольких сотрудников.
+
+        Args:
+            emp_ids: ID сотрудников
+
+        Returns:
+            Сотрудники в порядке ID (None для ненайденных)
+        """
+        return list(await asyncio.gather(*(self.load(emp_id) for emp_id in emp_ids)))
+
+    def clear(self, emp_id: Optional[int] = None) -> None:
+        """Забыть загруженный результат.
+
+        Args:
+            emp_id: ID сотрудника (None - очистить весь кэш)
+        """
+        if emp_id is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(emp_id, None)
+
+    def _dispatch(self) -> None:
+        """Отправить накопленные запросы пакетами."""
+        queue, self._queue = self._queue, []
+        size = self.max_batch_size or len(queue)
+        for start in range(0, len(queue), size):
+            asyncio.ensure_future(self._fetch(queue[start : start + size]))
+
+    async def _fetch(self, batch: List[Tuple[int, asyncio.Future]]) -> None:
+        """Загрузить пакет и передать результаты ожидающим."""
+        emp_ids = list(dict.fromkeys(emp_id for emp_id, _ in batch))
+        try:
+            employees = await self.repository.get_many(emp_ids)
+        except Exception as error:
+            for emp_id, future in batch:
+                # Ошибка не кэшируется: следующий load() повторит запрос
+                if self._futures.get(emp_id) is future:
+                    del self._futures[emp_id]
+                if not future.done():
+                    future.set_exception(error)
+            return
+        found = dict(zip(emp_ids, employees))
+        for emp_id, future in batch:
+            if not future.done():
+                future.set_result(found[emp_id])
@@ -0,0 +1,84 @@
+"""Создание сотрудников через EmployeeBuilder и EmployeeFactory.
+
+Запуск из каталога lab-testing:
+    python benchmarks/bench_bulk_hire.py [строк]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from patterns import EmployeeBuilder, EmployeeFactory  # noqa: E402
+
+
+def make_rows(count: int) -> list:
+    """Строки выгрузки с сотрудниками четырех типов.
+
+    Args:
+        count: Количество строк
+
+    Returns:
+        Список словарей
+    """
+    rows = []
+    for i in range(1, count + 1):
+        row = {"id": i, "name": f"E{i}", "department": "IT", "base_salary": 1000 + i}
+        kind = i % 4
+        if kind == 1:
+            row.update(type="manager", bonus=500)
+        elif kind == 2:
+            row.update(type="developer", skills=["Python"], level="middle")
+        elif kind == 3:
+            row.update(type="salesperson", commission=0.1, sales=1000)
+        else:
+            row["type"] = "employee"
+        rows.append(row)
+    return rows
+
+
+def with_builder(rows: list) -> list:
+    """Создание через цепочку сеттеров EmployeeBuilder."""
+    staff = []
+    for row in rows:
+        builder = (
+            EmployeeBuilder()
+            .set_id(row["id"])
+            .set_name(row["name"])
+            .set_department(row["department"])
+            .set_base_salary(row["base_salary"])
+        )
+        if "bonus" in row:
+            builder.set_bonus(row["bonus"])
+        if "level" in row:
+            builder.set_skills(row["skills"]).set_level(row["level"])
+        if "commission" in row:
+            builder.set_commission(row["commission"]).set_sales(row["sales"])
+        staff.append(builder.build())
+    return staff
+
+
+def main() -> None:
+    """Запуск замера."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rows = make_rows(count)
+    print(f"Строк: {count}")
+    for label, build in (
+        ("EmployeeBuilder", with_builder),
+        ("create_many", lambda r: list(EmployeeFactory.create_many(r))),
+        ("create_many, compact", lambda r: list(EmployeeFactory.create_many(r, True))),
+    ):
+        # Лучший из трех запусков: первый прогон и сборка мусора
+        # сильно искажают единичный замер
+        times = []
+        for _ in range(3):
+            start = time.perf_counter()
+            build(rows)
+            times.append(time.perf_counter() - start)
+        rate = count / min(times)
+        print(f"{label:<22}{rate:12,.0f} строк/с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Чтение из SQLite напрямую и через кэширующую обертку.
+
+Запуск из каталога lab-testing:
+    python benchmarks/bench_cache.py [запросов]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from employee import Employee  # noqa: E402
+from repositories import (  # noqa: E402
+    CachingEmployeeRepository,
+    EmployeeRepository,
+    SqliteEmployeeRepository,
+)
+
+
+def run(repo: EmployeeRepository, ids: list) -> float:
+    """Выполнить чтения по списку ID.
+
+    Args:
+        repo: Хранилище
+        ids: ID для чтения
+
+    Returns:
+        Чтений в секунду
+    """
+    start = time.perf_counter()
+    for emp_id in ids:
+        repo.get_employee(emp_id)
+    return len(ids) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Запуск замера."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(1)
+    # 80% запросов к 20% сотрудников
+    hot = [rng.randint(1, 2_000) for _ in range(count * 4 // 5)]
+    ids = hot + [rng.randint(1, 10_000) for _ in range(count - len(hot))]
+    rng.shuffle(ids)
+    print(f"Запросов: {count}")
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SqliteEmployeeRepository(os.path.join(directory, "bench.db"))
+        backend.save_employees(
+            Employee(i, f"E{i}", "IT", 1000 + i) for i in range(1, 10_001)
+        )
+        print(f"SQLite:            {run(backend, ids):12,.0f} чт/с")
+        for maxsize in (1_000, 4_000):
+            cached = CachingEmployeeRepository(backend, maxsize=maxsize)
+            ops = run(cached, ids)
+            print(
+                f"Кэш {maxsize:>5}:        {ops:12,.0f} чт/с, "
+                f"попаданий {cached.stats.hit_ratio:.0%}"
+            )
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Замер памяти на одного сотрудника: исходные, текущие и компактные классы.
+
+Исходные классы - копия раскладки первоначального ``employee.py``:
+поля в ``__dict__`` и свой объект стратегии у каждого сотрудника.
+Текущие Employee/Manager/... уже хранят основные поля в ``__slots__``
+и делят стратегии, поэтому сравнение только с ними занижает экономию.
+
+Компактные классы наследуют BaseEmployee, а не Manager, Developer
+и Salesperson: ``isinstance(CompactManager(...), Manager)`` ложно.
+
+Запуск из каталога lab-testing:
+    python benchmarks/bench_memory.py [количество]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compact import (  # noqa: E402
+    CompactEmployee,
+    CompactManager,
+    CompactDeveloper,
+    CompactSalesperson,
+)
+from employee import Employee, Manager, Developer, Salesperson  # noqa: E402
+from strategies import (  # noqa: E402
+    BaseSalaryStrategy,
+    DeveloperSalaryStrategy,
+    ManagerSalaryStrategy,
+    SalespersonSalaryStrategy,
+)
+
+SKILLS = ["Python", "Java", "SQL", "Docker", "Go"]
+LEVELS = ["junior", "middle", "senior"]
+
+
+class BaselineEmployee:
+    """Сотрудник в раскладке исходного employee.py."""
+
+    def __init__(self, emp_id, name, department, base_salary, salary_strategy=None):
+        self.id = emp_id
+        self.name = name
+        self.department = department
+        self.base_salary = base_salary
+        self.salary_strategy = salary_strategy or BaseSalaryStrategy()
+
+
+class BaselineManager(BaselineEmployee):
+    """Менеджер в раскладке исходного employee.py."""
+
+    def __init__(self, emp_id, name, department, base_salary, bonus):
+        super().__init__(emp_id, name, department, base_salary, ManagerSalaryStrategy())
+        self.bonus = bonus
+
+
+class BaselineDeveloper(BaselineEmployee):
+    """Разработчик в раскладке исходного employee.py."""
+
+    def __init__(self, emp_id, name, department, base_salary, skills, level):
+        super().__init__(
+            emp_id, name, department, base_salary, DeveloperSalaryStrategy()
+        )
+        self.skills = skills
+        self.level = level
+
+
+class BaselineSalesperson(BaselineEmployee):
+    """Продавец в раскладке исходного employee.py."""
+
+    def __init__(self, emp_id, name, department, base_salary, commission, sales):
+        super().__init__(
+            emp_id, name, department, base_salary, SalespersonSalaryStrategy()
+        )
+        self.commission = commission
+        self.sales = sales
+
+
+def build(count: int, employee, manager, developer, salesperson) -> list:
+    """Построить смешанный список сотрудников.
+
+    Args:
+        count: Количество сотрудников
+        employee, manager, developer, salesperson: Классы сотрудников
+
+    Returns:
+        Список сотрудников
+    """
+    staff = []
+    for i in range(1, count + 1):
+        kind = i % 4
+        name = f"Employee {i}"
+        if kind == 0:
+            staff.append(employee(i, name, "IT", 5000))
+        elif kind == 1:
+            staff.append(manager(i, name, "MAN", 7000, 2000))
+        elif kind == 2:
+            skills = [SKILLS[i % 5], SKILLS[(i + 2) % 5]]
+            staff.append(developer(i, name, "DEV", 6000, skills, LEVELS[i % 3]))
+        else:
+            staff.append(salesperson(i, name, "SAL", 4000, 0.15, 50000))
+    return staff
+
+
+def measure(count: int, *classes) -> float:
+    """Память в байтах на одного сотрудника.
+
+    Args:
+        count: Количество сотрудников
+        classes: Классы сотрудников для build()
+
+    Returns:
+        Среднее число байт на сотрудника
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    staff = build(count, *classes)
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(staff) == count
+    return (after - before) / count
+
+
+def main() -> None:
+    """Запуск замера."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    baseline = measure(
+        count, BaselineEmployee, BaselineManager, BaselineDeveloper, BaselineSalesperson
+    )
+    regular = measure(count, Employee, Manager, Developer, Salesperson)
+    compact = measure(
+        count, CompactEmployee, CompactManager, CompactDeveloper, CompactSalesperson
+    )
+    print(f"Сотрудников: {count}")
+    print(f"Исходные классы:   {baseline:8.1f} байт/сотр.")
+    print(f"Текущие классы:    {regular:8.1f} байт/сотр.")
+    print(f"Компактные классы: {compact:8.1f} байт/сотр.")
+    print(f"Экономия текущих к исходным:    {1 - regular / baseline:8.1%}")
+    print(f"Экономия компактных к исходным: {1 - compact / baseline:8.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Сравнение последовательного и параллельного расчета зарплат.
+
+Запуск из каталога lab-testing:
+    python benchmarks/bench_parallel_payroll.py [сотрудников] [отделов]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from compact import CompactManager, CompactDeveloper, CompactSalesperson  # noqa: E402
+from company import Company  # noqa: E402
+from department import Department  # noqa: E402
+from parallel_payroll import ParallelPayrollRunner  # noqa: E402
+
+LEVELS = ["junior", "middle", "senior"]
+
+
+def build_company(count: int, departments: int) -> Company:
+    """Построить компанию с заданным числом сотрудников и отделов.
+
+    Args:
+        count: Количество сотрудников
+        departments: Количество отделов
+
+    Returns:
+        Заполненная компания
+    """
+    company = Company("Bench")
+    depts = [Department(f"Dept {i}") for i in range(departments)]
+    for i in range(1, count + 1):
+        dept = depts[i % departments]
+        kind = i % 3
+        if kind == 0:
+            emp = CompactManager(i, f"E{i}", dept.name, 7000, 2000)
+        elif kind == 1:
+            emp = CompactDeveloper(i, f"E{i}", dept.name, 6000, [], LEVELS[i % 3])
+        else:
+            emp = CompactSalesperson(i, f"E{i}", dept.name, 4000, 0.1, 30000)
+        dept.add_employee(emp)
+    for dept in depts:
+        company.add_department(dept)
+    return company
+
+
+def timed(func, *args):
+    """Выполнить функцию и вернуть (результат, секунды)."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    """Запуск замера."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    departments = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    company = build_company(count, departments)
+
+    serial, serial_time = timed(ParallelPayrollRunner().run_serial, company)
+    print(f"Сотрудников: {count}, отделов: {departments}")
+    print(f"Последовательно:     {serial_time:7.3f} с, итог {serial.total:,.0f}")
+    for workers in sorted({2, 4, os.cpu_count() or 1}):
+        runner = ParallelPayrollRunner(workers=workers, chunk_size=50_000)
+        result, seconds = timed(runner.run, company)
+        assert abs(result.total - serial.total) <= 1e-6 * serial.total
+        print(f"Процессов {workers:>2}:        {seconds:7.3f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Сортировка по зарплате и запись полей с кэшем зарплаты.
+
+Запуск из каталога lab-testing:
+    python benchmarks/bench_salary_cache.py [количество]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from employee import Manager  # noqa: E402
+
+
+def best_of(func, repeat: int = 3) -> float:
+    """Лучшее время из нескольких запусков.
+
+    Args:
+        func: Замеряемая функция без аргументов
+        repeat: Количество запусков
+
+    Returns:
+        Время в секундах
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Запуск замера."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    rng = random.Random(1)
+    staff = [
+        Manager(i, f"M{i}", "MAN", rng.randint(3000, 9000), rng.randint(0, 3000))
+        for i in range(1, count + 1)
+    ]
+
+    def write_fields():
+        for emp in staff:
+            emp.bonus = 1000
+            emp.name = "X"
+
+    print(f"Менеджеров: {count}")
+    print(f"sorted():          {best_of(lambda: sorted(staff)):.3f} с")
+    print(f"запись 2 полей:    {best_of(write_fields):.3f} с")
+    print(f"sorted() повторно: {best_of(lambda: sorted(staff)):.3f} с")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Пропускная способность хранилища в памяти с журналом и без.
+
+Запуск из каталога lab-testing:
+    python benchmarks/bench_wal.py [операций]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from employee import Employee  # noqa: E402
+from patterns import InMemoryEmployeeRepository  # noqa: E402
+from wal import WriteAheadLog  # noqa: E402
+
+
+def run(repo: InMemoryEmployeeRepository, count: int) -> float:
+    """Выполнить count операций (добавление и каждое пятое удаление).
+
+    Args:
+        repo: Хранилище
+        count: Количество добавлений
+
+    Returns:
+        Операций в секунду
+    """
+    employees = [Employee(i, f"E{i}", "IT", 1000 + i) for i in range(1, count + 1)]
+    start = time.perf_counter()
+    operations = 0
+    for employee in employees:
+        repo.add(employee)
+        operations += 1
+        if employee.id % 5 == 0:
+            repo.remove(employee.id - 1)
+            operations += 1
+    repo.close()
+    return operations / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Запуск замера."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Операций добавления: {count}")
+    ops = run(InMemoryEmployeeRepository(), count)
+    print(f"В памяти:               {ops:12,.0f} оп/с")
+    with tempfile.TemporaryDirectory() as directory:
+        for group_size in (1, 64, 1024):
+            path = os.path.join(directory, f"bench_{group_size}.wal")
+            wal = WriteAheadLog(path, group_size=group_size, checkpoint_every=50_000)
+            ops = run(InMemoryEmployeeRepository(wal=wal), count)
+            print(f"WAL, группа {group_size:>5}:      {ops:12,.0f} оп/с")
+        start = time.perf_counter()
+        InMemoryEmployeeRepository(wal=WriteAheadLog(path))
+        print(f"Восстановление:         {time.perf_counter() - start:12.3f} с")
+
+
+if __name__ == "__main__":
+    main()
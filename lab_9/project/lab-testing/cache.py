@@ -0,0 +1,338 @@
+"""Потокобезопасный LRU-кэш с ограничением времени жизни записей.
+
+Модуль также содержит декораторы мемоизации ``memoize`` и
+``async_memoize`` поверх этого кэша.
+"""
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class CacheStats:
+    """Счетчики работы кэша."""
+
+    __slots__ = (
+        "hits",
+        "misses",
+        "evictions",
+        "expirations",
+        "loads",
+        "load_time",
+        "max_load_time",
+    )
+
+    def __init__(self):
+        """Инициализация нулевых счетчиков."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Обнулить счетчики."""
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.loads = 0
+        self.load_time = 0.0
+        self.max_load_time = 0.0
+
+    def record_load(self, seconds: float) -> None:
+        """Учесть одну загрузку из источника.
+
+        Args:
+            seconds: Длительность загрузки
+        """
+        self.loads += 1
+        self.load_time += seconds
+        if seconds > self.max_load_time:
+            self.max_load_time = seconds
+
+    @property
+    def hit_ratio(self) -> float:
+        """Доля попаданий среди всех обращений (0, если обращений не было)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @property
+    def average_load_time(self) -> float:
+        """Средняя длительность загрузки из источника в секундах."""
+        return self.load_time / self.loads if self.loads else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Счетчики в виде словаря.
+
+        Returns:
+            Словарь со счетчиками, долей попаданий и средней задержкой
+        """
+        stats = {name: getattr(self, name) for name in self.__slots__}
+        stats["hit_ratio"] = self.hit_ratio
+        stats["average_load_time"] = self.average_load_time
+        return stats
+
+
+class LRUCache:
+    """Кэш ограниченного размера с вытеснением давно неиспользуемых записей.
+
+    Записи старше ``ttl`` секунд считаются отсутствующими. Все операции
+    выполняются под одной блокировкой и занимают O(1).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Инициализация пустого кэша.
+
+        Args:
+            maxsize: Максимальное количество записей
+            ttl: Время жизни записи в секундах (None - без ограничения)
+            clock: Источник времени
+
+        Raises:
+            ValueError: Если maxsize или ttl не положительны
+        """
+        if maxsize <= 0:
+            raise ValueError("Размер кэша должен быть положительным")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Время жизни записи должно быть положительным")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        # ключ -> (значение, момент устаревания)
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Получить значение и отметить его как недавно использованное.
+
+        Args:
+            key: Ключ
+            default: Результат при отсутствии ключа
+
+        Returns:
+            Значение или default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > self.clock():
+                    self._data.move_to_end(key)
+                    self.stats.hits += 1
+                    return value
+                del self._data[key]
+                self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Сохранить значение, вытеснив самую старую запись при переполнении.
+
+        Args:
+            key: Ключ
+            value: Значение
+        """
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.stats.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Удалить запись.
+
+        Args:
+            key: Ключ
+
+        Returns:
+            True если запись была в кэше
+        """
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Удалить все записи."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        """Количество записей (включая еще не удаленные устаревшие)."""
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Есть ли неустаревшая запись (без обновления порядка и счетчиков)."""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and (entry[1] is None or entry[1] > self.clock())
+
+
+class PendingLoad:
+    """Загрузка одного ключа, результат которой ждут параллельные запросы."""
+
+    __slots__ = ("done", "owner", "result", "error")
+
+    def __init__(self):
+        """Инициализация незавершенной загрузки текущим потоком."""
+        self.done = threading.Event()
+        self.owner = threading.get_ident()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+# Разделитель позиционных и именованных аргументов в ключе
+_KWARGS_MARK = object()
+# Отсутствие значения в кэше (None - допустимый результат)
+_MISSING = object()
+
+
+def _make_key(args: tuple, kwargs: dict, typed: bool) -> Hashable:
+    """Ключ кэша по аргументам вызова.
+
+    Args:
+        args: Позиционные аргументы
+        kwargs: Именованные аргументы (порядок не важен)
+        typed: Различать аргументы разных типов (1 и 1.0)
+
+    Returns:
+        Хэшируемый ключ
+    """
+    key = args
+    if kwargs:
+        key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+    if typed:
+        key += tuple(type(value) for value in args)
+        if kwargs:
+            key += tuple(type(value) for _, value in sorted(kwargs.items()))
+    elif len(key) == 1 and type(key[0]) in (int, str):
+        return key[0]
+    return key
+
+
+def memoize(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: int = 128,
+    ttl: Optional[float] = None,
+    typed: bool = False,
+):
+    """Декоратор мемоизации с LRU-кэшем для каждой функции.
+
+    Результаты хранятся в LRUCache размера maxsize с временем жизни
+    ttl. Одновременные вызовы с одинаковыми аргументами выполняют
+    функцию один раз, остальные потоки ждут результат. Исключения не
+    кэшируются. Кэш и счетчики доступны как ``wrapper.cache``.
+
+    Можно применять как ``@memoize`` и как ``@memoize(maxsize=...)``.
+
+    Args:
+        func: Декорируемая функция
+        maxsize: Максимальное количество результатов
+        ttl: Время жизни результата в секундах (None - без ограничения)
+        typed: Различать аргументы разных типов
+
+    Returns:
+        Декорированная функция или декоратор
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache = LRUCache(maxsize, ttl)
+        pending: Dict[Hashable, PendingLoad] = {}
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs, typed)
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+            with lock:
+                load = pending.get(key)
+                leader = load is None
+                if leader:
+                    load = pending[key] = PendingLoad()
+            if not leader:
+                if load.owner == threading.get_ident():
+                    # Рекурсивный вызов с теми же аргументами
+                    return func(*args, **kwargs)
+                load.done.wait()
+            else:
+                start = time.perf_counter()
+                try:
+                    load.result = func(*args, **kwargs)
+                except BaseException as error:
+                    # KeyboardInterrupt и SystemExit тоже передаются ждущим
+                    load.error = error
+                    raise
+                finally:
+                    with lock:
+                        cache.stats.record_load(time.perf_counter() - start)
+                        del pending[key]
+                        if load.error is None:
+                            cache.put(key, load.result)
+                    load.done.set()
+            if load.error is not None:
+                raise load.error
+            return load.result
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator if func is None else decorator(func)
+
+
+def async_memoize(
+    func: Optional[Callable] = None,
+    *,
+    maxsize: int = 128,
+    ttl: Optional[float] = None,
+    typed: bool = False,
+):
+    """Декоратор мемоизации для асинхронных функций.
+
+    Одновременные вызовы с одинаковыми аргументами ждут одну задачу;
+    отмена одного из ожидающих не отменяет загрузку для остальных.
+    Параметры те же, что у memoize.
+
+    Returns:
+        Декорированная функция или декоратор
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache = LRUCache(maxsize, ttl)
+        pending: Dict[Hashable, asyncio.Future] = {}
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = _make_key(args, kwargs, typed)
+            result = cache.get(key, _MISSING)
+            if result is not _MISSING:
+                return result
+            task = pending.get(key)
+            if task is None:
+                start = time.perf_counter()
+                task = pending[key] = asyncio.ensure_future(func(*args, **kwargs))
+
+                def finished(task: asyncio.Future) -> None:
+                    cache.stats.record_load(time.perf_counter() - start)
+                    if pending.get(key) is task:
+                        del pending[key]
+                    if not task.cancelled() and task.exception() is None:
+                        cache.put(key, task.result())
+
+                task.add_done_callback(finished)
+            return await asyncio.shield(task)
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator if func is None else decorator(func)
@@ -0,0 +1,283 @@
+"""Компактное представление сотрудников для больших списков.
+
+Классы хранят поля только в ``__slots__`` (без ``__dict__``),
+используют общие экземпляры стратегий, а навыки разработчиков
+хранят как кортеж ID из общего реестра навыков.
+
+Компактные классы наследуют ``BaseEmployee``, а не Manager, Developer
+и Salesperson, поэтому ``isinstance(CompactManager(...), Manager)``
+ложно; общий тип для проверок - ``BaseEmployee``.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from employee import BaseEmployee, Manager, Developer, Salesperson
+from strategies import (
+    BASE_STRATEGY,
+    MANAGER_STRATEGY,
+    DEVELOPER_STRATEGY,
+    SALESPERSON_STRATEGY,
+    BaseSalaryStrategy,
+    SalaryCalculationStrategy,
+)
+
+
+class SkillRegistry:
+    """Реестр навыков: название <-> целочисленный ID."""
+
+    def __init__(self) -> None:
+        """Инициализация пустого реестра."""
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def intern(self, skill: str) -> int:
+        """Получить ID навыка, зарегистрировав его при необходимости.
+
+        Args:
+            skill: Название навыка
+
+        Returns:
+            ID навыка
+        """
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            skill_id = self._ids[skill] = len(self._names)
+            self._names.append(skill)
+        return skill_id
+
+    def intern_all(self, skills: Iterable[str]) -> Tuple[int, ...]:
+        """Получить ID для списка навыков без повторов.
+
+        Args:
+            skills: Названия навыков
+
+        Returns:
+            Кортеж ID в исходном порядке
+        """
+        ids: List[int] = []
+        for skill in skills:
+            skill_id = self.intern(skill)
+            if skill_id not in ids:
+                ids.append(skill_id)
+        return tuple(ids)
+
+    def name(self, skill_id: int) -> str:
+        """Название навыка по ID.
+
+        Args:
+            skill_id: ID навыка
+
+        Returns:
+            Название навыка
+        """
+        return self._names[skill_id]
+
+    def __len__(self) -> int:
+        """Количество зарегистрированных навыков."""
+        return len(self._names)
+
+
+# Общий реестр навыков для всех компактных разработчиков
+SKILLS = SkillRegistry()
+
+
+class CompactEmployee(BaseEmployee):
+    """Компактный сотрудник с базовой стратегией."""
+
+    __slots__ = ()
+    _init_fields = BaseEmployee._init_fields
+    _default_strategy = BASE_STRATEGY
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        salary_strategy: Optional[SalaryCalculationStrategy] = None,
+    ):
+        """Инициализация сотрудника.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Полное имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            salary_strategy: Стратегия расчета (по умолчанию общая базовая)
+        """
+        super().__init__(
+            emp_id, name, department, base_salary, salary_strategy or BASE_STRATEGY
+        )
+
+
+class CompactManager(BaseEmployee):
+    """Компактный менеджер с бонусом."""
+
+    __slots__ = ("bonus",)
+    _init_fields = Manager._init_fields
+    _default_strategy = MANAGER_STRATEGY
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        bonus: float,
+    ):
+        """Инициализация менеджера.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            bonus: Бонус
+        """
+        super().__init__(emp_id, name, department, base_salary, MANAGER_STRATEGY)
+        self.bonus = bonus
+
+    get_info = Manager.get_info
+
+
+class CompactDeveloper(BaseEmployee):
+    """Компактный разработчик; навыки хранятся как ID из SKILLS."""
+
+    __slots__ = ("level", "_skill_ids")
+    _init_fields = Developer._init_fields
+    _default_strategy = DEVELOPER_STRATEGY
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        skills: Iterable[str],
+        level: str,
+    ):
+        """Инициализация разработчика.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            skills: Список навыков
+            level: Уровень квалификации (junior/middle/senior)
+        """
+        super().__init__(emp_id, name, department, base_salary, DEVELOPER_STRATEGY)
+        self._skill_ids = SKILLS.intern_all(skills)
+        self.level = level
+
+    @property
+    def skills(self) -> List[str]:
+        """Названия навыков (новый список при каждом обращении)."""
+        return [SKILLS.name(skill_id) for skill_id in self._skill_ids]
+
+    @skills.setter
+    def skills(self, skills: Iterable[str]) -> None:
+        """Заменить список навыков."""
+        self._skill_ids = SKILLS.intern_all(skills)
+
+    def add_skill(self, skill: str) -> None:
+        """Добавить навык разработчику.
+
+        Args:
+            skill: Название навыка
+        """
+        skill_id = SKILLS.intern(skill)
+        if skill_id not in self._skill_ids:
+            self._skill_ids += (skill_id,)
+
+    get_info = Developer.get_info
+
+
+class CompactSalesperson(BaseEmployee):
+    """Компактный продавец с комиссией."""
+
+    __slots__ = ("commission", "sales")
+    _init_fields = Salesperson._init_fields
+    _default_strategy = SALESPERSON_STRATEGY
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        commission: float,
+        sales: float,
+    ):
+        """Инициализация продавца.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            commission: Процент комиссии (например 0.15 для 15%)
+            sales: Сумма продаж
+        """
+        super().__init__(emp_id, name, department, base_salary, SALESPERSON_STRATEGY)
+        self.commission = commission
+        self.sales = sales
+
+    get_info = Salesperson.get_info
+
+
+_COMPACT_TYPES = {
+    Manager: lambda e: CompactManager(
+        e.id, e.name, e.department, e.base_salary, e.bonus
+    ),
+    Developer: lambda e: CompactDeveloper(
+        e.id, e.name, e.department, e.base_salary, e.skills, e.level
+    ),
+    Salesperson: lambda e: CompactSalesperson(
+        e.id, e.name, e.department, e.base_salary, e.commission, e.sales
+    ),
+}
+
+# Классы, экземпляры которых уже компактны
+_COMPACT_CLASSES = (
+    CompactEmployee,
+    CompactManager,
+    CompactDeveloper,
+    CompactSalesperson,
+)
+
+
+def to_compact(employee: BaseEmployee) -> BaseEmployee:
+    """Преобразовать обычного сотрудника в компактного.
+
+    Класс выбирается по MRO: наследник Manager становится
+    CompactManager и т. д. Компактный сотрудник возвращается как есть.
+
+    Args:
+        employee: Объект сотрудника
+
+    Returns:
+        Компактный объект с теми же данными
+
+    Raises:
+        ValueError: Если класс переопределяет calculate_salary() -
+            компактный объект считал бы зарплату иначе
+    """
+    employee_type = type(employee)
+    if isinstance(employee, _COMPACT_CLASSES):
+        return employee
+    if employee_type.calculate_salary is not BaseEmployee.calculate_salary:
+        raise ValueError(
+            f"{employee_type.__name__} переопределяет calculate_salary() "
+            "и не преобразуется в компактного сотрудника"
+        )
+    for base in employee_type.__mro__:
+        convert = _COMPACT_TYPES.get(base)
+        if convert is not None:
+            return convert(employee)
+    strategy = employee.salary_strategy
+    if type(strategy) is BaseSalaryStrategy:
+        strategy = BASE_STRATEGY
+    return CompactEmployee(
+        employee.id, employee.name, employee.department, employee.base_salary, strategy
+    )
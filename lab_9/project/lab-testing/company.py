@@ -1,312 +1,614 @@
-"""Модель компании и управление сотрудниками."""
-
-from typing import List, Optional
-from employee import Employee
-from patterns import EmployeeRepository, InMemoryEmployeeRepository
-
-
-class Department:
-    """Отдел компании."""
-
-    def __init__(self, name: str) -> None:
-        """Инициализация отдела.
-
-        Args:
-            name: Название отдела
-        """
-        self.name = name
-        self.employees: List[Employee] = []
-
-    def add_employee(self, employee: Employee) -> None:
-        """Добавить сотрудника в отдел.
-
-        Args:
-            employee: Объект сотрудника
-        """
-        self.employees.append(employee)
-
-    def remove_employee(self, emp_id: int) -> bool:
-        """Удалить сотрудника из отдела.
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            True если удалился, False если не найден
-        """
-        for i, emp in enumerate(self.employees):
-            if emp.id == emp_id:
-                self.employees.pop(i)
-                return True
-        return False
-
-    def get_total_salary(self) -> float:
-        """Получить общую зарплату всех сотрудников.
-
-        Returns:
-            Сумма всех зарплат
-        """
-        return sum(emp.calculate_salary() for emp in self.employees)
-
-    def get_average_salary(self) -> float:
-        """Получить среднюю зарплату.
-
-        Returns:
-            Средняя зарплата или 0
-        """
-        if not self.employees:
-            return 0
-        return self.get_total_salary() / len(self.employees)
-
-    def __len__(self) -> int:
-        """Получить количество сотрудников.
-
-        Returns:
-            Количество сотрудников
-        """
-        return len(self.employees)
-
-    def __getitem__(self, index: int) -> Employee:
-        """Получить сотрудника по индексу.
-
-        Args:
-            index: Индекс
-
-        Returns:
-            Объект сотрудника
-        """
-        return self.employees[index]
-
-    def __contains__(self, emp_id: int) -> bool:
-        """Проверить наличие сотрудника.
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            True если сотрудник есть
-        """
-        return any(emp.id == emp_id for emp in self.employees)
-
-    def __iter__(self):
-        """Итератор по сотрудникам.
-
-        Returns:
-            Итератор
-        """
-        return iter(self.employees)
-
-    def get_info(self) -> str:
-        """Получить информацию об отделе.
-
-        Returns:
-            Строка с информацией
-        """
-        return (
-            f"Department(name={self.name}, "
-            f"employees={len(self.employees)}, "
-            f"total_salary={self.get_total_salary()}, "
-            f"avg_salary={self.get_average_salary()})"
-        )
-
-
-class Company:
-    """Компания с отделами и сотрудниками."""
-
-    def __init__(
-        self, name: str, repository: Optional[EmployeeRepository] = None
-    ) -> None:
-        """Инициализация компании.
-
-        Args:
-            name: Название компании
-            repository: Хранилище сотрудников (опционально)
-        """
-        self.name = name
-        self.repository = repository or InMemoryEmployeeRepository()
-        self.departments: List[Department] = []
-
-    def add_department(self, department: Department) -> None:
-        """Добавить отдел в компанию.
-
-        Args:
-            department: Объект отдела
-        """
-        self.departments.append(department)
-
-    def remove_department(self, department) -> None:
-        """Удалить отдел (только если пуст).
-
-        Args:
-            department: Объект отдела или имя отдела
-
-        Raises:
-            ValueError: Если отдел содержит сотрудников
-        """
-        # Если передана строка, найти отдел по имени
-        if isinstance(department, str):
-            dept_name = department
-            dept = None
-            for d in self.departments:
-                if d.name == dept_name:
-                    dept = d
-                    break
-            if dept is None:
-                raise ValueError(f"Department '{dept_name}' not found")
-            department = dept
-
-        if len(department) > 0:
-            raise ValueError(
-                f"Cannot delete department '{department.name}' " "with employees"
-            )
-        self.departments.remove(department)
-
-    def get_departments(self) -> List[Department]:
-        """Получить все отделы.
-
-        Returns:
-            Список отделов
-        """
-        return self.departments
-
-    def add_employee(self, employee: Employee) -> None:
-        """Добавить сотрудника в компанию.
-
-        Args:
-            employee: Объект сотрудника
-        """
-        self.repository.add(employee)
-
-    def find_employee(self, emp_id: int) -> Optional[Employee]:
-        """Найти сотрудника по ID.
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            Объект сотрудника или None
-        """
-        return self.repository.find_by_id(emp_id)
-
-    def find_employee_by_id(self, emp_id: int) -> Optional[Employee]:
-        """Найти сотрудника по ID (alias для find_employee).
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            Объект сотрудника или None
-        """
-        # Сначала ищем в repository
-        emp = self.repository.find_by_id(emp_id)
-        if emp:
-            return emp
-
-        # Если не найден, ищем в отделах
-        for dept in self.departments:
-            for employee in dept.employees:
-                if employee.id == emp_id:
-                    return employee
-        return None
-
-    def get_all_employees(self) -> List[Employee]:
-        """Получить всех сотрудников.
-
-        Returns:
-            Список сотрудников
-        """
-        employees = []
-        # Собираем из repository
-        employees.extend(self.repository.get_all())
-        # Собираем из отделов
-        for dept in self.departments:
-            for emp in dept.employees:
-                if emp not in employees:
-                    employees.append(emp)
-        return employees
-
-    def get_total_salary(self) -> float:
-        """Получить общую зарплату всех сотрудников.
-
-        Returns:
-            Сумма всех зарплат
-        """
-        return sum(emp.calculate_salary() for emp in self.get_all_employees())
-
-    def calculate_total_monthly_cost(self) -> float:
-        """Получить общую месячную стоимость.
-
-        Returns:
-            Сумма всех зарплат
-        """
-        return self.get_total_salary()
-
-    def get_info(self) -> str:
-        """Получить информацию о компании.
-
-        Returns:
-            Строка с информацией
-        """
-        return (
-            f"Company(name={self.name}, "
-            f"employees={len(self.get_all_employees())}, "
-            f"departments={len(self.departments)}, "
-            f"total_salary={self.get_total_salary()})"
-        )
-
-    def __str__(self) -> str:
-        """Строковое представление.
-
-        Returns:
-            Информация о компании
-        """
-        return self.get_info()
-
-    def __repr__(self) -> str:
-        """Представление для отладки.
-
-        Returns:
-            Информация о компании
-        """
-        return self.get_info()
-
-
-class Project:
-    """Проект в компании."""
-
-    def __init__(self, name: str) -> None:
-        """Инициализация проекта.
-
-        Args:
-            name: Название проекта
-        """
-        self.name = name
-        self.team: List[Employee] = []
-
-    def add_team_member(self, employee: Employee) -> None:
-        """Добавить члена команды.
-
-        Args:
-            employee: Объект сотрудника
-        """
-        self.team.append(employee)
-
-    def get_total_salary(self) -> float:
-        """Получить общую зарплату команды.
-
-        Returns:
-            Сумма зарплат всех членов
-        """
-        return sum(emp.calculate_salary() for emp in self.team)
-
-    def get_info(self) -> str:
-        """Получить информацию о проекте.
-
-        Returns:
-            Строка с информацией
-        """
-        return (
-            f"Project(name={self.name}, "
-            f"team_size={len(self.team)}, "
-            f"total_salary={self.get_total_salary()})"
-        )
+"""Модель компании и управление сотрудниками."""
+
+from typing import Dict, Iterator, List, Optional, Set
+from aggregates import SalaryAggregate
+from department import Department as BaseDepartment
+from employee import BaseEmployee, Employee
+from events import ChangeFeed, ChangeSource, EmployeeHired, EmployeeRemoved
+from payroll import PayrollTable
+from patterns import EmployeeRepository, InMemoryEmployeeRepository
+from strategies import calculate_batch
+
+
+class Department(BaseDepartment):
+    """Отдел компании (удаление и проверка наличия по ID).
+
+    Как и базовый отдел, хранит сотрудника один раз: повторное
+    добавление сотрудника с тем же ID ничего не меняет.
+    """
+
+    def remove_employee(self, emp_id: int) -> bool:
+        """Удалить сотрудника из отдела.
+
+        Args:
+            emp_id: ID сотрудника (или объект сотрудника)
+
+        Returns:
+            True если удалился, False если не найден
+        """
+        if isinstance(emp_id, BaseEmployee):
+            emp_id = emp_id.id
+        employee = self.find_employee_by_id(emp_id)
+        if employee is None:
+            return False
+        super().remove_employee(employee)
+        return True
+
+    def get_total_salary(self) -> float:
+        """Получить общую зарплату всех сотрудников.
+
+        Returns:
+            Сумма всех зарплат
+        """
+        return self.calculate_total_salary()
+
+    def get_average_salary(self) -> float:
+        """Получить среднюю зарплату.
+
+        Returns:
+            Средняя зарплата или 0
+        """
+        return self.calculate_average_salary()
+
+    def __contains__(self, emp_id: int) -> bool:
+        """Проверить наличие сотрудника.
+
+        Args:
+            emp_id: ID сотрудника (или объект сотрудника)
+
+        Returns:
+            True если сотрудник есть
+        """
+        if isinstance(emp_id, BaseEmployee):
+            emp_id = emp_id.id
+        return emp_id in self._by_id
+
+    def get_info(self) -> str:
+        """Получить информацию об отделе.
+
+        Returns:
+            Строка с информацией
+        """
+        return (
+            f"Department(name={self.name}, "
+            f"employees={len(self)}, "
+            f"total_salary={self.get_total_salary()}, "
+            f"avg_salary={self.get_average_salary()})"
+        )
+
+
+class Company(ChangeSource):
+    """Компания с отделами и сотрудниками.
+
+    В ленту ``feed`` публикуются события по сотрудникам компании
+    без повторов: найм и удаление - при появлении ID в компании и
+    исчезновении из всех источников, изменения - по полям зарплаты
+    и отдела.
+
+    Компания подписана на ленту хранилища (если у хранилища есть
+    атрибут ``feed`` без ленты, ему назначается собственная), поэтому
+    сотрудники, сохраненные в ``repository`` напрямую, тоже учитываются
+    в индексе и агрегатах. Хранилище без атрибута ``feed`` не публикует
+    события - прямые записи в него компания не видит. ``close()``
+    отписывает компанию от ленты хранилища.
+    """
+
+    feed_source = "company"
+
+    def __init__(
+        self,
+        name: str,
+        repository: Optional[EmployeeRepository] = None,
+        feed: Optional[ChangeFeed] = None,
+    ) -> None:
+        """Инициализация компании.
+
+        Args:
+            name: Название компании
+            repository: Хранилище сотрудников (опционально)
+            feed: Лента изменений (опционально)
+        """
+        self.name = name
+        self.feed = feed
+        self.repository = repository or InMemoryEmployeeRepository()
+        self.departments: List[Department] = []
+        # Глобальный индекс ID -> сотрудник по репозиторию и всем отделам.
+        # Счетчик ссылок показывает, во скольких источниках есть сотрудник.
+        self._index: Dict[int, Employee] = {}
+        self._index_refs: Dict[int, int] = {}
+        # Агрегаты зарплат по сотрудникам индекса
+        self._salaries: Dict[int, float] = {}
+        self._aggregate = SalaryAggregate()
+        # ID, учтенные из хранилища, и ID из его ленты, еще не учтенные
+        self._repository_ids: Set[int] = set()
+        self._repository_pending: Set[int] = set()
+        for employee in self.repository.get_all():
+            self._repository_saved(employee)
+        # Лента хранилища, на которую подписана компания, и признак,
+        # что ее назначила сама компания
+        self._repository_feed: Optional[ChangeFeed] = getattr(
+            self.repository, "feed", None
+        )
+        self._owns_repository_feed = False
+        if self._repository_feed is None and hasattr(self.repository, "feed"):
+            self._repository_feed = ChangeFeed(capacity=1)
+            self.repository.feed = self._repository_feed
+            self._owns_repository_feed = True
+        if self._repository_feed is not None:
+            self._repository_feed.subscribe(self._on_repository_event)
+
+    def close(self) -> None:
+        """Отписаться от ленты хранилища.
+
+        Лента, назначенная хранилищу самой компанией, снимается.
+        """
+        feed = self._repository_feed
+        if feed is None:
+            return
+        self._repository_feed = None
+        feed.unsubscribe(self._on_repository_event)
+        if self._owns_repository_feed and self.repository.feed is feed:
+            self.repository.feed = None
+        self._owns_repository_feed = False
+
+    def __enter__(self) -> "Company":
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Отписка от ленты хранилища при выходе из контекста."""
+        self.close()
+
+    def _on_repository_event(self, event) -> None:
+        """Запомнить ID из события хранилища до следующего чтения.
+
+        Args:
+            event: Событие ленты хранилища
+        """
+        if event.source == getattr(self.repository, "feed_source", None):
+            self._repository_pending.add(event.employee_id)
+
+    def _sync_repository(self) -> None:
+        """Учесть изменения, сделанные в хранилище в обход компании."""
+        while self._repository_pending:
+            emp_id = self._repository_pending.pop()
+            employee = self.repository.find_by_id(emp_id)
+            if employee is None:
+                self._repository_removed(emp_id)
+            elif self._index.get(emp_id) is not employee:
+                self._repository_saved(employee)
+
+    def _repository_saved(self, employee: Employee) -> None:
+        """Учесть сотрудника, сохраненного в хранилище.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        if employee.id in self._repository_ids:
+            self._set_indexed(employee.id, employee)
+        else:
+            self._repository_ids.add(employee.id)
+            self._index_employee(employee, prefer=True)
+
+    def _repository_removed(self, emp_id: int) -> None:
+        """Учесть удаление сотрудника из хранилища.
+
+        Args:
+            emp_id: ID сотрудника
+        """
+        if emp_id in self._repository_ids:
+            self._repository_ids.discard(emp_id)
+            self._unindex_employee(self._index[emp_id])
+
+    def _index_employee(self, employee: Employee, prefer: bool = False) -> None:
+        """Учесть сотрудника в глобальном индексе.
+
+        Args:
+            employee: Объект сотрудника
+            prefer: Заменить объект в индексе (для репозитория)
+        """
+        emp_id = employee.id
+        self._index_refs[emp_id] = self._index_refs.get(emp_id, 0) + 1
+        if prefer or emp_id not in self._index:
+            self._set_indexed(emp_id, employee)
+
+    def _unindex_employee(self, employee: Employee) -> None:
+        """Убрать одну ссылку на сотрудника из глобального индекса.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        emp_id = employee.id
+        refs = self._index_refs.get(emp_id, 0) - 1
+        if refs <= 0:
+            self._index_refs.pop(emp_id, None)
+            self._set_indexed(emp_id, None)
+            return
+        self._index_refs[emp_id] = refs
+        if self._index.get(emp_id) is employee:
+            # В другом источнике остался другой объект с тем же ID
+            self._set_indexed(emp_id, self._find_in_sources(emp_id))
+
+    def _set_indexed(self, emp_id: int, employee: Optional[Employee]) -> None:
+        """Сменить объект сотрудника в индексе.
+
+        Агрегаты зарплат и подписка на изменения переносятся
+        на новый объект.
+
+        Args:
+            emp_id: ID сотрудника
+            employee: Новый объект или None для удаления из индекса
+        """
+        current = self._index.get(emp_id)
+        if current is employee:
+            return
+        if current is not None:
+            del self._index[emp_id]
+            current.remove_observer(self)
+            self._aggregate.remove(self._salaries.pop(emp_id))
+            if employee is None:
+                self._publish(EmployeeRemoved, emp_id)
+        if employee is not None:
+            self._index[emp_id] = employee
+            salary = employee.calculate_salary()
+            self._salaries[emp_id] = salary
+            self._aggregate.add(salary)
+            employee.add_observer(self)
+            if current is None:
+                self._publish(EmployeeHired, emp_id)
+
+    def _find_in_sources(self, emp_id: int) -> Optional[Employee]:
+        """Найти сотрудника в репозитории и отделах без индекса.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Объект сотрудника или None
+        """
+        emp = self.repository.find_by_id(emp_id)
+        if emp is not None:
+            return emp
+        for dept in self.departments:
+            emp = dept.find_employee_by_id(emp_id)
+            if emp is not None:
+                return emp
+        return None
+
+    def on_employee_added(self, department: Department, employee: Employee) -> None:
+        """Обработать добавление сотрудника в отдел компании.
+
+        Args:
+            department: Отдел
+            employee: Объект сотрудника
+        """
+        self._index_employee(employee)
+
+    def on_employee_removed(self, department: Department, employee: Employee) -> None:
+        """Обработать удаление сотрудника из отдела компании.
+
+        Args:
+            department: Отдел
+            employee: Объект сотрудника
+        """
+        self._unindex_employee(employee)
+
+    def on_employee_changed(
+        self, employee: Employee, field: str, old_value, new_value
+    ) -> None:
+        """Обновить агрегаты после изменения поля сотрудника.
+
+        Args:
+            employee: Объект сотрудника
+            field: Имя измененного поля
+            old_value: Прежнее значение
+            new_value: Новое значение
+        """
+        emp_id = employee.id
+        if self._index.get(emp_id) is not employee:
+            return
+        if employee.affects_salary(field):
+            salary = employee.calculate_salary()
+            self._aggregate.replace(self._salaries[emp_id], salary)
+            self._salaries[emp_id] = salary
+        self._publish_change(employee, field, old_value, new_value)
+
+    def add_department(self, department: Department) -> None:
+        """Добавить отдел в компанию.
+
+        Повторное добавление того же отдела ничего не меняет.
+
+        Args:
+            department: Объект отдела
+        """
+        if department in self.departments:
+            return
+        self.departments.append(department)
+        for employee in department:
+            self._index_employee(employee)
+        department.add_listener(self)
+
+    def remove_department(self, department) -> None:
+        """Удалить отдел (только если пуст).
+
+        Args:
+            department: Объект отдела или имя отдела
+
+        Raises:
+            ValueError: Если отдел содержит сотрудников
+        """
+        # Если передана строка, найти отдел по имени
+        if isinstance(department, str):
+            dept_name = department
+            dept = None
+            for d in self.departments:
+                if d.name == dept_name:
+                    dept = d
+                    break
+            if dept is None:
+                raise ValueError(f"Department '{dept_name}' not found")
+            department = dept
+
+        if len(department) > 0:
+            raise ValueError(
+                f"Cannot delete department '{department.name}' " "with employees"
+            )
+        self.departments.remove(department)
+        department.remove_listener(self)
+
+    def transfer_employee(self, emp_id: int, department: Department) -> bool:
+        """Перевести сотрудника из его отделов компании в другой отдел.
+
+        Сотрудник сначала добавляется в новый отдел, поэтому компания
+        не теряет его и публикует одно событие DepartmentMoved.
+
+        Args:
+            emp_id: ID сотрудника
+            department: Отдел назначения (должен входить в компанию)
+
+        Returns:
+            True если сотрудник переведен, False если не найден
+        """
+        employee = self.find_employee_by_id(emp_id)
+        if employee is None:
+            return False
+        department.add_employee(employee)
+        for dept in list(self.departments):
+            if dept is department:
+                continue
+            # Отделы могут хранить другой объект с тем же ID
+            held = dept.find_employee_by_id(emp_id)
+            if held is not None:
+                dept.remove_employee(held)
+        employee.department = department.name
+        return True
+
+    def get_departments(self) -> List[Department]:
+        """Получить все отделы.
+
+        Returns:
+            Список отделов
+        """
+        return self.departments
+
+    def add_employee(self, employee: Employee) -> None:
+        """Добавить сотрудника в компанию.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        self._sync_repository()
+        self.repository.add(employee)
+        self._repository_pending.discard(employee.id)
+        self._repository_saved(employee)
+
+    def remove_employee(self, emp_id: int) -> bool:
+        """Удалить сотрудника из хранилища компании.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            True если удалился, False если не найден
+        """
+        self._sync_repository()
+        if self.repository.find_by_id(emp_id) is None:
+            return False
+        self.repository.remove(emp_id)
+        self._repository_pending.discard(emp_id)
+        self._repository_removed(emp_id)
+        return True
+
+    def find_employee(self, emp_id: int) -> Optional[Employee]:
+        """Найти сотрудника по ID.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Объект сотрудника или None
+        """
+        return self.repository.find_by_id(emp_id)
+
+    def find_employee_by_id(self, emp_id: int) -> Optional[Employee]:
+        """Найти сотрудника по ID (alias для find_employee).
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Объект сотрудника или None
+        """
+        self._sync_repository()
+        emp = self._index.get(emp_id)
+        if emp is not None:
+            return emp
+        # Хранилище без ленты могло измениться в обход компании
+        return self.repository.find_by_id(emp_id)
+
+    def get_all_employees(self) -> List[Employee]:
+        """Получить всех сотрудников.
+
+        Сначала сотрудники repository, затем отделов; каждый ID
+        встречается один раз.
+
+        Returns:
+            Список сотрудников
+        """
+        employees = list(self.repository.get_all())
+        seen = {emp.id for emp in employees}
+        for dept in self.departments:
+            for emp in dept:
+                if emp.id not in seen:
+                    seen.add(emp.id)
+                    employees.append(emp)
+        return employees
+
+    def iter_all_employees(self) -> Iterator[Employee]:
+        """Итератор по всем сотрудникам без построения списка.
+
+        Порядок тот же, что у ``get_all_employees``. Повторы отсекаются
+        по множеству уже выданных ID за один линейный проход.
+
+        Yields:
+            Объекты сотрудников
+        """
+        seen = set()
+        for emp in self.repository.get_all():
+            seen.add(emp.id)
+            yield emp
+        for dept in self.departments:
+            for emp in dept:
+                if emp.id not in seen:
+                    seen.add(emp.id)
+                    yield emp
+
+    def get_total_salary(self) -> float:
+        """Получить общую зарплату всех сотрудников.
+
+        Returns:
+            Сумма всех зарплат
+        """
+        self._sync_repository()
+        return self._aggregate.total
+
+    def get_salary_stats(self) -> dict:
+        """Агрегаты зарплат компании за O(1).
+
+        Учитываются сотрудники хранилища и отделов компании.
+
+        Returns:
+            Словарь с ключами total, count, average, min, max
+        """
+        self._sync_repository()
+        return self._aggregate.as_dict()
+
+    def recalculate_salary_stats(self) -> dict:
+        """Пересчитать агрегаты зарплат компании пакетным расчетом.
+
+        Returns:
+            Словарь с ключами total, count, average, min, max
+        """
+        self._sync_repository()
+        employees = list(self._index.values())
+        self._salaries = {}
+        self._aggregate = SalaryAggregate()
+        for employee, salary in zip(employees, calculate_batch(employees)):
+            self._salaries[employee.id] = salary
+            self._aggregate.add(salary)
+        return self._aggregate.as_dict()
+
+    def get_salary_by_department(self) -> Dict[str, float]:
+        """Получить суммы зарплат по отделам.
+
+        Returns:
+            Словарь {название отдела: сумма зарплат}
+        """
+        return PayrollTable.from_departments(self.departments).department_totals()
+
+    def calculate_total_monthly_cost(self) -> float:
+        """Получить общую месячную стоимость.
+
+        Returns:
+            Сумма всех зарплат
+        """
+        return self.get_total_salary()
+
+    def get_info(self) -> str:
+        """Получить информацию о компании.
+
+        Returns:
+            Строка с информацией
+        """
+        self._sync_repository()
+        return (
+            f"Company(name={self.name}, "
+            f"employees={self._aggregate.count}, "
+            f"departments={len(self.departments)}, "
+            f"total_salary={self.get_total_salary()})"
+        )
+
+    def __str__(self) -> str:
+        """Строковое представление.
+
+        Returns:
+            Информация о компании
+        """
+        return self.get_info()
+
+    def __repr__(self) -> str:
+        """Представление для отладки.
+
+        Returns:
+            Информация о компании
+        """
+        return self.get_info()
+
+
+class Project(ChangeSource):
+    """Проект в компании."""
+
+    def __init__(self, name: str, feed: Optional[ChangeFeed] = None) -> None:
+        """Инициализация проекта.
+
+        Args:
+            name: Название проекта
+            feed: Лента изменений (опционально)
+        """
+        self.name = name
+        self.feed = feed
+        self.team: List[Employee] = []
+
+    @property
+    def feed_source(self) -> str:
+        """Название источника в событиях ленты."""
+        return f"project:{self.name}"
+
+    def add_team_member(self, employee: Employee) -> None:
+        """Добавить члена команды.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        self.team.append(employee)
+        self._publish(EmployeeHired, employee.id)
+
+    def get_total_salary(self) -> float:
+        """Получить общую зарплату команды.
+
+        Returns:
+            Сумма зарплат всех членов
+        """
+        return sum(calculate_batch(self.team))
+
+    def get_info(self) -> str:
+        """Получить информацию о проекте.
+
+        Returns:
+            Строка с информацией
+        """
+        return (
+            f"Project(name={self.name}, "
+            f"team_size={len(self.team)}, "
+            f"total_salary={self.get_total_salary()})"
+        )
@@ -1,142 +1,427 @@
-"""Отдел компании с управлением сотрудниками."""
-
-from typing import List, Optional, Iterator
-from employee import Employee
-
-
-class Department:
-    """Отдел компании с сотрудниками."""
-
-    def __init__(self, name: str):
-        """Инициализация отдела.
-
-        Args:
-            name: Название отдела
-        """
-        self.name = name
-        self.employees: List[Employee] = []
-
-    def add_employee(self, employee: Employee) -> None:
-        """Добавить сотрудника в отдел.
-
-        Args:
-            employee: Объект сотрудника
-        """
-        if employee not in self.employees:
-            self.employees.append(employee)
-
-    def remove_employee(self, employee: Employee) -> None:
-        """Удалить сотрудника из отдела.
-
-        Args:
-            employee: Объект сотрудника
-        """
-        if employee in self.employees:
-            self.employees.remove(employee)
-
-    def find_employee_by_id(self, emp_id: int) -> Optional[Employee]:
-        """Найти сотрудника по ID.
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            Объект сотрудника или None
-        """
-        for employee in self.employees:
-            if employee.id == emp_id:
-                return employee
-        return None
-
-    def find_employee_by_name(self, name: str) -> Optional[Employee]:
-        """Найти сотрудника по имени.
-
-        Args:
-            name: Имя сотрудника
-
-        Returns:
-            Объект сотрудника или None
-        """
-        for employee in self.employees:
-            if employee.name == name:
-                return employee
-        return None
-
-    def calculate_total_salary(self) -> float:
-        """Расчет общей зарплаты отдела.
-
-        Returns:
-            Сумма зарплат всех сотрудников
-        """
-        return sum(emp.calculate_salary() for emp in self.employees)
-
-    def calculate_average_salary(self) -> float:
-        """Расчет средней зарплаты.
-
-        Returns:
-            Средняя зарплата или 0
-        """
-        if not self.employees:
-            return 0.0
-        return self.calculate_total_salary() / len(self.employees)
-
-    def get_info(self) -> str:
-        """Получить информацию об отделе.
-
-        Returns:
-            Строка с информацией
-        """
-        total = self.calculate_total_salary()
-        avg = self.calculate_average_salary()
-        count = len(self.employees)
-
-        return (
-            f"{self.name}: {count} сотр., "
-            f"всего зарплата {total} руб., "
-            f"средняя {avg:.2f} руб."
-        )
-
-    def __len__(self) -> int:
-        """Количество сотрудников в отделе."""
-        return len(self.employees)
-
-    def __getitem__(self, index: int) -> Employee:
-        """Получить сотрудника по индексу.
-
-        Args:
-            index: Индекс в списке
-
-        Returns:
-            Объект сотрудника
-
-        Raises:
-            IndexError: Если индекс вне диапазона
-        """
-        return self.employees[index]
-
-    def __contains__(self, employee: Employee) -> bool:
-        """Проверить наличие сотрудника в отделе.
-
-        Args:
-            employee: Объект сотрудника
-
-        Returns:
-            True если есть, False иначе
-        """
-        return employee in self.employees
-
-    def __iter__(self) -> Iterator[Employee]:
-        """Итератор по сотрудникам отдела.
-
-        Yields:
-            Объекты Employee
-        """
-        return iter(self.employees)
-
-    def __str__(self) -> str:
-        """Строковое представление отдела."""
-        return self.get_info()
-
-    def __repr__(self) -> str:
-        """Представление для отладки."""
-        return f"Department(name='{self.name}', employees={len(self.employees)})"
+"""Отдел компании с управлением сотрудниками."""
+
+from itertools import compress, count, repeat
+from operator import is_
+from typing import Dict, Iterable, Iterator, List, Optional
+from aggregates import SalaryAggregate
+from employee import BaseEmployee, Employee
+from events import ChangeFeed, ChangeSource, EmployeeHired, EmployeeRemoved
+from strategies import calculate_batch
+
+
+class _EmployeeList(list):
+    """Список сотрудников отдела.
+
+    Обычный список для чтения; изменения (append, remove, срезы и т.д.)
+    проходят через отдел, чтобы индексы и агрегаты не расходились
+    со списком. Сотрудник с уже имеющимся ID повторно не добавляется.
+    Копия списка - обычный list.
+    """
+
+    __slots__ = ("_department",)
+
+    def __init__(self, department: "Department") -> None:
+        """Пустой список отдела.
+
+        Args:
+            department: Отдел-владелец
+        """
+        super().__init__()
+        self._department = department
+
+    def _apply(self, index, value=None, delete: bool = False) -> None:
+        """Изменить копию списка по индексу и применить ее к отделу."""
+        employees = list(self)
+        if delete:
+            del employees[index]
+        else:
+            employees[index] = value
+        self._department._assign(employees)
+
+    def append(self, employee: Employee) -> None:
+        """Добавить сотрудника через отдел."""
+        self._department.add_employee(employee)
+
+    def extend(self, employees: Iterable[Employee]) -> None:
+        """Добавить сотрудников пачкой через отдел."""
+        self._department.add_employees(employees)
+
+    def __iadd__(self, employees: Iterable[Employee]) -> "_EmployeeList":
+        """Добавить сотрудников пачкой через отдел."""
+        self.extend(employees)
+        return self
+
+    def __imul__(self, times: int) -> "_EmployeeList":
+        """Повторы ID не добавляются; times <= 0 очищает отдел."""
+        self._department._assign(list(self) * times)
+        return self
+
+    def insert(self, index: int, employee: Employee) -> None:
+        """Добавить сотрудника на позицию index."""
+        if employee in self._department:
+            return
+        employees = list(self)
+        employees.insert(index, employee)
+        self._department._assign(employees)
+
+    def remove(self, employee: Employee) -> None:
+        """Удалить сотрудника с тем же ID.
+
+        Raises:
+            ValueError: Если сотрудника нет в отделе
+        """
+        stored = self._department.find_employee_by_id(getattr(employee, "id", None))
+        if stored is None:
+            raise ValueError("Сотрудника нет в отделе")
+        self._department.remove_employee(stored)
+
+    def pop(self, index: int = -1) -> Employee:
+        """Удалить и вернуть сотрудника по индексу."""
+        employee = self[index]
+        self._department.remove_employee(employee)
+        return employee
+
+    def clear(self) -> None:
+        """Удалить всех сотрудников отдела."""
+        self._department._assign([])
+
+    def __setitem__(self, index, value) -> None:
+        """Заменить сотрудника (или срез) через отдел."""
+        self._apply(index, value)
+
+    def __delitem__(self, index) -> None:
+        """Удалить сотрудника (или срез) через отдел."""
+        self._apply(index, delete=True)
+
+    def __reduce_ex__(self, protocol):
+        """Копируется и сериализуется как обычный list."""
+        return list, (list(self),)
+
+
+class Department(ChangeSource):
+    """Отдел компании с сотрудниками.
+
+    Сотрудники хранятся в упорядоченном индексе ID -> сотрудник
+    (порядок добавления сохраняется) и во вторичном индексе по имени.
+    Агрегаты зарплат обновляются при добавлении, удалении и изменении
+    полей сотрудников, влияющих на зарплату. Если задана лента
+    ``feed``, эти изменения публикуются в нее.
+    """
+
+    def __init__(self, name: str, feed: Optional[ChangeFeed] = None):
+        """Инициализация отдела.
+
+        Args:
+            name: Название отдела
+            feed: Лента изменений (опционально)
+        """
+        self.name = name
+        self.feed = feed
+        self._by_id: Dict[int, Employee] = {}
+        self._by_name: Dict[str, Dict[int, Employee]] = {}
+        self._employees = _EmployeeList(self)
+        self._listeners: List = []
+        self._salaries: Dict[int, float] = {}
+        self._aggregate = SalaryAggregate()
+
+    @property
+    def feed_source(self) -> str:
+        """Название источника в событиях ленты."""
+        return f"department:{self.name}"
+
+    @property
+    def employees(self) -> List[Employee]:
+        """Сотрудники в порядке добавления.
+
+        Изменяемый список: append, remove, присваивание и т.д.
+        обновляют индексы и агрегаты отдела.
+        """
+        return self._employees
+
+    @employees.setter
+    def employees(self, employees: Iterable[Employee]) -> None:
+        """Заменить состав отдела.
+
+        Args:
+            employees: Новые сотрудники
+        """
+        self._assign(list(employees))
+
+    def _assign(self, employees: List[Employee]) -> None:
+        """Привести состав и порядок отдела к списку.
+
+        Отсутствующие в списке сотрудники удаляются, новые добавляются,
+        из сотрудников с одинаковым ID остается первый.
+
+        Args:
+            employees: Сотрудники в нужном порядке
+        """
+        kept: Dict[int, Employee] = {}
+        for employee in employees:
+            kept.setdefault(employee.id, employee)
+        removed = [emp for emp in self._employees if kept.get(emp.id) is not emp]
+        new = [emp for emp in kept.values() if self._by_id.get(emp.id) is not emp]
+        list.__setitem__(self._employees, slice(None), kept.values())
+        for employee in removed:
+            self._unindex(employee)
+        for employee, salary in zip(new, calculate_batch(new)):
+            self._index(employee, salary)
+
+    def add_employee(self, employee: Employee) -> None:
+        """Добавить сотрудника в отдел.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        if employee.id not in self._by_id:
+            list.append(self._employees, employee)
+            self._index(employee, employee.calculate_salary())
+
+    def add_employees(self, employees: Iterable[Employee]) -> None:
+        """Добавить сотрудников пачкой.
+
+        Зарплаты новых сотрудников считаются одним проходом
+        на каждую стратегию.
+
+        Args:
+            employees: Объекты сотрудников
+        """
+        pending: Dict[int, Employee] = {}
+        for employee in employees:
+            if employee.id not in self._by_id:
+                pending.setdefault(employee.id, employee)
+        new = list(pending.values())
+        list.extend(self._employees, new)
+        for employee, salary in zip(new, calculate_batch(new)):
+            self._index(employee, salary)
+
+    def _index(self, employee: Employee, salary: float) -> None:
+        """Внести нового сотрудника в индексы и агрегаты.
+
+        Args:
+            employee: Объект сотрудника
+            salary: Его рассчитанная зарплата
+        """
+        self._by_id[employee.id] = employee
+        self._by_name.setdefault(employee.name, {})[employee.id] = employee
+        self._salaries[employee.id] = salary
+        self._aggregate.add(salary)
+        employee.add_observer(self)
+        self._publish(EmployeeHired, employee.id)
+        for listener in self._listeners:
+            listener.on_employee_added(self, employee)
+
+    def remove_employee(self, employee: Employee) -> None:
+        """Удалить сотрудника из отдела.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        stored = self._by_id.get(employee.id)
+        if stored is None:
+            return
+        # Позиция по идентичности объекта, сравнение на уровне C
+        position = next(compress(count(), map(is_, self._employees, repeat(stored))))
+        list.__delitem__(self._employees, position)
+        self._unindex(stored)
+
+    def _unindex(self, stored: Employee) -> None:
+        """Убрать сотрудника из индексов и агрегатов.
+
+        Args:
+            stored: Объект сотрудника из индекса
+        """
+        del self._by_id[stored.id]
+        self._unindex_name(stored, stored.name)
+        self._aggregate.remove(self._salaries.pop(stored.id))
+        stored.remove_observer(self)
+        self._publish(EmployeeRemoved, stored.id)
+        for listener in self._listeners:
+            listener.on_employee_removed(self, stored)
+
+    def _unindex_name(self, employee: Employee, name: str) -> None:
+        """Убрать сотрудника из индекса имен.
+
+        Args:
+            employee: Объект сотрудника
+            name: Имя, под которым он был проиндексирован
+        """
+        same_name = self._by_name.get(name)
+        if same_name is not None:
+            same_name.pop(employee.id, None)
+            if not same_name:
+                del self._by_name[name]
+
+    def on_employee_changed(
+        self, employee: Employee, field: str, old_value, new_value
+    ) -> None:
+        """Обновить индексы и агрегаты после изменения сотрудника.
+
+        Args:
+            employee: Объект сотрудника
+            field: Имя измененного поля
+            old_value: Прежнее значение
+            new_value: Новое значение
+        """
+        if self._by_id.get(employee.id) is not employee:
+            return
+        if field == "name":
+            self._unindex_name(employee, old_value)
+            same_name = self._by_name.setdefault(new_value, {})
+            same_name[employee.id] = employee
+        elif employee.affects_salary(field):
+            salary = employee.calculate_salary()
+            self._aggregate.replace(self._salaries[employee.id], salary)
+            self._salaries[employee.id] = salary
+        self._publish_change(employee, field, old_value, new_value)
+
+    def add_listener(self, listener) -> None:
+        """Подписать наблюдателя на изменения состава отдела.
+
+        Наблюдатель должен реализовать методы
+        ``on_employee_added(department, employee)`` и
+        ``on_employee_removed(department, employee)``.
+
+        Args:
+            listener: Объект-наблюдатель
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener) -> None:
+        """Отписать наблюдателя.
+
+        Args:
+            listener: Объект-наблюдатель
+        """
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def find_employee_by_id(self, emp_id: int) -> Optional[Employee]:
+        """Найти сотрудника по ID.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Объект сотрудника или None
+        """
+        return self._by_id.get(emp_id)
+
+    def find_employee_by_name(self, name: str) -> Optional[Employee]:
+        """Найти сотрудника по имени.
+
+        Args:
+            name: Имя сотрудника
+
+        Returns:
+            Первый добавленный сотрудник с таким именем или None
+        """
+        same_name = self._by_name.get(name)
+        if not same_name:
+            return None
+        return next(iter(same_name.values()))
+
+    def calculate_total_salary(self) -> float:
+        """Расчет общей зарплаты отдела.
+
+        Returns:
+            Сумма зарплат всех сотрудников
+        """
+        return self._aggregate.total
+
+    def calculate_average_salary(self) -> float:
+        """Расчет средней зарплаты.
+
+        Returns:
+            Средняя зарплата или 0
+        """
+        return self._aggregate.average
+
+    def get_salary_stats(self) -> dict:
+        """Агрегаты зарплат отдела за O(1).
+
+        Returns:
+            Словарь с ключами total, count, average, min, max
+        """
+        return self._aggregate.as_dict()
+
+    def recalculate_salary_stats(self) -> dict:
+        """Пересчитать агрегаты зарплат с нуля пакетным расчетом.
+
+        Нужен, если зарплата изменилась в обход полей сотрудника
+        (например, поменялось состояние пользовательской стратегии).
+
+        Returns:
+            Словарь с ключами total, count, average, min, max
+        """
+        employees = self._employees
+        self._salaries = {}
+        self._aggregate = SalaryAggregate()
+        for employee, salary in zip(employees, calculate_batch(employees)):
+            self._salaries[employee.id] = salary
+            self._aggregate.add(salary)
+        return self._aggregate.as_dict()
+
+    def get_info(self) -> str:
+        """Получить информацию об отделе.
+
+        Returns:
+            Строка с информацией
+        """
+        total = self.calculate_total_salary()
+        avg = self.calculate_average_salary()
+        count = len(self)
+
+        return (
+            f"{self.name}: {count} сотр., "
+            f"всего зарплата {total} руб., "
+            f"средняя {avg:.2f} руб."
+        )
+
+    def __len__(self) -> int:
+        """Количество сотрудников в отделе."""
+        return len(self._by_id)
+
+    def __getitem__(self, index: int) -> Employee:
+        """Получить сотрудника по индексу.
+
+        Args:
+            index: Индекс в списке
+
+        Returns:
+            Объект сотрудника
+
+        Raises:
+            IndexError: Если индекс вне диапазона
+        """
+        return self._employees[index]
+
+    def __contains__(self, employee: Employee) -> bool:
+        """Проверить наличие сотрудника в отделе.
+
+        Args:
+            employee: Объект сотрудника
+
+        Returns:
+            True если есть, False иначе
+        """
+        if not isinstance(employee, BaseEmployee):
+            return False
+        return employee.id in self._by_id
+
+    def __iter__(self) -> Iterator[Employee]:
+        """Итератор по сотрудникам отдела.
+
+        Yields:
+            Объекты Employee
+        """
+        return iter(self._employees)
+
+    def __str__(self) -> str:
+        """Строковое представление отдела."""
+        return self.get_info()
+
+    def __repr__(self) -> str:
+        """Представление для отладки."""
+        return f"Department(name='{self.name}', employees={len(self)})"
@@ -1,187 +1,394 @@
-"""Модели сотрудников компании."""
-
-from validators import EmployeeValidator
-from strategies import (
-    SalaryCalculationStrategy,
-    BaseSalaryStrategy,
-    ManagerSalaryStrategy,
-    DeveloperSalaryStrategy,
-    SalespersonSalaryStrategy,
-)
-
-
-class Employee:
-    """Базовый класс сотрудника."""
-
-    def __init__(
-        self,
-        emp_id: int,
-        name: str,
-        department: str,
-        base_salary: float,
-        salary_strategy: SalaryCalculationStrategy = None,
-    ):
-        """Инициализация сотрудника.
-
-        Args:
-            emp_id: Уникальный ID
-            name: Полное имя
-            department: Отдел
-            base_salary: Базовая зарплата
-            salary_strategy: Стратегия расчета зарплаты
-        """
-        EmployeeValidator.validate_employee(emp_id, name, base_salary)
-
-        self.id = emp_id
-        self.name = name
-        self.department = department
-        self.base_salary = base_salary
-        self.salary_strategy = salary_strategy or BaseSalaryStrategy()
-
-    def calculate_salary(self) -> float:
-        """Расчет зарплаты через стратегию."""
-        return self.salary_strategy.calculate(self)
-
-    def get_info(self) -> str:
-        """Получить информацию о сотруднике."""
-        return f"{self.name} ({self.department}): " f"{self.calculate_salary()} руб."
-
-    def __str__(self) -> str:
-        """Строковое представление."""
-        return self.get_info()
-
-    def __eq__(self, other: "Employee") -> bool:
-        """Сравнение по ID."""
-        if not isinstance(other, Employee):
-            return False
-        return self.id == other.id
-
-    def __lt__(self, other: "Employee") -> bool:
-        """Сравнение по зарплате."""
-        if not isinstance(other, Employee):
-            return NotImplemented
-        return self.calculate_salary() < other.calculate_salary()
-
-    def __add__(self, other: "Employee") -> float:
-        """Сложение зарплат."""
-        if not isinstance(other, Employee):
-            return NotImplemented
-        return self.calculate_salary() + other.calculate_salary()
-
-
-class Manager(Employee):
-    """Менеджер с бонусом."""
-
-    def __init__(
-        self,
-        emp_id: int,
-        name: str,
-        department: str,
-        base_salary: float,
-        bonus: float,
-    ):
-        """Инициализация менеджера.
-
-        Args:
-            emp_id: Уникальный ID
-            name: Имя
-            department: Отдел
-            base_salary: Базовая зарплата
-            bonus: Бонус
-        """
-        super().__init__(emp_id, name, department, base_salary, ManagerSalaryStrategy())
-        self.bonus = bonus
-
-    def get_info(self) -> str:
-        """Получить информацию о менеджере."""
-        return (
-            f"{self.name} ({self.department}): "
-            f"{self.calculate_salary()} руб. (бонус: {self.bonus})"
-        )
-
-
-class Developer(Employee):
-    """Разработчик с уровнем квалификации."""
-
-    def __init__(
-        self,
-        emp_id: int,
-        name: str,
-        department: str,
-        base_salary: float,
-        skills: list,
-        level: str,
-    ):
-        """Инициализация разработчика.
-
-        Args:
-            emp_id: Уникальный ID
-            name: Имя
-            department: Отдел
-            base_salary: Базовая зарплата
-            skills: Список навыков
-            level: Уровень квалификации (junior/middle/senior)
-        """
-        super().__init__(
-            emp_id, name, department, base_salary, DeveloperSalaryStrategy()
-        )
-        self.skills = skills
-        self.level = level
-
-    def add_skill(self, skill: str) -> None:
-        """Добавить навык разработчику.
-
-        Args:
-            skill: Название навыка
-        """
-        if skill not in self.skills:
-            self.skills.append(skill)
-
-    def get_info(self) -> str:
-        """Получить информацию о разработчике."""
-        skills_str = ", ".join(self.skills)
-        return (
-            f"{self.name} ({self.department}, {self.level}): "
-            f"{self.calculate_salary()} руб. Навыки: {skills_str}"
-        )
-
-
-class Salesperson(Employee):
-    """Продавец с комиссией."""
-
-    def __init__(
-        self,
-        emp_id: int,
-        name: str,
-        department: str,
-        base_salary: float,
-        commission: float,
-        sales: float,
-    ):
-        """Инициализация продавца.
-
-        Args:
-            emp_id: Уникальный ID
-            name: Имя
-            department: Отдел
-            base_salary: Базовая зарплата
-            commission: Процент комиссии (например 0.15 для 15%)
-            sales: Сумма продаж
-        """
-        super().__init__(
-            emp_id,
-            name,
-            department,
-            base_salary,
-            SalespersonSalaryStrategy(),
-        )
-        self.commission = commission
-        self.sales = sales
-
-    def get_info(self) -> str:
-        """Получить информацию о продавце."""
-        return (
-            f"{self.name} ({self.department}): "
-            f"{self.calculate_salary()} руб. "
-            f"(Продажи: {self.sales} руб.)"
-        )
+"""Модели сотрудников компании."""
+
+import threading
+from collections import deque
+from itertools import repeat, starmap
+from operator import itemgetter
+from typing import Any, Iterable, List, Sequence, Tuple
+
+from validators import EmployeeValidator
+from strategies import (
+    SalaryCalculationStrategy,
+    BaseSalaryStrategy,
+    ManagerSalaryStrategy,
+    DeveloperSalaryStrategy,
+    SalespersonSalaryStrategy,
+)
+
+
+# Запись атрибута в обход BaseEmployee.__setattr__
+_set_field = object.__setattr__
+
+
+class BaseEmployee:
+    """Общая логика сотрудника.
+
+    Основные поля хранятся в ``__slots__``. Зарплата кэшируется, если
+    стратегия объявила ``cacheable``, и сбрасывается при изменении
+    стратегии или полей из ее ``depends_on``. Счетчики попаданий
+    включаются enable_salary_cache_stats() и по умолчанию не ведутся.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "department",
+        "base_salary",
+        "salary_strategy",
+        "_observers",
+        "_salary_cache",
+    )
+
+    # Общие счетчики кэша зарплат; None - подсчет выключен
+    _salary_cache_stats = None
+    _salary_cache_stats_lock = threading.Lock()
+
+    # Поля, которые заполняет конструктор, в порядке его аргументов;
+    # None - конструктор наследника неизвестен from_rows()
+    _init_fields: Tuple[str, ...] = ("id", "name", "department", "base_salary")
+    # Стратегия нового сотрудника: класс (экземпляр на каждого) или общий
+    # экземпляр
+    _default_strategy: Any = BaseSalaryStrategy
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        salary_strategy: SalaryCalculationStrategy = None,
+    ):
+        """Инициализация сотрудника.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Полное имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            salary_strategy: Стратегия расчета зарплаты
+        """
+        EmployeeValidator.validate_employee(emp_id, name, base_salary)
+
+        # У нового сотрудника нет наблюдателей и кэша: __setattr__ не нужен
+        _set_field(self, "_observers", ())
+        _set_field(self, "_salary_cache", None)
+        _set_field(self, "id", emp_id)
+        _set_field(self, "name", name)
+        _set_field(self, "department", department)
+        _set_field(self, "base_salary", base_salary)
+        _set_field(self, "salary_strategy", salary_strategy or BaseSalaryStrategy())
+
+    def __init_subclass__(cls, **kwargs):
+        """Отключить from_rows() у наследника с собственным __init__.
+
+        Наследник, переопределивший конструктор, должен сам объявить
+        ``_init_fields``, иначе from_rows() вызывает конструктор.
+        """
+        super().__init_subclass__(**kwargs)
+        if "__init__" in cls.__dict__ and "_init_fields" not in cls.__dict__:
+            cls._init_fields = None
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[tuple]) -> List["BaseEmployee"]:
+        """Создать сотрудников из уже проверенных строк.
+
+        Поля записываются по колонкам, без проверок и уведомлений
+        конструктора: у нового сотрудника еще нет наблюдателей и кэша.
+
+        Args:
+            rows: Значения в порядке аргументов конструктора, прошедшие
+                проверку EmployeeValidator
+
+        Returns:
+            Сотрудники в порядке строк
+        """
+        if cls._init_fields is None:
+            return list(starmap(cls, rows))
+        created = list(map(object.__new__, repeat(cls, len(rows))))
+        _fill(created, "_observers", repeat(()))
+        _fill(created, "_salary_cache", repeat(None))
+        strategy = cls._default_strategy
+        if isinstance(strategy, type):
+            strategies: Iterable = starmap(strategy, repeat((), len(rows)))
+        else:
+            strategies = repeat(strategy)
+        _fill(created, "salary_strategy", strategies)
+        for index, field in enumerate(cls._init_fields):
+            _fill(created, field, map(itemgetter(index), rows))
+        return created
+
+    def __setattr__(self, field: str, value) -> None:
+        """Присвоение атрибута со сбросом кэша и уведомлением наблюдателей.
+
+        Наблюдатели получают вызов
+        ``on_employee_changed(employee, field, old_value, new_value)``
+        для каждого публичного поля.
+        """
+        if field[0] != "_":
+            try:
+                cache = self._salary_cache
+                observers = self._observers
+            except AttributeError:
+                # Служебные поля еще не заполнены (создание объекта)
+                cache, observers = None, ()
+            if cache is not None and (
+                field == "salary_strategy" or field in self.salary_strategy.depends_on
+            ):
+                _set_field(self, "_salary_cache", None)
+            if observers:
+                old_value = getattr(self, field, None)
+                _set_field(self, field, value)
+                for observer in observers:
+                    observer.on_employee_changed(self, field, old_value, value)
+                return
+        _set_field(self, field, value)
+
+    def add_observer(self, observer) -> None:
+        """Подписать наблюдателя на изменения полей сотрудника.
+
+        Args:
+            observer: Объект с методом ``on_employee_changed``
+        """
+        if not any(o is observer for o in self._observers):
+            self._observers += (observer,)
+
+    def remove_observer(self, observer) -> None:
+        """Отписать наблюдателя.
+
+        Args:
+            observer: Объект-наблюдатель
+        """
+        self._observers = tuple(o for o in self._observers if o is not observer)
+
+    def affects_salary(self, field: str) -> bool:
+        """Влияет ли поле на результат calculate_salary().
+
+        Args:
+            field: Имя атрибута
+
+        Returns:
+            True для стратегии и полей, от которых она зависит
+        """
+        return field == "salary_strategy" or field in self.salary_strategy.depends_on
+
+    def calculate_salary(self) -> float:
+        """Расчет зарплаты через стратегию (с кэшированием)."""
+        salary = self._salary_cache
+        if salary is not None:
+            if BaseEmployee._salary_cache_stats is not None:
+                self._count_salary_cache("hits")
+            return salary
+        if BaseEmployee._salary_cache_stats is not None:
+            self._count_salary_cache("misses")
+        strategy = self.salary_strategy
+        salary = strategy.calculate(self)
+        if strategy.cacheable:
+            self._salary_cache = salary
+        return salary
+
+    @classmethod
+    def _count_salary_cache(cls, counter: str) -> None:
+        """Увеличить счетчик кэша зарплат, если подсчет включен."""
+        with cls._salary_cache_stats_lock:
+            stats = BaseEmployee._salary_cache_stats
+            if stats is not None:
+                stats[counter] += 1
+
+    @classmethod
+    def enable_salary_cache_stats(cls, enabled: bool = True) -> None:
+        """Включить или выключить подсчет попаданий в кэш зарплат.
+
+        Подсчет общий для всех сотрудников и идет под блокировкой,
+        поэтому по умолчанию выключен и не замедляет расчет.
+
+        Args:
+            enabled: True - вести счетчики (с нуля), False - не вести
+        """
+        with cls._salary_cache_stats_lock:
+            BaseEmployee._salary_cache_stats = (
+                {"hits": 0, "misses": 0} if enabled else None
+            )
+
+    @classmethod
+    def salary_cache_stats(cls) -> dict:
+        """Счетчики попаданий и промахов кэша зарплат.
+
+        Returns:
+            Словарь с ключами hits и misses (нули, если подсчет выключен)
+        """
+        with cls._salary_cache_stats_lock:
+            return dict(BaseEmployee._salary_cache_stats or {"hits": 0, "misses": 0})
+
+    @classmethod
+    def reset_salary_cache_stats(cls) -> None:
+        """Обнулить счетчики кэша зарплат."""
+        with cls._salary_cache_stats_lock:
+            stats = BaseEmployee._salary_cache_stats
+            if stats is not None:
+                stats["hits"] = stats["misses"] = 0
+
+    def get_info(self) -> str:
+        """Получить информацию о сотруднике."""
+        return f"{self.name} ({self.department}): " f"{self.calculate_salary()} руб."
+
+    def __str__(self) -> str:
+        """Строковое представление."""
+        return self.get_info()
+
+    def __eq__(self, other: "BaseEmployee") -> bool:
+        """Сравнение по ID."""
+        if not isinstance(other, BaseEmployee):
+            return False
+        return self.id == other.id
+
+    def __lt__(self, other: "BaseEmployee") -> bool:
+        """Сравнение по зарплате."""
+        if not isinstance(other, BaseEmployee):
+            return NotImplemented
+        return self.calculate_salary() < other.calculate_salary()
+
+    def __add__(self, other: "BaseEmployee") -> float:
+        """Сложение зарплат."""
+        if not isinstance(other, BaseEmployee):
+            return NotImplemented
+        return self.calculate_salary() + other.calculate_salary()
+
+
+def _fill(objects: List[Any], field: str, column: Iterable) -> None:
+    """Записать колонку значений в поле объектов (цикл на уровне C)."""
+    deque(map(_set_field, objects, repeat(field), column), maxlen=0)
+
+
+class Employee(BaseEmployee):
+    """Базовый класс сотрудника.
+
+    В отличие от компактных классов (модуль ``compact``) допускает
+    произвольные дополнительные атрибуты.
+    """
+
+
+class Manager(Employee):
+    """Менеджер с бонусом."""
+
+    _init_fields = BaseEmployee._init_fields + ("bonus",)
+    _default_strategy = ManagerSalaryStrategy
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        bonus: float,
+    ):
+        """Инициализация менеджера.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            bonus: Бонус
+        """
+        super().__init__(emp_id, name, department, base_salary, ManagerSalaryStrategy())
+        self.bonus = bonus
+
+    def get_info(self) -> str:
+        """Получить информацию о менеджере."""
+        return (
+            f"{self.name} ({self.department}): "
+            f"{self.calculate_salary()} руб. (бонус: {self.bonus})"
+        )
+
+
+class Developer(Employee):
+    """Разработчик с уровнем квалификации."""
+
+    _init_fields = BaseEmployee._init_fields + ("skills", "level")
+    _default_strategy = DeveloperSalaryStrategy
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        skills: list,
+        level: str,
+    ):
+        """Инициализация разработчика.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            skills: Список навыков
+            level: Уровень квалификации (junior/middle/senior)
+        """
+        super().__init__(
+            emp_id, name, department, base_salary, DeveloperSalaryStrategy()
+        )
+        self.skills = skills
+        self.level = level
+
+    def add_skill(self, skill: str) -> None:
+        """Добавить навык разработчику.
+
+        Args:
+            skill: Название навыка
+        """
+        if skill not in self.skills:
+            self.skills.append(skill)
+
+    def get_info(self) -> str:
+        """Получить информацию о разработчике."""
+        skills_str = ", ".join(self.skills)
+        return (
+            f"{self.name} ({self.department}, {self.level}): "
+            f"{self.calculate_salary()} руб. Навыки: {skills_str}"
+        )
+
+
+class Salesperson(Employee):
+    """Продавец с комиссией."""
+
+    _init_fields = BaseEmployee._init_fields + ("commission", "sales")
+    _default_strategy = SalespersonSalaryStrategy
+
+    def __init__(
+        self,
+        emp_id: int,
+        name: str,
+        department: str,
+        base_salary: float,
+        commission: float,
+        sales: float,
+    ):
+        """Инициализация продавца.
+
+        Args:
+            emp_id: Уникальный ID
+            name: Имя
+            department: Отдел
+            base_salary: Базовая зарплата
+            commission: Процент комиссии (например 0.15 для 15%)
+            sales: Сумма продаж
+        """
+        super().__init__(
+            emp_id,
+            name,
+            department,
+            base_salary,
+            SalespersonSalaryStrategy(),
+        )
+        self.commission = commission
+        self.sales = sales
+
+    def get_info(self) -> str:
+        """Получить информацию о продавце."""
+        return (
+            f"{self.name} ({self.department}): "
+            f"{self.calculate_salary()} руб. "
+            f"(Продажи: {self.sales} руб.)"
+        )
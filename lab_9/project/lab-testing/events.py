@@ -0,0 +1,301 @@
+"""Лента изменений (change data capture) по сотрудникам.
+
+Компания, отделы, проекты и хранилища публикуют в ``ChangeFeed``
+типизированные события с монотонным порядковым номером. Лента хранит
+последние события в кольцевом буфере; потребители читают ее с нужного
+номера и получают только новые изменения.
+"""
+
+import threading
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, List, Optional, Type
+
+
+class ChangeEvent:
+    """Событие изменения состава или данных сотрудника."""
+
+    __slots__ = ("sequence", "source", "employee_id", "field", "old_value", "new_value")
+
+    kind = "changed"
+
+    def __init__(
+        self,
+        sequence: int,
+        source: str,
+        employee_id: int,
+        field: Optional[str] = None,
+        old_value: Any = None,
+        new_value: Any = None,
+    ):
+        """Инициализация события.
+
+        Args:
+            sequence: Порядковый номер в ленте
+            source: Источник (например ``company`` или ``department:IT``)
+            employee_id: ID сотрудника
+            field: Измененное поле (для событий изменения)
+            old_value: Прежнее значение поля
+            new_value: Новое значение поля
+        """
+        self.sequence = sequence
+        self.source = source
+        self.employee_id = employee_id
+        self.field = field
+        self.old_value = old_value
+        self.new_value = new_value
+
+    def __repr__(self) -> str:
+        """Представление для отладки."""
+        details = ""
+        if self.field is not None:
+            details = f", {self.field}: {self.old_value!r} -> {self.new_value!r}"
+        return (
+            f"{type(self).__name__}(#{self.sequence}, {self.source}, "
+            f"id={self.employee_id}{details})"
+        )
+
+
+class EmployeeHired(ChangeEvent):
+    """Сотрудник появился в источнике."""
+
+    __slots__ = ()
+    kind = "hired"
+
+
+class EmployeeRemoved(ChangeEvent):
+    """Сотрудник удален из источника."""
+
+    __slots__ = ()
+    kind = "removed"
+
+
+class SalaryFieldChanged(ChangeEvent):
+    """Изменилось поле, от которого зависит зарплата."""
+
+    __slots__ = ()
+    kind = "salary_changed"
+
+
+class DepartmentMoved(ChangeEvent):
+    """Сотрудник переведен в другой отдел (поле department)."""
+
+    __slots__ = ()
+    kind = "department_moved"
+
+
+class ChangeFeedGapError(LookupError):
+    """Запрошенные события уже вытеснены из кольцевого буфера.
+
+    Потребителю нужно заново загрузить полный состав и продолжить
+    чтение с ``ChangeFeed.first_sequence``.
+    """
+
+
+class ChangeFeed:
+    """Лента событий с кольцевым буфером и подписками.
+
+    Номера событий начинаются с 1 и растут без пропусков. В буфере
+    хранятся последние ``capacity`` событий.
+    """
+
+    def __init__(self, capacity: int = 10_000):
+        """Инициализация пустой ленты.
+
+        Args:
+            capacity: Размер кольцевого буфера
+
+        Raises:
+            ValueError: Если capacity не положителен
+        """
+        if capacity <= 0:
+            raise ValueError("Размер буфера должен быть положительным")
+        self._events: deque = deque(maxlen=capacity)
+        self._next_sequence = 1
+        self._subscribers: List[Callable[[ChangeEvent], None]] = []
+        self._lock = threading.RLock()
+
+    @property
+    def first_sequence(self) -> int:
+        """Номер самого старого события в буфере (или следующего)."""
+        with self._lock:
+            return self._next_sequence - len(self._events)
+
+    @property
+    def last_sequence(self) -> int:
+        """Номер последнего опубликованного события (0 - событий не было)."""
+        return self._next_sequence - 1
+
+    def publish(
+        self,
+        event_type: Type[ChangeEvent],
+        source: str,
+        employee_id: int,
+        field: Optional[str] = None,
+        old_value: Any = None,
+        new_value: Any = None,
+    ) -> ChangeEvent:
+        """Опубликовать событие и передать его подписчикам.
+
+        Args:
+            event_type: Класс события
+            source: Источник события
+            employee_id: ID сотрудника
+            field: Измененное поле
+            old_value: Прежнее значение
+            new_value: Новое значение
+
+        Returns:
+            Опубликованное событие
+        """
+        with self._lock:
+            event = event_type(
+                self._next_sequence, source, employee_id, field, old_value, new_value
+            )
+            self._next_sequence += 1
+            self._events.append(event)
+            subscribers = list(self._subscribers)
+        # Подписчики вызываются вне блокировки: они могут публиковать
+        # и читать ленту из других потоков без взаимной блокировки
+        for callback in subscribers:
+            callback(event)
+        return event
+
+    def read(self, offset: int, limit: Optional[int] = None) -> List[ChangeEvent]:
+        """События с номером не меньше offset.
+
+        Args:
+            offset: Номер первого нужного события
+            limit: Максимум событий (None - все доступные)
+
+        Returns:
+            Список событий по возрастанию номера
+
+        Raises:
+            ChangeFeedGapError: Если часть событий уже вытеснена из буфера
+        """
+        with self._lock:
+            first = self._next_sequence - len(self._events)
+            if offset < first:
+                raise ChangeFeedGapError(
+                    f"События до #{first} вытеснены из буфера (запрошено #{offset})"
+                )
+            start = offset - first
+            stop = None if limit is None else start + limit
+            return list(islice(self._events, start, stop))
+
+    def subscribe(
+        self, callback: Callable[[ChangeEvent], None], offset: Optional[int] = None
+    ) -> None:
+        """Подписаться на события.
+
+        Если указан offset, сначала передаются накопленные события
+        начиная с этого номера, затем новые - без пропусков и повторов.
+
+        Args:
+            callback: Функция, получающая каждое событие
+            offset: Номер первого события (None - только новые)
+
+        Raises:
+            ChangeFeedGapError: Если часть событий уже вытеснена из буфера
+        """
+        with self._lock:
+            if offset is not None:
+                for event in self.read(offset):
+                    callback(event)
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        """Отписаться от событий.
+
+        Args:
+            callback: Ранее подписанная функция
+        """
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def cursor(self, offset: Optional[int] = None) -> "ChangeCursor":
+        """Курсор для чтения ленты по мере надобности.
+
+        Args:
+            offset: Номер первого события (None - только новые)
+
+        Returns:
+            Курсор ленты
+        """
+        return ChangeCursor(self, self._next_sequence if offset is None else offset)
+
+
+class ChangeCursor:
+    """Позиция потребителя в ленте изменений."""
+
+    def __init__(self, feed: ChangeFeed, offset: int):
+        """Инициализация курсора.
+
+        Args:
+            feed: Лента изменений
+            offset: Номер следующего непрочитанного события
+        """
+        self.feed = feed
+        self.offset = offset
+
+    def poll(self, limit: Optional[int] = None) -> List[ChangeEvent]:
+        """Получить новые события и сдвинуть курсор.
+
+        Args:
+            limit: Максимум событий за вызов
+
+        Returns:
+            Список новых событий (пустой, если изменений не было)
+
+        Raises:
+            ChangeFeedGapError: Если курсор отстал больше чем на размер буфера
+        """
+        events = self.feed.read(self.offset, limit)
+        if events:
+            self.offset = events[-1].sequence + 1
+        return events
+
+
+class ChangeSource:
+    """Примесь для объектов, публикующих события в ленту ``feed``."""
+
+    feed: Optional[ChangeFeed] = None
+
+    @property
+    def feed_source(self) -> str:
+        """Название источника в событиях."""
+        return type(self).__name__
+
+    def _publish(
+        self,
+        event_type: Type[ChangeEvent],
+        employee_id: int,
+        field: Optional[str] = None,
+        old_value: Any = None,
+        new_value: Any = None,
+    ) -> None:
+        """Опубликовать событие, если лента подключена."""
+        if self.feed is not None:
+            self.feed.publish(
+                event_type, self.feed_source, employee_id, field, old_value, new_value
+            )
+
+    def _publish_change(
+        self, employee, field: str, old_value: Any, new_value: Any
+    ) -> None:
+        """Опубликовать перевод в отдел или изменение поля зарплаты.
+
+        Args:
+            employee: Объект сотрудника
+            field: Имя измененного поля
+            old_value: Прежнее значение
+            new_value: Новое значение
+        """
+        if self.feed is None or old_value == new_value:
+            return
+        if field == "department":
+            self._publish(DepartmentMoved, employee.id, field, old_value, new_value)
+        elif employee.affects_salary(field):
+            self._publish(SalaryFieldChanged, employee.id, field, old_value, new_value)
@@ -0,0 +1,214 @@
+"""Параллельный расчет зарплат компании по отделам.
+
+Сотрудники превращаются в компактные строки
+``(вид, оклад, параметр1, параметр2)``, строки режутся на порции
+по отделам и считаются в пуле процессов. Итоги порций сводятся
+в ``PayrollResult``.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from strategies import (
+    BaseSalaryStrategy,
+    ManagerSalaryStrategy,
+    DeveloperSalaryStrategy,
+    SalespersonSalaryStrategy,
+    uses_strategy,
+)
+
+# Виды строк
+BASE = 0
+MANAGER = 1  # параметр1 - бонус
+DEVELOPER = 2  # параметр1 - коэффициент уровня
+SALESPERSON = 3  # параметр1 - комиссия, параметр2 - продажи
+PRECOMPUTED = 4  # оклад - уже рассчитанная зарплата
+
+Row = Tuple[int, float, float, float]
+Chunk = Tuple[Optional[str], List[Row]]
+
+
+def payroll_row(employee) -> Row:
+    """Компактная строка сотрудника для передачи в процесс.
+
+    Args:
+        employee: Объект сотрудника
+
+    Returns:
+        Кортеж (вид, оклад, параметр1, параметр2)
+    """
+    strategy = getattr(employee, "salary_strategy", None)
+    if strategy is None or not uses_strategy(type(employee)):
+        # Декоратор или класс со своим calculate_salary()
+        return (PRECOMPUTED, employee.calculate_salary(), 0, 0)
+    strategy_type = type(strategy)
+    if strategy_type is BaseSalaryStrategy:
+        return (BASE, employee.base_salary, 0, 0)
+    if strategy_type is ManagerSalaryStrategy:
+        return (MANAGER, employee.base_salary, getattr(employee, "bonus", 0), 0)
+    if strategy_type is DeveloperSalaryStrategy:
+        level = getattr(employee, "level", "junior")
+        multiplier = DeveloperSalaryStrategy.LEVEL_MULTIPLIERS.get(level, 1.0)
+        return (DEVELOPER, employee.base_salary, multiplier, 0)
+    if strategy_type is SalespersonSalaryStrategy:
+        return (
+            SALESPERSON,
+            employee.base_salary,
+            getattr(employee, "commission", 0),
+            getattr(employee, "sales", 0),
+        )
+    # Пользовательская стратегия считается в родительском процессе
+    return (PRECOMPUTED, employee.calculate_salary(), 0, 0)
+
+
+def _chunk_totals(chunk: Chunk) -> Tuple[Optional[str], float, int]:
+    """Сумма зарплат порции строк (выполняется в рабочем процессе).
+
+    Args:
+        chunk: Отдел и строки сотрудников
+
+    Returns:
+        Кортеж (отдел, сумма, количество)
+    """
+    department, rows = chunk
+    total = 0
+    for kind, base, first, second in rows:
+        if kind == MANAGER:
+            total += base + first
+        elif kind == DEVELOPER:
+            total += base * first
+        elif kind == SALESPERSON:
+            total += base + (second * first)
+        else:
+            total += base
+    return department, total, len(rows)
+
+
+class PayrollResult:
+    """Итоги расчета зарплат по отделам и по компании."""
+
+    def __init__(self) -> None:
+        """Инициализация пустого результата."""
+        self.total = 0
+        self.count = 0
+        self.department_totals: Dict[Optional[str], float] = {}
+        self.department_counts: Dict[Optional[str], int] = {}
+
+    def add(self, department: Optional[str], total: float, count: int) -> None:
+        """Учесть итоги одной порции.
+
+        Args:
+            department: Название отдела (None - сотрудники вне отделов)
+            total: Сумма зарплат порции
+            count: Количество сотрудников в порции
+        """
+        self.total += total
+        self.count += count
+        self.department_totals[department] = (
+            self.department_totals.get(department, 0) + total
+        )
+        self.department_counts[department] = (
+            self.department_counts.get(department, 0) + count
+        )
+
+    @property
+    def average(self) -> float:
+        """Средняя зарплата по компании или 0."""
+        if not self.count:
+            return 0.0
+        return self.total / self.count
+
+    def department_averages(self) -> Dict[Optional[str], float]:
+        """Средние зарплаты по отделам.
+
+        Returns:
+            Словарь {отдел: средняя зарплата}
+        """
+        return {
+            name: total / self.department_counts[name]
+            for name, total in self.department_totals.items()
+        }
+
+
+class ParallelPayrollRunner:
+    """Расчет зарплат компании в пуле процессов с шардированием по отделам."""
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 10_000):
+        """Инициализация.
+
+        Args:
+            workers: Количество процессов (None - по числу CPU)
+            chunk_size: Максимум строк в одной порции
+
+        Raises:
+            ValueError: Если chunk_size не положителен
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size должен быть положительным")
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self, company) -> Iterator[Chunk]:
+        """Порции строк компании.
+
+        Каждый сотрудник попадает в первый отдел, где он состоит;
+        сотрудники только из repository идут с отделом None.
+
+        Args:
+            company: Объект компании
+
+        Yields:
+            Кортежи (отдел, строки)
+        """
+        seen = set()
+        for dept in company.departments:
+            yield from self._split(dept.name, self._rows(dept, seen))
+        yield from self._split(None, self._rows(company.repository.get_all(), seen))
+
+    @staticmethod
+    def _rows(employees: Iterable, seen: set) -> Iterator[Row]:
+        """Строки сотрудников, еще не попавших в расчет."""
+        for employee in employees:
+            if employee.id not in seen:
+                seen.add(employee.id)
+                yield payroll_row(employee)
+
+    def _split(self, department: Optional[str], rows: Iterable[Row]) -> Iterator[Chunk]:
+        """Нарезать строки отдела на порции не длиннее chunk_size."""
+        chunk: List[Row] = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= self.chunk_size:
+                yield department, chunk
+                chunk = []
+        if chunk:
+            yield department, chunk
+
+    def run(self, company) -> PayrollResult:
+        """Рассчитать зарплаты в пуле процессов.
+
+        Args:
+            company: Объект компании
+
+        Returns:
+            Итоги по отделам и по компании
+        """
+        result = PayrollResult()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for totals in executor.map(_chunk_totals, self.iter_chunks(company)):
+                result.add(*totals)
+        return result
+
+    def run_serial(self, company) -> PayrollResult:
+        """Тот же расчет в текущем процессе (для сравнения).
+
+        Args:
+            company: Объект компании
+
+        Returns:
+            Итоги по отделам и по компании
+        """
+        result = PayrollResult()
+        for chunk in self.iter_chunks(company):
+            result.add(*_chunk_totals(chunk))
+        return result
@@ -1,376 +1,982 @@
-"""Паттерны проектирования (Singleton, Builder, Decorator, Repository)."""
-
-from typing import Dict, Optional
-from abc import ABC, abstractmethod
-from employee import Employee
-
-
-class SingletonMeta(type):
-    """Метакласс для реализации паттерна Singleton."""
-
-    _instances: Dict = {}
-
-    def __call__(cls, *args, **kwargs):
-        """Переопределение создания экземпляра.
-
-        Returns:
-            Единственный экземпляр класса
-        """
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
-
-
-class SingletonDatabase(metaclass=SingletonMeta):
-    """Синглтон база данных - Singleton паттерн."""
-
-    def __init__(self) -> None:
-        """Инициализация синглтона."""
-        self.data: Dict = {}
-
-    @classmethod
-    def get_instance(cls) -> "SingletonDatabase":
-        """Получить единственный экземпляр.
-
-        Returns:
-            Единственный экземпляр SingletonDatabase
-        """
-        return cls()
-
-    def add(self, key: str, value) -> None:
-        """Добавить данные.
-
-        Args:
-            key: Ключ
-            value: Значение
-        """
-        self.data[key] = value
-
-    def get(self, key: str):
-        """Получить данные по ключу.
-
-        Args:
-            key: Ключ
-
-        Returns:
-            Значение или None
-        """
-        return self.data.get(key)
-
-
-class EmployeeBuilder:
-    """Builder паттерн для создания сотрудников."""
-
-    def __init__(self) -> None:
-        """Инициализация строителя."""
-        self.emp_id: Optional[int] = None
-        self.name: Optional[str] = None
-        self.department: Optional[str] = None
-        self.base_salary: Optional[float] = None
-        self.bonus: Optional[float] = None
-        self.skills: Optional[list] = None
-        self.level: Optional[str] = None
-        self.seniority: Optional[str] = None
-        self.commission: Optional[float] = None
-        self.sales: Optional[float] = None
-
-    def set_id(self, emp_id: int) -> "EmployeeBuilder":
-        """Установить ID.
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.emp_id = emp_id
-        return self
-
-    def set_name(self, name: str) -> "EmployeeBuilder":
-        """Установить имя.
-
-        Args:
-            name: Имя сотрудника
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.name = name
-        return self
-
-    def set_department(self, department: str) -> "EmployeeBuilder":
-        """Установить отдел.
-
-        Args:
-            department: Название отдела
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.department = department
-        return self
-
-    def set_base_salary(self, salary: float) -> "EmployeeBuilder":
-        """Установить базовую зарплату.
-
-        Args:
-            salary: Размер зарплаты
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.base_salary = salary
-        return self
-
-    def set_bonus(self, bonus: float) -> "EmployeeBuilder":
-        """Установить бонус для менеджера.
-
-        Args:
-            bonus: Размер бонуса
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.bonus = bonus
-        return self
-
-    def set_skills(self, skills: list) -> "EmployeeBuilder":
-        """Установить навыки.
-
-        Args:
-            skills: Список навыков
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.skills = skills
-        return self
-
-    def set_level(self, level: str) -> "EmployeeBuilder":
-        """Установить уровень.
-
-        Args:
-            level: Уровень квалификации
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.level = level
-        return self
-
-    def set_seniority(self, seniority: str) -> "EmployeeBuilder":
-        """Установить seniorityность.
-
-        Args:
-            seniority: Уровень senior (alias for level)
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.seniority = seniority
-        self.level = seniority
-        return self
-
-    def set_commission(self, commission: float) -> "EmployeeBuilder":
-        """Установить комиссию.
-
-        Args:
-            commission: Размер комиссии
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.commission = commission
-        return self
-
-    def set_sales(self, sales: float) -> "EmployeeBuilder":
-        """Установить продажи.
-
-        Args:
-            sales: Сумма продаж
-
-        Returns:
-            Self для chain-вызовов
-        """
-        self.sales = sales
-        return self
-
-    def build(self) -> Employee:
-        """Построить объект сотрудника.
-
-        Returns:
-            Объект Employee
-
-        Raises:
-            ValueError: Если обязательные параметры не установлены
-        """
-        if (
-            self.emp_id is None
-            or self.name is None
-            or self.department is None
-            or self.base_salary is None
-        ):
-            raise ValueError(
-                "Не установлены обязательные параметры "
-                "(ID, name, department, base_salary)"
-            )
-
-        from employee import Manager, Developer, Salesperson
-
-        if self.bonus is not None:
-            return Manager(
-                self.emp_id,
-                self.name,
-                self.department,
-                self.base_salary,
-                self.bonus,
-            )
-
-        if self.level is not None or self.seniority is not None:
-            return Developer(
-                self.emp_id,
-                self.name,
-                self.department,
-                self.base_salary,
-                self.skills or [],
-                self.level or self.seniority or "junior",
-            )
-
-        if self.commission is not None:
-            return Salesperson(
-                self.emp_id,
-                self.name,
-                self.department,
-                self.base_salary,
-                self.commission,
-                self.sales or 0,
-            )
-
-        return Employee(self.emp_id, self.name, self.department, self.base_salary)
-
-
-class EmployeeDecorator:
-    """Decorator паттерн для добавления функциональности к сотруднику."""
-
-    def __init__(self, employee: Employee) -> None:
-        """Инициализация декоратора.
-
-        Args:
-            employee: Сотрудник для декорирования
-        """
-        self.employee = employee
-
-    def calculate_salary(self) -> float:
-        """Получить зарплату декорированного сотрудника.
-
-        Returns:
-            Размер зарплаты
-        """
-        return self.employee.calculate_salary()
-
-    def get_info(self) -> str:
-        """Получить информацию о сотруднике.
-
-        Returns:
-            Строка с информацией
-        """
-        return self.employee.get_info()
-
-
-class BonusDecorator(EmployeeDecorator):
-    """Добавляет премию к зарплате."""
-
-    def __init__(self, employee: Employee, bonus_amount: float) -> None:
-        """Инициализация.
-
-        Args:
-            employee: Сотрудник
-            bonus_amount: Размер дополнительной премии
-        """
-        super().__init__(employee)
-        self.bonus_amount = bonus_amount
-
-    def calculate_salary(self) -> float:
-        """Зарплата + дополнительная премия.
-
-        Returns:
-            Размер зарплаты с премией
-        """
-        return self.employee.calculate_salary() + self.bonus_amount
-
-    def get_info(self) -> str:
-        """Информация с примечанием о премии.
-
-        Returns:
-            Строка с информацией
-        """
-        return f"{self.employee.get_info()} + премия {self.bonus_amount}"
-
-
-class EmployeeRepository(ABC):
-    """Интерфейс для хранилища сотрудников."""
-
-    @abstractmethod
-    def add(self, employee: Employee) -> None:
-        """Добавить сотрудника.
-
-        Args:
-            employee: Объект сотрудника
-        """
-        pass
-
-    @abstractmethod
-    def find_by_id(self, emp_id: int) -> Optional[Employee]:
-        """Найти сотрудника по ID.
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            Объект сотрудника или None
-        """
-        pass
-
-    @abstractmethod
-    def get_all(self) -> list:
-        """Получить всех сотрудников.
-
-        Returns:
-            Список сотрудников
-        """
-        pass
-
-
-class InMemoryEmployeeRepository(EmployeeRepository):
-    """Хранилище сотрудников в памяти."""
-
-    def __init__(self) -> None:
-        """Инициализация хранилища."""
-        self.employees: Dict[int, Employee] = {}
-
-    def add(self, employee: Employee) -> None:
-        """Добавить сотрудника.
-
-        Args:
-            employee: Объект сотрудника
-        """
-        self.employees[employee.id] = employee
-
-    def find_by_id(self, emp_id: int) -> Optional[Employee]:
-        """Найти сотрудника по ID.
-
-        Args:
-            emp_id: ID сотрудника
-
-        Returns:
-            Объект сотрудника или None
-        """
-        return self.employees.get(emp_id)
-
-    def get_all(self) -> list:
-        """Получить всех сотрудников.
-
-        Returns:
-            Список сотрудников
-        """
-        return list(self.employees.values())
+"""Паттерны проектирования (Singleton, Builder, Decorator, Repository)."""
+
+import threading
+import weakref
+from collections.abc import MutableMapping
+from itertools import islice
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from abc import ABC, abstractmethod
+from compact import (
+    CompactEmployee,
+    CompactManager,
+    CompactDeveloper,
+    CompactSalesperson,
+)
+from employee import BaseEmployee, Employee, Manager, Developer, Salesperson
+from events import ChangeFeed, ChangeSource, EmployeeHired, EmployeeRemoved
+from validators import EmployeeValidator
+from wal import WriteAheadLog
+
+
+class SingletonMeta(type):
+    """Метакласс для реализации паттерна Singleton.
+
+    Экземпляр создается с блокировкой, своей для каждого класса
+    (двойная проверка): повторные вызовы читают готовый экземпляр без
+    блокировки, одновременные первые вызовы создают его один раз.
+    """
+
+    _instances: Dict = {}
+
+    def __init__(cls, name, bases, namespace) -> None:
+        """Создание класса со своей блокировкой инициализации."""
+        super().__init__(name, bases, namespace)
+        cls._singleton_lock = threading.Lock()
+
+    def __call__(cls, *args, **kwargs):
+        """Переопределение создания экземпляра.
+
+        Returns:
+            Единственный экземпляр класса
+        """
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with cls._singleton_lock:
+                instance = cls._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    # Публикуется только полностью инициализированный экземпляр
+                    cls._instances[cls] = instance
+        return instance
+
+
+class _ShardedDataView(MutableMapping):
+    """Живое представление данных SingletonDatabase как одного словаря.
+
+    Чтение и запись идут через методы базы под блокировками сегментов;
+    итерация обходит снимок ключей.
+    """
+
+    def __init__(self, database: "SingletonDatabase") -> None:
+        """Инициализация представления.
+
+        Args:
+            database: База данных
+        """
+        self._database = database
+
+    def __getitem__(self, key: Hashable):
+        """Значение по ключу.
+
+        Raises:
+            KeyError: Если ключа нет
+        """
+        database = self._database
+        index = database._shard(key)
+        with database._locks[index]:
+            return database._shards[index][key]
+
+    def __setitem__(self, key: Hashable, value) -> None:
+        """Записать значение."""
+        self._database.add(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        """Удалить ключ.
+
+        Raises:
+            KeyError: Если ключа нет
+        """
+        if not self._database.remove(key):
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Есть ли ключ."""
+        return key in self._database
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Ключи всех сегментов (каждый сегмент копируется под блокировкой)."""
+        database = self._database
+        for shard, lock in zip(database._shards, database._locks):
+            with lock:
+                keys = list(shard)
+            yield from keys
+
+    def __len__(self) -> int:
+        """Количество ключей."""
+        return len(self._database)
+
+    def __repr__(self) -> str:
+        """Представление как у словаря."""
+        return repr(dict(self.items()))
+
+
+class SingletonDatabase(metaclass=SingletonMeta):
+    """Синглтон база данных - Singleton паттерн.
+
+    Данные разбиты на сегменты по хэшу ключа, у каждого сегмента своя
+    блокировка, поэтому потоки, работающие с разными ключами, почти не
+    ждут друг друга. Пакетные операции берут блокировку каждого
+    затронутого сегмента один раз.
+    """
+
+    def __init__(self, shards: int = 16) -> None:
+        """Инициализация синглтона.
+
+        Args:
+            shards: Количество сегментов
+
+        Raises:
+            ValueError: Если shards не положителен
+        """
+        if shards <= 0:
+            raise ValueError("Количество сегментов должно быть положительным")
+        self._shards: List[Dict] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._data = _ShardedDataView(self)
+
+    @classmethod
+    def get_instance(cls) -> "SingletonDatabase":
+        """Получить единственный экземпляр.
+
+        Returns:
+            Единственный экземпляр SingletonDatabase
+        """
+        return cls()
+
+    def _shard(self, key: Hashable) -> int:
+        """Номер сегмента ключа."""
+        return hash(key) % len(self._shards)
+
+    def _group(self, keys: Iterable[Hashable]) -> Dict[int, list]:
+        """Позиции ключей, сгруппированные по сегментам."""
+        groups: Dict[int, list] = {}
+        for position, key in enumerate(keys):
+            groups.setdefault(self._shard(key), []).append(position)
+        return groups
+
+    @property
+    def data(self) -> MutableMapping:
+        """Все данные как изменяемый словарь.
+
+        Представление живое: запись и удаление через него попадают в
+        базу под блокировками сегментов.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, items: Mapping) -> None:
+        """Заменить все данные (не атомарно для параллельных записей)."""
+        items = dict(items)
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
+        self.add_many(items)
+
+    def add(self, key: str, value) -> None:
+        """Добавить данные.
+
+        Args:
+            key: Ключ
+            value: Значение
+        """
+        index = self._shard(key)
+        with self._locks[index]:
+            self._shards[index][key] = value
+
+    def add_many(self, items: Union[Mapping, Iterable[Tuple[Hashable, Any]]]) -> None:
+        """Добавить несколько значений.
+
+        Args:
+            items: Словарь или пары (ключ, значение)
+        """
+        items = list(items.items() if isinstance(items, Mapping) else items)
+        for index, positions in self._group(key for key, _ in items).items():
+            shard = self._shards[index]
+            with self._locks[index]:
+                for position in positions:
+                    key, value = items[position]
+                    shard[key] = value
+
+    def get(self, key: str):
+        """Получить данные по ключу.
+
+        Args:
+            key: Ключ
+
+        Returns:
+            Значение или None
+        """
+        index = self._shard(key)
+        with self._locks[index]:
+            return self._shards[index].get(key)
+
+    def get_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        """Получить несколько значений.
+
+        Args:
+            keys: Ключи
+
+        Returns:
+            Значения в порядке ключей (None для отсутствующих)
+        """
+        keys = list(keys)
+        values: List[Any] = [None] * len(keys)
+        for index, positions in self._group(keys).items():
+            shard = self._shards[index]
+            with self._locks[index]:
+                for position in positions:
+                    values[position] = shard.get(keys[position])
+        return values
+
+    def remove(self, key: str) -> bool:
+        """Удалить данные по ключу.
+
+        Args:
+            key: Ключ
+
+        Returns:
+            True если ключ был
+        """
+        index = self._shard(key)
+        shard = self._shards[index]
+        with self._locks[index]:
+            if key not in shard:
+                return False
+            del shard[key]
+            return True
+
+    def __len__(self) -> int:
+        """Количество ключей (сегменты считаются под своими блокировками)."""
+        count = 0
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                count += len(shard)
+        return count
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Есть ли ключ."""
+        index = self._shard(key)
+        with self._locks[index]:
+            return key in self._shards[index]
+
+
+class EmployeeBuilder:
+    """Builder паттерн для создания сотрудников."""
+
+    def __init__(self) -> None:
+        """Инициализация строителя."""
+        self.emp_id: Optional[int] = None
+        self.name: Optional[str] = None
+        self.department: Optional[str] = None
+        self.base_salary: Optional[float] = None
+        self.bonus: Optional[float] = None
+        self.skills: Optional[list] = None
+        self.level: Optional[str] = None
+        self.seniority: Optional[str] = None
+        self.commission: Optional[float] = None
+        self.sales: Optional[float] = None
+
+    def set_id(self, emp_id: int) -> "EmployeeBuilder":
+        """Установить ID.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.emp_id = emp_id
+        return self
+
+    def set_name(self, name: str) -> "EmployeeBuilder":
+        """Установить имя.
+
+        Args:
+            name: Имя сотрудника
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.name = name
+        return self
+
+    def set_department(self, department: str) -> "EmployeeBuilder":
+        """Установить отдел.
+
+        Args:
+            department: Название отдела
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.department = department
+        return self
+
+    def set_base_salary(self, salary: float) -> "EmployeeBuilder":
+        """Установить базовую зарплату.
+
+        Args:
+            salary: Размер зарплаты
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.base_salary = salary
+        return self
+
+    def set_bonus(self, bonus: float) -> "EmployeeBuilder":
+        """Установить бонус для менеджера.
+
+        Args:
+            bonus: Размер бонуса
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.bonus = bonus
+        return self
+
+    def set_skills(self, skills: list) -> "EmployeeBuilder":
+        """Установить навыки.
+
+        Args:
+            skills: Список навыков
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.skills = skills
+        return self
+
+    def set_level(self, level: str) -> "EmployeeBuilder":
+        """Установить уровень.
+
+        Args:
+            level: Уровень квалификации
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.level = level
+        return self
+
+    def set_seniority(self, seniority: str) -> "EmployeeBuilder":
+        """Установить seniorityность.
+
+        Args:
+            seniority: Уровень senior (alias for level)
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.seniority = seniority
+        self.level = seniority
+        return self
+
+    def set_commission(self, commission: float) -> "EmployeeBuilder":
+        """Установить комиссию.
+
+        Args:
+            commission: Размер комиссии
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.commission = commission
+        return self
+
+    def set_sales(self, sales: float) -> "EmployeeBuilder":
+        """Установить продажи.
+
+        Args:
+            sales: Сумма продаж
+
+        Returns:
+            Self для chain-вызовов
+        """
+        self.sales = sales
+        return self
+
+    def build(self) -> Employee:
+        """Построить объект сотрудника.
+
+        Returns:
+            Объект Employee
+
+        Raises:
+            ValueError: Если обязательные параметры не установлены
+        """
+        if (
+            self.emp_id is None
+            or self.name is None
+            or self.department is None
+            or self.base_salary is None
+        ):
+            raise ValueError(
+                "Не установлены обязательные параметры "
+                "(ID, name, department, base_salary)"
+            )
+
+        if self.bonus is not None:
+            return Manager(
+                self.emp_id,
+                self.name,
+                self.department,
+                self.base_salary,
+                self.bonus,
+            )
+
+        if self.level is not None or self.seniority is not None:
+            return Developer(
+                self.emp_id,
+                self.name,
+                self.department,
+                self.base_salary,
+                self.skills or [],
+                self.level or self.seniority or "junior",
+            )
+
+        if self.commission is not None:
+            return Salesperson(
+                self.emp_id,
+                self.name,
+                self.department,
+                self.base_salary,
+                self.commission,
+                self.sales or 0,
+            )
+
+        return Employee(self.emp_id, self.name, self.department, self.base_salary)
+
+
+def _no_extra(row: Mapping) -> tuple:
+    """Дополнительных параметров нет."""
+    return ()
+
+
+def _manager_extra(row: Mapping) -> tuple:
+    """Параметры менеджера из строки."""
+    return (row["bonus"],)
+
+
+def _developer_extra(row: Mapping) -> tuple:
+    """Параметры разработчика из строки (как в EmployeeBuilder)."""
+    level = row.get("level") or row.get("seniority") or "junior"
+    return (list(row.get("skills") or ()), level)
+
+
+def _salesperson_extra(row: Mapping) -> tuple:
+    """Параметры продавца из строки."""
+    return (row["commission"], row.get("sales") or 0)
+
+
+# Название типа -> (класс, компактный класс, параметры из словаря-строки)
+_FACTORY_TYPES: Dict[str, Tuple[type, type, Callable[[Mapping], tuple]]] = {
+    name: entry
+    for entry in (
+        (Employee, CompactEmployee, _no_extra),
+        (Manager, CompactManager, _manager_extra),
+        (Developer, CompactDeveloper, _developer_extra),
+        (Salesperson, CompactSalesperson, _salesperson_extra),
+    )
+    for name in (entry[0].__name__, entry[0].__name__.lower(), entry[1].__name__)
+}
+
+
+class EmployeeFactory:
+    """Массовое создание сотрудников из строк выгрузки.
+
+    Строка - словарь со столбцами ``type, id, name, department,
+    base_salary`` и параметрами типа (bonus; skills, level; commission,
+    sales) или кортеж ``(type, id, name, department, base_salary,
+    *параметры)`` в порядке аргументов конструктора. Без столбца type
+    тип определяется как в EmployeeBuilder.
+
+    Строки обрабатываются порциями: тип ищется в заранее построенной
+    таблице, столбцы порции проверяются до создания объектов, после
+    чего сотрудники каждого класса создаются его from_rows().
+    """
+
+    @staticmethod
+    def _infer_type(row: Mapping) -> str:
+        """Тип сотрудника по заполненным столбцам."""
+        if row.get("bonus") is not None:
+            return "manager"
+        if row.get("level") is not None or row.get("seniority") is not None:
+            return "developer"
+        if row.get("commission") is not None:
+            return "salesperson"
+        return "employee"
+
+    @staticmethod
+    def _reject(
+        rejected: Optional[list], number: int, row: Any, errors: List[str]
+    ) -> None:
+        """Отложить некорректную строку или сообщить об ошибке.
+
+        Raises:
+            ValueError: Если список rejected не задан
+        """
+        if rejected is None:
+            raise ValueError(f"Строка {number}: {'; '.join(errors)}")
+        rejected.append((number, row, errors))
+
+    @classmethod
+    def _prepare(
+        cls, rows: Sequence, start: int, compact: bool, rejected: Optional[list]
+    ) -> List[tuple]:
+        """Разобрать строки порции: тип, класс и значения полей.
+
+        Args:
+            rows: Порция строк
+            start: Номер первой строки порции
+            compact: Создавать компактных сотрудников
+            rejected: Список для некорректных строк (None - исключение)
+
+        Returns:
+            Список (номер, строка, класс, значения в порядке конструктора)
+        """
+        prepared = []
+        for number, row in enumerate(rows, start):
+            positional = isinstance(row, (tuple, list))
+            if positional:
+                type_name = row[0]
+            else:
+                type_name = row.get("type") or cls._infer_type(row)
+            entry = _FACTORY_TYPES.get(type_name)
+            if entry is None:
+                cls._reject(rejected, number, row, [f"неизвестный тип {type_name!r}"])
+                continue
+            employee_type, compact_type, extra = entry
+            if compact:
+                employee_type = compact_type
+            if positional:
+                values = tuple(row[1:])
+                expected = len(employee_type._init_fields)
+                if len(values) != expected:
+                    message = (
+                        f"для {employee_type.__name__} нужно {expected} "
+                        f"значений, получено {len(values)}"
+                    )
+                    cls._reject(rejected, number, row, [message])
+                    continue
+            else:
+                try:
+                    values = (
+                        row["id"],
+                        row["name"],
+                        row["department"],
+                        row["base_salary"],
+                    ) + extra(row)
+                except KeyError as error:
+                    message = f"нет столбца {error.args[0]}"
+                    cls._reject(rejected, number, row, [message])
+                    continue
+            prepared.append((number, row, employee_type, values))
+        return prepared
+
+    @classmethod
+    def _validate(
+        cls, prepared: List[tuple], seen: set, rejected: Optional[list]
+    ) -> List[tuple]:
+        """Проверить колонки ID, имен и окладов порции.
+
+        Args:
+            prepared: Результат _prepare
+            seen: ID предыдущих порций (дополняется)
+            rejected: Список для некорректных строк (None - исключение)
+
+        Returns:
+            Корректные строки prepared
+        """
+        columns = [entry[3] for entry in prepared]
+        codes = EmployeeValidator.validate_batch(
+            list(map(itemgetter(0), columns)),
+            list(map(itemgetter(1), columns)),
+            list(map(itemgetter(3), columns)),
+            seen,
+        )
+        if any(codes):
+            valid = []
+            for entry, code in zip(prepared, codes):
+                if code:
+                    errors = EmployeeValidator.describe(code)
+                    cls._reject(rejected, entry[0], entry[1], errors)
+                else:
+                    valid.append(entry)
+            prepared = valid
+        seen.update(entry[3][0] for entry in prepared)
+        return prepared
+
+    @classmethod
+    def create_many(
+        cls,
+        rows: Iterable[Union[Mapping, Sequence]],
+        compact: bool = False,
+        chunk_size: int = 1024,
+        rejected: Optional[list] = None,
+    ) -> Iterator[BaseEmployee]:
+        """Создать сотрудников из строк.
+
+        Args:
+            rows: Строки (словари или кортежи)
+            compact: Создавать компактных сотрудников (модуль compact)
+            chunk_size: Количество строк в порции
+            rejected: Список, в который откладываются некорректные строки
+                как (номер, строка, ошибки); None - первая ошибка
+                прерывает создание
+
+        Yields:
+            Сотрудники в порядке строк
+
+        Raises:
+            ValueError: Если строка некорректна и rejected не задан
+                (сообщение содержит номер строки, начиная с 0)
+        """
+        rows = iter(rows)
+        seen: set = set()
+        start = 0
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            prepared = cls._prepare(chunk, start, compact, rejected)
+            yield from cls._construct(cls._validate(prepared, seen, rejected))
+            start += len(chunk)
+
+    @staticmethod
+    def _construct(prepared: List[tuple]) -> List[BaseEmployee]:
+        """Создать сотрудников порции, заполняя поля по колонкам.
+
+        Args:
+            prepared: Проверенный результат _prepare
+
+        Returns:
+            Сотрудники в порядке строк
+        """
+        groups: Dict[type, Tuple[List[int], List[tuple]]] = {}
+        for position, (_, _, employee_type, values) in enumerate(prepared):
+            group = groups.get(employee_type)
+            if group is None:
+                group = groups[employee_type] = ([], [])
+            group[0].append(position)
+            group[1].append(values)
+
+        employees: List[Any] = [None] * len(prepared)
+        for employee_type, (positions, rows) in groups.items():
+            created = employee_type.from_rows(rows)
+            for position, employee in zip(positions, created):
+                employees[position] = employee
+        return employees
+
+
+class EmployeeDecorator:
+    """Decorator паттерн для добавления функциональности к сотруднику.
+
+    Каждый слой задает преобразование зарплаты ``salary * scale + offset``.
+    Стек слоев, не переопределяющих calculate_salary(), сворачивается в
+    одно такое преобразование; результат хранится во внешнем слое и
+    сбрасывается при изменении любого слоя этого стека.
+    """
+
+    # Слой-тождество; наследники переопределяют scale и offset
+    scale = 1.0
+    offset = 0.0
+    # Служебные атрибуты, присваивание которых не сбрасывает свертку
+    _SERVICE_ATTRS = frozenset({"_compiled", "_token", "_outer"})
+    # Метка актуальности свертки; заменяется новым объектом при изменении
+    _token: object = None
+    _compiled: Optional[Tuple[object, Any, float, float]] = None
+
+    def __init__(self, employee: Employee) -> None:
+        """Инициализация декоратора.
+
+        Args:
+            employee: Сотрудник для декорирования
+        """
+        self.employee = employee
+
+    def __setattr__(self, name: str, value) -> None:
+        """Присвоить атрибут и сбросить свертку этого стека."""
+        if name == "employee":
+            previous = self.__dict__.get("employee")
+            if isinstance(previous, EmployeeDecorator):
+                previous._outer_layers().discard(self)
+            if isinstance(value, EmployeeDecorator):
+                value._outer_layers().add(self)
+        object.__setattr__(self, name, value)
+        if name not in self._SERVICE_ATTRS:
+            self._invalidate()
+
+    def _outer_layers(self) -> "weakref.WeakSet[EmployeeDecorator]":
+        """Получить декораторы, оборачивающие этот слой.
+
+        Returns:
+            Множество внешних слоев (слабые ссылки)
+        """
+        return self.__dict__.setdefault("_outer", weakref.WeakSet())
+
+    def _invalidate(self) -> None:
+        """Сбросить свертку у этого слоя и у всех внешних слоев."""
+        pending = [self]
+        while pending:
+            layer = pending.pop()
+            # Новая метка, а не счетчик: параллельная свертка, начатая до
+            # изменения, сохранит устаревшую метку и не будет использована
+            object.__setattr__(layer, "_token", object())
+            pending.extend(layer.__dict__.get("_outer", ()))
+
+    def salary_transform(self) -> Tuple[Any, float, float]:
+        """Свернуть стек декораторов в одно преобразование.
+
+        Returns:
+            Кортеж (сотрудник под стеком, множитель, слагаемое):
+            зарплата = employee.calculate_salary() * множитель + слагаемое
+        """
+        token = self._token
+        compiled = self._compiled
+        if compiled is not None and compiled[0] is token:
+            return compiled[1:]
+        layer, scale, offset = self, 1.0, 0.0
+        while (
+            isinstance(layer, EmployeeDecorator)
+            and type(layer).calculate_salary is EmployeeDecorator.calculate_salary
+        ):
+            # Внешний слой применяется к результату внутреннего
+            offset += layer.offset * scale
+            scale *= layer.scale
+            layer = layer.employee
+        self._compiled = (token, layer, scale, offset)
+        return layer, scale, offset
+
+    def calculate_salary(self) -> float:
+        """Получить зарплату декорированного сотрудника.
+
+        Returns:
+            Размер зарплаты
+        """
+        employee, scale, offset = self.salary_transform()
+        if employee is self:
+            # Наследник переопределил calculate_salary() и вызвал super():
+            # свертка остановилась на нем, применяем только его слой
+            return self.employee.calculate_salary() * self.scale + self.offset
+        return employee.calculate_salary() * scale + offset
+
+    def get_info(self) -> str:
+        """Получить информацию о сотруднике.
+
+        Returns:
+            Строка с информацией
+        """
+        return self.employee.get_info()
+
+
+class BonusDecorator(EmployeeDecorator):
+    """Добавляет премию к зарплате."""
+
+    def __init__(self, employee: Employee, bonus_amount: float) -> None:
+        """Инициализация.
+
+        Args:
+            employee: Сотрудник
+            bonus_amount: Размер дополнительной премии
+        """
+        super().__init__(employee)
+        self.bonus_amount = bonus_amount
+
+    @property
+    def offset(self) -> float:
+        """Зарплата + дополнительная премия."""
+        return self.bonus_amount
+
+    def get_info(self) -> str:
+        """Информация с примечанием о премии.
+
+        Returns:
+            Строка с информацией
+        """
+        return f"{self.employee.get_info()} + премия {self.bonus_amount}"
+
+
+class TrainingDecorator(EmployeeDecorator):
+    """Увеличивает зарплату на процент за обучение."""
+
+    def __init__(self, employee: Employee, training_bonus: float) -> None:
+        """Инициализация.
+
+        Args:
+            employee: Сотрудник
+            training_bonus: Доля надбавки (0.1 - плюс 10%)
+        """
+        super().__init__(employee)
+        self.training_bonus = training_bonus
+
+    @property
+    def scale(self) -> float:
+        """Зарплата * (1 + надбавка за обучение)."""
+        return 1 + self.training_bonus
+
+    def get_info(self) -> str:
+        """Информация с примечанием о надбавке.
+
+        Returns:
+            Строка с информацией
+        """
+        return f"{self.employee.get_info()} + обучение {self.training_bonus:.0%}"
+
+
+class EmployeeRepository(ABC, ChangeSource):
+    """Интерфейс для хранилища сотрудников.
+
+    Реализации публикуют в ``feed`` событие EmployeeHired при каждом
+    сохранении (перезапись - тоже) и EmployeeRemoved при удалении.
+    """
+
+    feed_source = "repository"
+
+    @abstractmethod
+    def add(self, employee: Employee) -> None:
+        """Добавить сотрудника.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        pass
+
+    @abstractmethod
+    def find_by_id(self, emp_id: int) -> Optional[Employee]:
+        """Найти сотрудника по ID.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Объект сотрудника или None
+        """
+        pass
+
+    @abstractmethod
+    def get_all(self) -> list:
+        """Получить всех сотрудников.
+
+        Returns:
+            Список сотрудников
+        """
+        pass
+
+    def remove(self, emp_id: int) -> bool:
+        """Удалить сотрудника.
+
+        Хранилища, написанные до появления этого метода, его не
+        реализуют; для них удаление недоступно.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            True если удалился, False если не найден
+
+        Raises:
+            NotImplementedError: Если хранилище не поддерживает удаление
+        """
+        raise NotImplementedError(
+            f"{type(self).__name__} не поддерживает удаление сотрудников"
+        )
+
+
+class InMemoryEmployeeRepository(EmployeeRepository):
+    """Хранилище сотрудников в памяти.
+
+    С журналом ``wal`` состояние восстанавливается при создании,
+    а каждая операция сначала записывается в журнал.
+    """
+
+    def __init__(
+        self,
+        feed: Optional[ChangeFeed] = None,
+        wal: Optional[WriteAheadLog] = None,
+    ) -> None:
+        """Инициализация хранилища.
+
+        Args:
+            feed: Лента изменений (опционально)
+            wal: Журнал упреждающей записи (опционально)
+        """
+        self.wal = wal
+        self.employees: Dict[int, Employee] = wal.recover() if wal else {}
+        self.feed = feed
+
+    def _logged(self) -> None:
+        """Сохранить снимок, если журнал накопил достаточно операций."""
+        if self.wal.needs_checkpoint:
+            self.wal.checkpoint(self.employees.values())
+
+    def add(self, employee: Employee) -> None:
+        """Добавить сотрудника.
+
+        Args:
+            employee: Объект сотрудника
+        """
+        if self.wal is not None:
+            self.wal.log_save(employee)
+        self.employees[employee.id] = employee
+        if self.wal is not None:
+            self._logged()
+        self._publish(EmployeeHired, employee.id)
+
+    def find_by_id(self, emp_id: int) -> Optional[Employee]:
+        """Найти сотрудника по ID.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            Объект сотрудника или None
+        """
+        return self.employees.get(emp_id)
+
+    def get_all(self) -> list:
+        """Получить всех сотрудников.
+
+        Returns:
+            Список сотрудников
+        """
+        return list(self.employees.values())
+
+    def remove(self, emp_id: int) -> bool:
+        """Удалить сотрудника.
+
+        Args:
+            emp_id: ID сотрудника
+
+        Returns:
+            True если удалился, False если не найден
+        """
+        if emp_id not in self.employees:
+            return False
+        if self.wal is not None:
+            self.wal.log_delete(emp_id)
+        del self.employees[emp_id]
+        if self.wal is not None:
+            self._logged()
+        self._publish(EmployeeRemoved, emp_id)
+        return True
+
+    def close(self) -> None:
+        """Надежно записать журнал и закрыть его (если он задан)."""
+        if self.wal is not None:
+            self.wal.close()
@@ -0,0 +1,199 @@
+"""Колоночный движок расчета зарплат.
+
+Сотрудники раскладываются по колонкам (``array``): ID, код отдела,
+код источника расчета и зарплата. Зарплаты считаются пачкой через
+``strategies.calculate_batch`` - целыми колонками на каждую стратегию,
+с учетом декораторов (``salary_transform()``) и классов с собственным
+``calculate_salary()``.
+"""
+
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+from strategies import calculate_batch, uses_strategy
+
+
+def _source_name(employee) -> str:
+    """Название источника расчета зарплаты сотрудника.
+
+    Args:
+        employee: Объект сотрудника или декоратор
+
+    Returns:
+        Имя класса стратегии; для декораторов и классов со своим
+        ``calculate_salary()`` - имя класса объекта
+    """
+    strategy = getattr(employee, "salary_strategy", None)
+    if strategy is None or not uses_strategy(type(employee)):
+        return type(employee).__name__
+    return type(strategy).__name__
+
+
+def _code(names: List[str], index: Dict[str, int], name: str) -> int:
+    """Получить код названия, зарегистрировав его при необходимости.
+
+    Args:
+        names: Названия по кодам
+        index: Название -> код
+        name: Название
+
+    Returns:
+        Код названия
+    """
+    code = index.get(name)
+    if code is None:
+        code = index[name] = len(names)
+        names.append(name)
+    return code
+
+
+class PayrollTable:
+    """Таблица зарплат сотрудников в колонках.
+
+    Зарплаты добавленных сотрудников считаются одним пакетом при первом
+    чтении итогов после ``add()``; последующие изменения этих
+    сотрудников на таблицу не влияют.
+    """
+
+    def __init__(self) -> None:
+        """Инициализация пустой таблицы."""
+        self._ids = array("q")
+        self._dept_codes = array("l")
+        self._source_codes = array("l")
+        self._salaries = array("d")
+        self._pending: List = []
+        self._departments: List[str] = []
+        self._dept_index: Dict[str, int] = {}
+        self._sources: List[str] = []
+        self._source_index: Dict[str, int] = {}
+
+    @classmethod
+    def from_employees(
+        cls, employees: Iterable, department: Optional[str] = None
+    ) -> "PayrollTable":
+        """Построить таблицу по списку сотрудников.
+
+        Args:
+            employees: Сотрудники
+            department: Отдел для всех строк (по умолчанию
+                ``employee.department``)
+
+        Returns:
+            Заполненная таблица
+        """
+        table = cls()
+        for employee in employees:
+            table.add(employee, department)
+        return table
+
+    @classmethod
+    def from_departments(cls, departments: Iterable) -> "PayrollTable":
+        """Построить таблицу по отделам.
+
+        Сотрудник, состоящий в нескольких отделах, учитывается один раз
+        (в первом отделе).
+
+        Args:
+            departments: Объекты отделов
+
+        Returns:
+            Заполненная таблица
+        """
+        table = cls()
+        seen = set()
+        for dept in departments:
+            for employee in dept:
+                if employee.id not in seen:
+                    seen.add(employee.id)
+                    table.add(employee, dept.name)
+        return table
+
+    def add(self, employee, department: Optional[str] = None) -> None:
+        """Добавить сотрудника в таблицу.
+
+        Декоратор учитывается с ID и отделом декорированного сотрудника.
+
+        Args:
+            employee: Объект сотрудника или декоратор
+            department: Название отдела (по умолчанию из сотрудника)
+        """
+        transform = getattr(employee, "salary_transform", None)
+        person = employee if transform is None else transform()[0]
+        if department is None:
+            department = person.department
+        dept_code = _code(self._departments, self._dept_index, department)
+        source_code = _code(self._sources, self._source_index, _source_name(employee))
+        self._ids.append(person.id)
+        self._dept_codes.append(dept_code)
+        self._source_codes.append(source_code)
+        self._pending.append(employee)
+
+    def _salary_column(self) -> array:
+        """Колонка зарплат с досчитанными новыми строками."""
+        if self._pending:
+            self._salaries.extend(calculate_batch(self._pending))
+            self._pending = []
+        return self._salaries
+
+    def __len__(self) -> int:
+        """Количество строк в таблице."""
+        return len(self._ids)
+
+    def total(self) -> float:
+        """Общая сумма зарплат.
+
+        Returns:
+            Сумма по всем строкам
+        """
+        return sum(self._salary_column())
+
+    def average(self) -> float:
+        """Средняя зарплата.
+
+        Returns:
+            Средняя зарплата или 0
+        """
+        count = len(self)
+        if not count:
+            return 0.0
+        return self.total() / count
+
+    def _sums(self, codes: array, size: int):
+        """Суммы и количества зарплат по кодам колонки."""
+        totals = [0.0] * size
+        counts = [0] * size
+        for code, salary in zip(codes, self._salary_column()):
+            totals[code] += salary
+            counts[code] += 1
+        return totals, counts
+
+    def totals_by_strategy(self) -> Dict[str, float]:
+        """Суммы зарплат по источникам расчета.
+
+        Returns:
+            Словарь {имя класса стратегии (или декоратора, или класса
+            с собственным calculate_salary()): сумма}
+        """
+        totals, _ = self._sums(self._source_codes, len(self._sources))
+        return dict(zip(self._sources, totals))
+
+    def department_totals(self) -> Dict[str, float]:
+        """Суммы зарплат по отделам.
+
+        Returns:
+            Словарь {отдел: сумма}
+        """
+        totals, _ = self._sums(self._dept_codes, len(self._departments))
+        return dict(zip(self._departments, totals))
+
+    def department_averages(self) -> Dict[str, float]:
+        """Средние зарплаты по отделам.
+
+        Returns:
+            Словарь {отдел: средняя зарплата}
+        """
+        totals, counts = self._sums(self._dept_codes, len(self._departments))
+        return {
+            name: total / count
+            for name, total, count in zip(self._departments, totals, counts)
+        }
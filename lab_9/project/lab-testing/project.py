@@ -1,33 +1,45 @@
-"""Класс проекта"""
-
-
-class Project:
-    """Проект с командой"""
-
-    VALID_STATUSES = ["planning", "in_progress", "completed"]
-
-    def __init__(self, proj_id, name, description, deadline, status):
-        if status not in self.VALID_STATUSES:
-            raise ValueError(f"Invalid status: {status}")
-
-        self.id = proj_id
-        self.name = name
-        self.description = description
-        self.deadline = deadline
-        self.status = status
-        self._team = []
-
-    def add_team_member(self, employee):
-        self._team.append(employee)
-
-    def remove_team_member(self, emp_id):
-        self._team = [e for e in self._team if e.id != emp_id]
-
-    def get_team(self):
-        return self._team
-
-    def get_team_size(self):
-        return len(self._team)
-
-    def calculate_total_salary(self):
-        return sum(emp.calculate_salary() for emp in self._team)
+"""Класс проекта"""
+
+from events import ChangeSource, EmployeeHired, EmployeeRemoved
+from strategies import calculate_batch
+
+
+class Project(ChangeSource):
+    """Проект с командой"""
+
+    VALID_STATUSES = ["planning", "in_progress", "completed"]
+
+    def __init__(self, proj_id, name, description, deadline, status, feed=None):
+        if status not in self.VALID_STATUSES:
+            raise ValueError(f"Invalid status: {status}")
+
+        self.id = proj_id
+        self.name = name
+        self.description = description
+        self.deadline = deadline
+        self.status = status
+        self.feed = feed
+        self._team = []
+
+    @property
+    def feed_source(self):
+        return f"project:{self.name}"
+
+    def add_team_member(self, employee):
+        self._team.append(employee)
+        self._publish(EmployeeHired, employee.id)
+
+    def remove_team_member(self, emp_id):
+        size = len(self._team)
+        self._team = [e for e in self._team if e.id != emp_id]
+        if len(self._team) != size:
+            self._publish(EmployeeRemoved, emp_id)
+
+    def get_team(self):
+        return self._team
+
+    def get_team_size(self):
+        return len(self._team)
+
+    def calculate_total_salary(self):
+        return sum(calculate_batch(self._team))
@@ -1,79 +1,1304 @@
-"""Интерфейсы и реализации хранилищ данных."""
-
-from abc import ABC, abstractmethod
-from typing import Any, List, Optional
-
-
-class EmployeeRepository(ABC):
-    """Интерфейс для работы с хранилищем сотрудников."""
-
-    @abstractmethod
-    def get_employee(self, emp_id: int) -> Optional[Any]:
-        """Получить сотрудника по ID."""
-
-    @abstractmethod
-    def save_employee(self, employee: Any) -> None:
-        """Сохранить сотрудника."""
-
-    @abstractmethod
-    def get_all_employees(self) -> List[Any]:
-        """Получить всех сотрудников."""
-
-    @abstractmethod
-    def delete_employee(self, emp_id: int) -> bool:
-        """Удалить сотрудника."""
-
-
-class InMemoryEmployeeRepository(EmployeeRepository):
-    """Реализация хранилища в памяти (для тестов)."""
-
-    def __init__(self):
-        """Инициализация пустого словаря."""
-        self.employees = {}
-
-    def get_employee(self, emp_id: int) -> Optional[Any]:
-        """Получить из памяти."""
-        return self.employees.get(emp_id)
-
-    def save_employee(self, employee: Any) -> None:
-        """Сохранить в память."""
-        self.employees[employee.id] = employee
-
-    def get_all_employees(self) -> List[Any]:
-        """Получить все из памяти."""
-        return list(self.employees.values())
-
-    def delete_employee(self, emp_id: int) -> bool:
-        """Удалить из памяти."""
-        if emp_id in self.employees:
-            del self.employees[emp_id]
-            return True
-        return False
-
-
-class FileEmployeeRepository(EmployeeRepository):
-    """Реализация хранилища в файле (CSV)."""
-
-    def __init__(self, filename: str = "employees.csv"):
-        """Инициализация с файлом."""
-        self.filename = filename
-        self.employees = {}
-
-    def get_employee(self, emp_id: int) -> Optional[Any]:
-        """Получить из файла."""
-        return self.employees.get(emp_id)
-
-    def save_employee(self, employee: Any) -> None:
-        """Сохранить в файл."""
-        self.employees[employee.id] = employee
-
-    def get_all_employees(self) -> List[Any]:
-        """Получить все из файла."""
-        return list(self.employees.values())
-
-    def delete_employee(self, emp_id: int) -> bool:
-        """Удалить из файла."""
-        if emp_id in self.employees:
-            del self.employees[emp_id]
-            return True
-        return False
+"""Интерфейсы и реализации хранилищ данных."""
+
+import json
+import mmap
+import os
+import queue
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cache import CacheStats, LRUCache, PendingLoad
+from parallel_payroll import (
+    MANAGER,
+    DEVELOPER,
+    SALESPERSON,
+    PRECOMPUTED,
+    payroll_row,
+)
+from events import ChangeFeed, ChangeSource, EmployeeHired, EmployeeRemoved
+from serializers import EmployeeSerializer
+from wal import WriteAheadLog
+
+
+class EmployeeRepository(ABC, ChangeSource):
+    """Интерфейс для работы с хранилищем сотрудников.
+
+    Если задана лента ``feed``, реализации публикуют в нее
+    EmployeeHired при каждом сохранении и EmployeeRemoved при удалении.
+    """
+
+    feed_source = "repository"
+
+    @abstractmethod
+    def get_employee(self, emp_id: int) -> Optional[Any]:
+        """Получить сотрудника по ID."""
+
+    @abstractmethod
+    def save_employee(self, employee: Any) -> None:
+        """Сохранить сотрудника."""
+
+    @abstractmethod
+    def get_all_employees(self) -> List[Any]:
+        """Получить всех сотрудников."""
+
+    @abstractmethod
+    def delete_employee(self, emp_id: int) -> bool:
+        """Удалить сотрудника."""
+
+    def get_employees(self, emp_ids: Iterable[int]) -> List[Optional[Any]]:
+        """Получить сотрудников по списку ID.
+
+        Args:
+            emp_ids: ID сотрудников
+
+        Returns:
+            Сотрудники в порядке ID (None для ненайденных)
+        """
+        return [self.get_employee(emp_id) for emp_id in emp_ids]
+
+    def save_employees(self, employees: Iterable[Any]) -> None:
+        """Сохранить нескольких сотрудников.
+
+        Args:
+            employees: Объекты сотрудников
+        """
+        for employee in employees:
+            self.save_employee(employee)
+
+    def iter_employees(self) -> Iterator[Any]:
+        """Итератор по всем сотрудникам.
+
+        Yields:
+            Объекты сотрудников
+        """
+        return iter(self.get_all_employees())
+
+    def get_employee_ids(self) -> List[int]:
+        """ID всех сотрудников в порядке iter_employees().
+
+        Returns:
+            Список ID
+        """
+        return [employee.id for employee in self.iter_employees()]
+
+
+class InMemoryEmployeeRepository(EmployeeRepository):
+    """Реализация хранилища в памяти (для тестов).
+
+    С журналом ``wal`` состояние переживает перезапуск процесса.
+    """
+
+    def __init__(self, wal: Optional[WriteAheadLog] = None):
+        """Инициализация словаря (из журнала, если он задан).
+
+        Args:
+            wal: Журнал упреждающей записи (опционально)
+        """
+        self.wal = wal
+        self.employees = wal.recover() if wal else {}
+
+    def _logged(self) -> None:
+        """Сохранить снимок, если журнал накопил достаточно операций."""
+        if self.wal.needs_checkpoint:
+            self.wal.checkpoint(self.employees.values())
+
+    def get_employee(self, emp_id: int) -> Optional[Any]:
+        """Получить из памяти."""
+        return self.employees.get(emp_id)
+
+    def save_employee(self, employee: Any) -> None:
+        """Сохранить в память."""
+        if self.wal is not None:
+            self.wal.log_save(employee)
+        self.employees[employee.id] = employee
+        if self.wal is not None:
+            self._logged()
+        self._publish(EmployeeHired, employee.id)
+
+    def get_all_employees(self) -> List[Any]:
+        """Получить все из памяти."""
+        return list(self.employees.values())
+
+    def get_employee_ids(self) -> List[int]:
+        """ID из памяти."""
+        return list(self.employees)
+
+    def delete_employee(self, emp_id: int) -> bool:
+        """Удалить из памяти."""
+        if emp_id in self.employees:
+            if self.wal is not None:
+                self.wal.log_delete(emp_id)
+            del self.employees[emp_id]
+            if self.wal is not None:
+                self._logged()
+            self._publish(EmployeeRemoved, emp_id)
+            return True
+        return False
+
+    def close(self) -> None:
+        """Надежно записать журнал и закрыть его (если он задан)."""
+        if self.wal is not None:
+            self.wal.close()
+
+
+class FileEmployeeRepository(EmployeeRepository):
+    """Хранилище сотрудников в файле-журнале с индексом смещений.
+
+    Записи только дописываются в конец журнала ``filename``: заголовок
+    (операция, ID, длина, CRC32) и JSON с полями сотрудника. В памяти
+    хранится индекс {ID: (смещение, длина)}, поэтому чтение сотрудника -
+    одно позиционирование и одно чтение.
+
+    Записи копятся в буфере и сбрасываются на диск группой с одним
+    fsync: каждые ``batch_size`` операций или при flush(). Индекс
+    сохраняется в ``filename + ".idx"`` при checkpoint() и close();
+    при открытии читается индекс и дочитывается только хвост журнала
+    после него. Когда устаревшие записи занимают больше ``compact_ratio``
+    журнала, уплотнение запускается в фоновом потоке.
+    """
+
+    _LOG_MAGIC = b"EMPLOG01"
+    _INDEX_MAGIC = b"EMPIDX01"
+    # magic, поколение журнала
+    _LOG_HEADER = struct.Struct("<8sQ")
+    # magic, поколение, конец журнала, число записей, устаревшие байты
+    _INDEX_HEADER = struct.Struct("<8sQQQQ")
+    # операция, ID, длина данных, CRC32 данных
+    _RECORD = struct.Struct("<BqII")
+    _PUT = 1
+    _DELETE = 2
+
+    def __init__(
+        self,
+        filename: str,
+        batch_size: int = 64,
+        compact_ratio: float = 0.5,
+        compact_min_bytes: int = 1 << 20,
+        checkpoint_bytes: int = 4 << 20,
+    ):
+        """Открыть или создать хранилище.
+
+        Args:
+            filename: Путь к файлу журнала
+            batch_size: Количество операций в одной группе записи
+            compact_ratio: Доля устаревших данных для запуска уплотнения
+            compact_min_bytes: Минимум устаревших байт для уплотнения
+            checkpoint_bytes: Размер хвоста журнала без индекса,
+                после которого индекс сохраняется автоматически
+
+        Raises:
+            ValueError: Если файл не является журналом сотрудников
+                или журнал поврежден не в последней записи
+        """
+        self.filename = filename
+        self.index_filename = filename + ".idx"
+        self.batch_size = batch_size
+        self.compact_ratio = compact_ratio
+        self.compact_min_bytes = compact_min_bytes
+        self.checkpoint_bytes = checkpoint_bytes
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compactor: Optional[threading.Thread] = None
+        self._index: Dict[int, Tuple[int, int]] = {}
+        self._buffer = bytearray()
+        self._pending = 0
+        self._dead = 0
+
+        if not os.path.exists(filename):
+            with open(filename, "wb") as file:
+                file.write(self._LOG_HEADER.pack(self._LOG_MAGIC, 0))
+                file.flush()
+                os.fsync(file.fileno())
+        self._file = open(filename, "r+b")
+        magic, self._generation = self._LOG_HEADER.unpack(
+            self._file.read(self._LOG_HEADER.size)
+        )
+        if magic != self._LOG_MAGIC:
+            self._file.close()
+            raise ValueError(f"{filename} не является журналом сотрудников")
+        self._checkpoint_end = self._load_index()
+        try:
+            self._size = self._replay(self._checkpoint_end)
+        except ValueError:
+            self._file.close()
+            raise
+
+    def _load_index(self) -> int:
+        """Загрузить сохраненный индекс.
+
+        Returns:
+            Смещение в журнале, до которого индекс актуален
+        """
+        start = self._LOG_HEADER.size
+        try:
+            with open(self.index_filename, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            return start
+        header = self._INDEX_HEADER
+        if len(data) < header.size:
+            return start
+        magic, generation, log_end, count, dead = header.unpack_from(data)
+        body = memoryview(data)[header.size :]
+        if (
+            magic != self._INDEX_MAGIC
+            or generation != self._generation
+            or len(body) != count * 24
+            or log_end > os.fstat(self._file.fileno()).st_size
+        ):
+            # Индекс от другого поколения журнала - полное чтение журнала
+            return start
+        entries = array("q")
+        entries.frombytes(body)
+        if sys.byteorder != "little":
+            entries.byteswap()
+        self._index = dict(zip(entries[0::3], zip(entries[1::3], entries[2::3])))
+        self._dead = dead
+        return log_end
+
+    def _replay(self, start: int) -> int:
+        """Дочитать журнал с позиции start и обновить индекс.
+
+        Оборванная последняя запись (сбой во время записи) отрезается.
+        Поврежденная запись, за которой есть другие, не отрезается:
+        данные после нее остаются в файле, а открытие прерывается.
+
+        Args:
+            start: Смещение первой непрочитанной записи
+
+        Returns:
+            Смещение конца журнала
+
+        Raises:
+            ValueError: Если повреждена запись не в конце журнала
+        """
+        record = self._RECORD
+        file = self._file
+        size = os.fstat(file.fileno()).st_size
+        file.seek(start)
+        offset = start
+        while offset < size:
+            header = file.read(record.size)
+            if len(header) < record.size:
+                break
+            op, emp_id, length, crc = record.unpack(header)
+            end = offset + record.size + length
+            valid_op = op in (self._PUT, self._DELETE)
+            if end > size and valid_op:
+                # Запись не дописана до конца файла
+                break
+            payload = file.read(length) if end <= size else b""
+            if not valid_op or zlib.crc32(payload) != crc:
+                if end == size:
+                    break
+                raise ValueError(
+                    f"Запись журнала {self.filename} по смещению {offset} " "повреждена"
+                )
+            self._apply(op, emp_id, offset + record.size, length)
+            offset = end
+        if size > offset:
+            file.truncate(offset)
+        return offset
+
+    def _apply(self, op: int, emp_id: int, offset: int, length: int) -> None:
+        """Учесть запись журнала в индексе и счетчике устаревших байт."""
+        old = self._index.pop(emp_id, None)
+        if old is not None:
+            self._dead += self._RECORD.size + old[1]
+        if op == self._PUT:
+            self._index[emp_id] = (offset, length)
+        else:
+            self._dead += self._RECORD.size + length
+
+    def _encode(self, op: int, emp_id: int, payload: bytes) -> bytes:
+        """Заголовок и данные одной записи журнала."""
+        return (
+            self._RECORD.pack(op, emp_id, len(payload), zlib.crc32(payload)) + payload
+        )
+
+    def _append(self, op: int, emp_id: int, payload: bytes) -> None:
+        """Добавить запись в буфер группы (вызывается под блокировкой)."""
+        offset = self._size + len(self._buffer) + self._RECORD.size
+        self._buffer += self._encode(op, emp_id, payload)
+        self._apply(op, emp_id, offset, len(payload))
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def _read(self, offset: int, length: int) -> bytes:
+        """Прочитать данные записи с диска или из буфера группы."""
+        if offset >= self._size:
+            start = offset - self._size
+            return bytes(self._buffer[start : start + length])
+        self._file.seek(offset)
+        return self._file.read(length)
+
+    def _write_buffer(self) -> None:
+        """Записать буфер группы в журнал с одним fsync."""
+        if not self._buffer:
+            return
+        self._file.seek(self._size)
+        self._file.write(self._buffer)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._size += len(self._buffer)
+        self._buffer = bytearray()
+        self._pending = 0
+
+    def flush(self) -> None:
+        """Надежно записать накопленные операции на диск."""
+        with self._lock:
+            if not self._buffer:
+                return
+            self._write_buffer()
+            if self._size - self._checkpoint_end >= self.checkpoint_bytes:
+                self.checkpoint()
+            self._maybe_compact()
+
+    def checkpoint(self) -> None:
+        """Сохранить индекс, чтобы открытие не перечитывало журнал."""
+        with self._lock:
+            self._write_buffer()
+            entries = array("q")
+            for emp_id, (offset, length) in self._index.items():
+                entries.extend((emp_id, offset, length))
+            if sys.byteorder != "little":
+                entries.byteswap()
+            header = self._INDEX_HEADER.pack(
+                self._INDEX_MAGIC,
+                self._generation,
+                self._size,
+                len(self._index),
+                self._dead,
+            )
+            temp = self.index_filename + ".tmp"
+            with open(temp, "wb") as file:
+                file.write(header)
+                file.write(entries.tobytes())
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp, self.index_filename)
+            self._checkpoint_end = self._size
+
+    def _maybe_compact(self) -> None:
+        """Запустить фоновое уплотнение, если устаревших данных много."""
+        if (
+            self._dead >= self.compact_min_bytes
+            and self._dead > self.compact_ratio * self._size
+            and (self._compactor is None or not self._compactor.is_alive())
+        ):
+            self._compactor = threading.Thread(
+                target=self.compact, name="employee-log-compactor", daemon=True
+            )
+            self._compactor.start()
+
+    def compact(self) -> None:
+        """Переписать журнал, оставив только актуальные записи.
+
+        Основная часть копируется без блокировки хранилища: журнал
+        только дописывается, поэтому снятые смещения остаются верными.
+        Записи, добавленные за время копирования, переносятся под
+        блокировкой непосредственно перед заменой файла.
+        """
+        with self._compact_lock:
+            with self._lock:
+                self._write_buffer()
+                snapshot = sorted(self._index.items(), key=lambda item: item[1][0])
+                snapshot_end = self._size
+            temp = self.filename + ".compact"
+            index: Dict[int, Tuple[int, int]] = {}
+            with open(self.filename, "rb") as source, open(temp, "wb") as target:
+                target.write(self._LOG_HEADER.pack(self._LOG_MAGIC, 0))
+                position = self._LOG_HEADER.size
+                for emp_id, (offset, length) in snapshot:
+                    source.seek(offset)
+                    target.write(self._encode(self._PUT, emp_id, source.read(length)))
+                    index[emp_id] = (position + self._RECORD.size, length)
+                    position += self._RECORD.size + length
+                target.flush()
+                os.fsync(target.fileno())
+
+            with self._lock:
+                self._write_buffer()
+                self._file.seek(snapshot_end)
+                tail = self._file.read(self._size - snapshot_end)
+                dead = 0
+                generation = self._generation + 1
+                with open(temp, "r+b") as target:
+                    target.write(self._LOG_HEADER.pack(self._LOG_MAGIC, generation))
+                    target.seek(position)
+                    latest: Dict[int, Tuple[int, bytes]] = {}
+                    for op, emp_id, payload in self._iter_records(tail):
+                        latest.pop(emp_id, None)
+                        latest[emp_id] = (op, payload)
+                    for emp_id, (op, payload) in latest.items():
+                        old = index.pop(emp_id, None)
+                        if old is not None:
+                            dead += self._RECORD.size + old[1]
+                        if op == self._PUT:
+                            target.write(self._encode(op, emp_id, payload))
+                            index[emp_id] = (position + self._RECORD.size, len(payload))
+                            position += self._RECORD.size + len(payload)
+                    target.flush()
+                    os.fsync(target.fileno())
+                self._file.close()
+                os.replace(temp, self.filename)
+                self._file = open(self.filename, "r+b")
+                self._index = index
+                self._generation = generation
+                self._size = position
+                self._dead = dead
+                self.checkpoint()
+
+    def _iter_records(self, data: bytes) -> Iterator[Tuple[int, int, bytes]]:
+        """Записи из фрагмента журнала.
+
+        Args:
+            data: Байты целых записей журнала
+
+        Yields:
+            Кортежи (операция, ID, данные)
+        """
+        record = self._RECORD
+        offset = 0
+        while offset < len(data):
+            op, emp_id, length, _ = record.unpack_from(data, offset)
+            offset += record.size
+            yield op, emp_id, data[offset : offset + length]
+            offset += length
+
+    def get_employee(self, emp_id: int) -> Optional[Any]:
+        """Получить из файла."""
+        with self._lock:
+            entry = self._index.get(emp_id)
+            if entry is None:
+                return None
+            payload = self._read(*entry)
+        return EmployeeSerializer.from_dict(json.loads(payload))
+
+    def save_employee(self, employee: Any) -> None:
+        """Сохранить в файл."""
+        data = EmployeeSerializer.to_dict(employee)
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            self._append(self._PUT, employee.id, payload)
+        self._publish(EmployeeHired, employee.id)
+
+    def save_employees(self, employees: Iterable[Any]) -> None:
+        """Сохранить сотрудников и сразу записать группу на диск."""
+        for employee in employees:
+            self.save_employee(employee)
+        self.flush()
+
+    def get_all_employees(self) -> List[Any]:
+        """Получить все из файла (чтение в порядке расположения на диске)."""
+        with self._lock:
+            entries = sorted(self._index.values())
+            payloads = [self._read(offset, length) for offset, length in entries]
+        return [EmployeeSerializer.from_dict(json.loads(p)) for p in payloads]
+
+    def get_employee_ids(self) -> List[int]:
+        """ID из индекса в порядке расположения записей на диске."""
+        with self._lock:
+            return sorted(self._index, key=self._index.__getitem__)
+
+    def delete_employee(self, emp_id: int) -> bool:
+        """Удалить из файла."""
+        with self._lock:
+            if emp_id not in self._index:
+                return False
+            self._append(self._DELETE, emp_id, b"")
+        self._publish(EmployeeRemoved, emp_id)
+        return True
+
+    def __len__(self) -> int:
+        """Количество сотрудников в хранилище."""
+        return len(self._index)
+
+    def close(self) -> None:
+        """Дождаться уплотнения, сохранить индекс и закрыть журнал."""
+        compactor = self._compactor
+        if compactor is not None:
+            compactor.join()
+        with self._lock:
+            if self._file.closed:
+                return
+            self.checkpoint()
+            self._file.close()
+
+    def __enter__(self) -> "FileEmployeeRepository":
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Закрытие хранилища при выходе из контекста."""
+        self.close()
+
+
+class MmapEmployeeRepository(EmployeeRepository):
+    """Хранилище сотрудников с числовыми полями в отображаемом в память файле.
+
+    Каждому сотруднику соответствует запись фиксированной длины в
+    ``filename``: ID, вид расчета, оклад и параметры стратегии (как в
+    ``parallel_payroll.payroll_row``), а также ссылка на JSON со
+    строковыми полями (имя, отдел, навыки) в файле ``filename + ".heap"``.
+
+    Итоги и фильтры по зарплате читают записи прямо из mmap без
+    копирования; объекты сотрудников создаются только по запросу.
+    Открытие не читает данные: индекс ID строится при первом поиске.
+    """
+
+    _MAGIC = b"EMPMAP01"
+    # magic, количество занятых записей
+    _HEADER = struct.Struct("<8sQ")
+    # ID, флаги, вид, оклад, параметр1, параметр2, смещение и длина в куче
+    _RECORD = struct.Struct("<qBB6xdddQQ")
+    _ALIVE = 1
+
+    def __init__(self, filename: str, capacity: int = 1024):
+        """Открыть или создать хранилище.
+
+        Args:
+            filename: Путь к файлу записей
+            capacity: Начальная емкость нового файла (в записях)
+
+        Raises:
+            ValueError: Если файл не является хранилищем сотрудников
+        """
+        self.filename = filename
+        self.heap_filename = filename + ".heap"
+        self._lock = threading.RLock()
+        self._slots: Optional[Dict[int, int]] = None
+
+        if not os.path.exists(filename):
+            with open(filename, "wb") as file:
+                file.write(self._HEADER.pack(self._MAGIC, 0))
+                file.truncate(self._HEADER.size + capacity * self._RECORD.size)
+        self._file = open(filename, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        magic, self._count = self._HEADER.unpack_from(self._mm)
+        if magic != self._MAGIC:
+            self.close()
+            raise ValueError(f"{filename} не является хранилищем сотрудников")
+        self._capacity = (len(self._mm) - self._HEADER.size) // self._RECORD.size
+        self._heap = open(self.heap_filename, "a+b")
+        self._heap_size = os.fstat(self._heap.fileno()).st_size
+
+    def _records(self) -> memoryview:
+        """Представление занятых записей без копирования.
+
+        Представление нужно освободить до изменения размера файла,
+        поэтому оно используется только в ``with`` под блокировкой.
+        """
+        start = self._HEADER.size
+        return memoryview(self._mm)[start : start + self._count * self._RECORD.size]
+
+    def _index(self) -> Dict[int, int]:
+        """Индекс {ID: номер записи}, построенный при первом обращении."""
+        if self._slots is None:
+            slots = {}
+            with self._records() as records:
+                for slot, row in enumerate(self._RECORD.iter_unpack(records)):
+                    if row[1] & self._ALIVE:
+                        slots[row[0]] = slot
+            self._slots = slots
+        return self._slots
+
+    def _grow(self) -> None:
+        """Удвоить емкость файла записей."""
+        capacity = max(1024, self._capacity * 2)
+        self._mm.close()
+        self._file.truncate(self._HEADER.size + capacity * self._RECORD.size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._capacity = capacity
+
+    @staticmethod
+    def _row_salary(kind: int, base: float, first: float, second: float) -> float:
+        """Зарплата по числовым полям записи."""
+        if kind == MANAGER:
+            return base + first
+        if kind == DEVELOPER:
+            return base * first
+        if kind == SALESPERSON:
+            return base + (second * first)
+        if kind == PRECOMPUTED:
+            return first
+        return base
+
+    def total_salary(self) -> float:
+        """Сумма зарплат всех сотрудников (без создания объектов).
+
+        Returns:
+            Сумма зарплат
+        """
+        total = 0
+        salary = self._row_salary
+        with self._lock, self._records() as records:
+            for row in self._RECORD.iter_unpack(records):
+                if row[1] & self._ALIVE:
+                    total += salary(*row[2:6])
+        return total
+
+    def find_ids(
+        self, min_salary: Optional[float] = None, max_salary: Optional[float] = None
+    ) -> List[int]:
+        """ID сотрудников с зарплатой в заданном диапазоне.
+
+        Args:
+            min_salary: Нижняя граница включительно (None - без границы)
+            max_salary: Верхняя граница включительно (None - без границы)
+
+        Returns:
+            Список ID в порядке записей
+        """
+        low = float("-inf") if min_salary is None else min_salary
+        high = float("inf") if max_salary is None else max_salary
+        salary = self._row_salary
+        ids = []
+        with self._lock, self._records() as records:
+            for row in self._RECORD.iter_unpack(records):
+                if row[1] & self._ALIVE and low <= salary(*row[2:6]) <= high:
+                    ids.append(row[0])
+        return ids
+
+    def _load(self, slot: int) -> Any:
+        """Создать объект сотрудника из записи (вызывается под блокировкой)."""
+        offset = self._HEADER.size + slot * self._RECORD.size
+        emp_id, _, _, base, _, _, heap_offset, heap_length = self._RECORD.unpack_from(
+            self._mm, offset
+        )
+        self._heap.seek(heap_offset)
+        data = json.loads(self._heap.read(heap_length))
+        data["id"] = emp_id
+        data["base_salary"] = base
+        return EmployeeSerializer.from_dict(data)
+
+    def get_employee(self, emp_id: int) -> Optional[Any]:
+        """Получить сотрудника (объект создается при вызове)."""
+        with self._lock:
+            slot = self._index().get(emp_id)
+            if slot is None:
+                return None
+            return self._load(slot)
+
+    def iter_employees(self) -> Iterator[Any]:
+        """Сотрудники по одному, создаваемые по мере перебора.
+
+        Yields:
+            Объекты сотрудников в порядке записей
+        """
+        with self._lock:
+            slots = sorted(self._index().values())
+        for slot in slots:
+            # Блокировка не удерживается, пока генератор приостановлен
+            with self._lock:
+                employee = self._load(slot)
+            yield employee
+
+    def save_employee(self, employee: Any) -> None:
+        """Сохранить сотрудника: числа - в запись, строки - в кучу.
+
+        Raises:
+            ValueError: Если зарплату сотрудника нельзя восстановить
+                из записи (пользовательская стратегия)
+        """
+        data = EmployeeSerializer.to_dict(employee)
+        kind, base, first, second = payroll_row(employee)
+        if kind == PRECOMPUTED:
+            raise ValueError(
+                f"Сотрудник {employee.id} со своей стратегией не сохраняется"
+            )
+        del data["id"], data["base_salary"]
+        blob = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        with self._lock:
+            index = self._index()
+            slot = index.get(employee.id)
+            if slot is None:
+                if self._count == self._capacity:
+                    self._grow()
+                slot = self._count
+                self._count += 1
+                self._HEADER.pack_into(self._mm, 0, self._MAGIC, self._count)
+                index[employee.id] = slot
+            # После чтения позиция буфера не в конце: без seek запись
+            # затерла бы прочитанные заранее данные в буфере
+            self._heap.seek(self._heap_size)
+            self._heap.write(blob)
+            self._RECORD.pack_into(
+                self._mm,
+                self._HEADER.size + slot * self._RECORD.size,
+                employee.id,
+                self._ALIVE,
+                kind,
+                base,
+                first,
+                second,
+                self._heap_size,
+                len(blob),
+            )
+            self._heap_size += len(blob)
+        self._publish(EmployeeHired, employee.id)
+
+    def get_all_employees(self) -> List[Any]:
+        """Получить всех сотрудников."""
+        return list(self.iter_employees())
+
+    def get_employee_ids(self) -> List[int]:
+        """ID из индекса в порядке записей (объекты не создаются)."""
+        with self._lock:
+            index = self._index()
+            return sorted(index, key=index.__getitem__)
+
+    def delete_employee(self, emp_id: int) -> bool:
+        """Пометить запись сотрудника удаленной."""
+        with self._lock:
+            slot = self._index().pop(emp_id, None)
+            if slot is None:
+                return False
+            offset = self._HEADER.size + slot * self._RECORD.size
+            # Поле флагов идет сразу после ID
+            self._mm[offset + 8] = 0
+        self._publish(EmployeeRemoved, emp_id)
+        return True
+
+    def __len__(self) -> int:
+        """Количество сотрудников в хранилище."""
+        with self._lock:
+            return len(self._index())
+
+    def flush(self) -> None:
+        """Записать кучу строк и отображенные записи на диск."""
+        with self._lock:
+            self._heap.flush()
+            os.fsync(self._heap.fileno())
+            self._mm.flush()
+
+    def close(self) -> None:
+        """Сохранить изменения и закрыть файлы."""
+        with self._lock:
+            if self._mm.closed:
+                return
+            if hasattr(self, "_heap"):
+                self.flush()
+                self._heap.close()
+            self._mm.close()
+            self._file.close()
+
+    def __enter__(self) -> "MmapEmployeeRepository":
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Закрытие хранилища при выходе из контекста."""
+        self.close()
+
+
+class SqliteConnectionPool:
+    """Небольшой потокобезопасный пул соединений SQLite.
+
+    Соединения открываются в режиме WAL, поэтому читатели не блокируют
+    писателя и друг друга.
+    """
+
+    def __init__(self, database: str, size: int = 4):
+        """Открыть соединения пула.
+
+        Args:
+            database: Путь к файлу базы данных
+            size: Количество соединений
+
+        Raises:
+            ValueError: Если size не положителен
+        """
+        if size <= 0:
+            raise ValueError("Размер пула должен быть положительным")
+        self.database = database
+        self._connections: queue.Queue = queue.Queue()
+        for _ in range(size):
+            connection = sqlite3.connect(database, check_same_thread=False, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._connections.put(connection)
+        self.size = size
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Взять соединение из пула на время блока ``with``.
+
+        Транзакция фиксируется при успешном выходе из блока и
+        откатывается при исключении.
+
+        Yields:
+            Соединение SQLite
+        """
+        connection = self._connections.get()
+        try:
+            with connection:
+                yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close(self) -> None:
+        """Закрыть все соединения пула."""
+        for _ in range(self.size):
+            self._connections.get().close()
+
+
+class SqliteEmployeeRepository(EmployeeRepository):
+    """Хранилище сотрудников в базе SQLite.
+
+    Общие поля лежат в столбцах таблицы ``employees``, поля конкретного
+    типа - в JSON-столбце ``extra``. Рассчитанная при сохранении
+    зарплата хранится в столбце ``salary``, поэтому итоги по отделам
+    считаются агрегатами SQL без загрузки строк в Python.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS employees (
+            id INTEGER PRIMARY KEY,
+            type TEXT NOT NULL,
+            name TEXT NOT NULL,
+            department TEXT NOT NULL,
+            base_salary REAL NOT NULL,
+            salary REAL NOT NULL,
+            extra TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS employees_department
+            ON employees (department);
+    """
+    _UPSERT = """
+        INSERT INTO employees
+            (id, type, name, department, base_salary, salary, extra)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            type = excluded.type,
+            name = excluded.name,
+            department = excluded.department,
+            base_salary = excluded.base_salary,
+            salary = excluded.salary,
+            extra = excluded.extra
+    """
+    _COLUMNS = "type, id, name, department, base_salary, extra"
+
+    def __init__(self, database: str, pool_size: int = 4):
+        """Открыть базу данных и создать схему.
+
+        Args:
+            database: Путь к файлу базы данных
+            pool_size: Количество соединений в пуле
+        """
+        self.pool = SqliteConnectionPool(database, pool_size)
+        with self.pool.connection() as connection:
+            connection.executescript(self._SCHEMA)
+
+    @staticmethod
+    def _to_row(employee: Any) -> tuple:
+        """Строка таблицы для сотрудника."""
+        data = EmployeeSerializer.to_dict(employee)
+        common = [data.pop(key) for key in ("id", "type", "name", "department")]
+        base_salary = data.pop("base_salary")
+        return (
+            *common,
+            base_salary,
+            employee.calculate_salary(),
+            json.dumps(data, ensure_ascii=False),
+        )
+
+    @staticmethod
+    def _from_row(row: tuple) -> Any:
+        """Сотрудник из строки запроса со столбцами _COLUMNS."""
+        type_name, emp_id, name, department, base_salary, extra = row
+        data = json.loads(extra)
+        data.update(
+            type=type_name,
+            id=emp_id,
+            name=name,
+            department=department,
+            base_salary=base_salary,
+        )
+        return EmployeeSerializer.from_dict(data)
+
+    def get_employee(self, emp_id: int) -> Optional[Any]:
+        """Получить из базы."""
+        with self.pool.connection() as connection:
+            row = connection.execute(
+                f"SELECT {self._COLUMNS} FROM employees WHERE id = ?", (emp_id,)
+            ).fetchone()
+        return None if row is None else self._from_row(row)
+
+    def save_employee(self, employee: Any) -> None:
+        """Сохранить в базу (вставка или обновление)."""
+        self.save_employees([employee])
+
+    def save_employees(self, employees: Iterable[Any]) -> None:
+        """Сохранить сотрудников одной транзакцией через executemany.
+
+        Args:
+            employees: Сотрудники для вставки или обновления
+        """
+        rows = [self._to_row(employee) for employee in employees]
+        with self.pool.connection() as connection:
+            connection.executemany(self._UPSERT, rows)
+        for row in rows:
+            self._publish(EmployeeHired, row[0])
+
+    def get_all_employees(self) -> List[Any]:
+        """Получить всех из базы."""
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                f"SELECT {self._COLUMNS} FROM employees ORDER BY id"
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def get_employee_ids(self) -> List[int]:
+        """ID из базы по возрастанию."""
+        with self.pool.connection() as connection:
+            rows = connection.execute("SELECT id FROM employees ORDER BY id")
+            return [emp_id for (emp_id,) in rows]
+
+    def get_employees(self, emp_ids: Iterable[int]) -> List[Optional[Any]]:
+        """Получить сотрудников по списку ID запросами ``IN``."""
+        emp_ids = list(emp_ids)
+        found: Dict[int, Any] = {}
+        with self.pool.connection() as connection:
+            # Ограничение SQLite на число параметров запроса
+            for start in range(0, len(emp_ids), 500):
+                chunk = emp_ids[start : start + 500]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = connection.execute(
+                    f"SELECT {self._COLUMNS} FROM employees "
+                    f"WHERE id IN ({placeholders})",
+                    chunk,
+                )
+                for row in rows:
+                    found[row[1]] = self._from_row(row)
+        return [found.get(emp_id) for emp_id in emp_ids]
+
+    def iter_employees(self, page_size: int = 1000) -> Iterator[Any]:
+        """Сотрудники страницами по page_size строк.
+
+        Каждая страница читается отдельным запросом по ключу (id больше
+        последнего прочитанного), и соединение возвращается в пул до
+        выдачи ее сотрудников. Поэтому брошенный или вложенный обход
+        не удерживает соединение. Записи, сделанные во время обхода,
+        видны на следующих страницах.
+
+        Args:
+            page_size: Размер страницы выборки
+
+        Yields:
+            Объекты сотрудников по возрастанию ID
+        """
+        last_id = None
+        while True:
+            with self.pool.connection() as connection:
+                if last_id is None:
+                    cursor = connection.execute(
+                        f"SELECT {self._COLUMNS} FROM employees ORDER BY id LIMIT ?",
+                        (page_size,),
+                    )
+                else:
+                    cursor = connection.execute(
+                        f"SELECT {self._COLUMNS} FROM employees "
+                        "WHERE id > ? ORDER BY id LIMIT ?",
+                        (last_id, page_size),
+                    )
+                rows = cursor.fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][1]
+            for row in rows:
+                yield self._from_row(row)
+
+    def get_department_employees(self, department: str) -> List[Any]:
+        """Сотрудники отдела (выборка по индексу department).
+
+        Args:
+            department: Название отдела
+
+        Returns:
+            Список сотрудников
+        """
+        with self.pool.connection() as connection:
+            rows = connection.execute(
+                f"SELECT {self._COLUMNS} FROM employees "
+                "WHERE department = ? ORDER BY id",
+                (department,),
+            ).fetchall()
+        return [self._from_row(row) for row in rows]
+
+    def delete_employee(self, emp_id: int) -> bool:
+        """Удалить из базы."""
+        with self.pool.connection() as connection:
+            cursor = connection.execute("DELETE FROM employees WHERE id = ?", (emp_id,))
+        if cursor.rowcount <= 0:
+            return False
+        self._publish(EmployeeRemoved, emp_id)
+        return True
+
+    def department_totals(self) -> Dict[str, float]:
+        """Сумма зарплат по отделам (агрегат SQL).
+
+        Returns:
+            Словарь {отдел: сумма зарплат}
+        """
+        with self.pool.connection() as connection:
+            return dict(
+                connection.execute(
+                    "SELECT department, SUM(salary) FROM employees "
+                    "GROUP BY department"
+                )
+            )
+
+    def department_averages(self) -> Dict[str, float]:
+        """Средняя зарплата по отделам (агрегат SQL).
+
+        Returns:
+            Словарь {отдел: средняя зарплата}
+        """
+        with self.pool.connection() as connection:
+            return dict(
+                connection.execute(
+                    "SELECT department, AVG(salary) FROM employees "
+                    "GROUP BY department"
+                )
+            )
+
+    def total_salary(self) -> float:
+        """Сумма зарплат всех сотрудников.
+
+        Returns:
+            Сумма зарплат (0 для пустой базы)
+        """
+        with self.pool.connection() as connection:
+            (total,) = connection.execute(
+                "SELECT COALESCE(SUM(salary), 0) FROM employees"
+            ).fetchone()
+        return total
+
+    def close(self) -> None:
+        """Закрыть соединения."""
+        self.pool.close()
+
+    def __enter__(self) -> "SqliteEmployeeRepository":
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Закрытие хранилища при выходе из контекста."""
+        self.close()
+
+
+class CachingEmployeeRepository(EmployeeRepository):
+    """Кэширующая обертка над любым хранилищем сотрудников.
+
+    Найденные сотрудники хранятся в LRU-кэше. Сохранение пишется в
+    хранилище и сразу в кэш, удаление убирает запись из кэша. Запись
+    в хранилище и обновление кэша выполняются под блокировкой сегмента
+    ID, поэтому параллельные записи одного ID не оставляют в кэше
+    устаревший объект.
+    Одновременные промахи по одному ID выполняют одну загрузку из
+    хранилища, остальные запросы ждут ее результат.
+
+    Кроме методов EmployeeRepository обертка поддерживает интерфейс
+    ``patterns.EmployeeRepository`` (add, find_by_id, get_all, remove),
+    поэтому ее можно передать в ``Company(name, repository=...)``.
+    """
+
+    def __init__(
+        self,
+        backend: EmployeeRepository,
+        maxsize: int = 1024,
+        ttl: Optional[float] = None,
+    ):
+        """Инициализация обертки.
+
+        Args:
+            backend: Хранилище сотрудников
+            maxsize: Максимальное количество сотрудников в кэше
+            ttl: Время жизни записи в секундах (None - без ограничения)
+        """
+        self.backend = backend
+        self.cache = LRUCache(maxsize, ttl)
+        self._flights: Dict[int, PendingLoad] = {}
+        self._lock = threading.Lock()
+        # Блокировки записи по сегментам ID
+        self._write_locks = [threading.Lock() for _ in range(16)]
+
+    @property
+    def stats(self) -> CacheStats:
+        """Счетчики попаданий, вытеснений и задержек загрузки."""
+        return self.cache.stats
+
+    @property
+    def feed(self) -> Optional[ChangeFeed]:
+        """Лента изменений хранилища (события публикует оно)."""
+        return self.backend.feed
+
+    @feed.setter
+    def feed(self, feed: Optional[ChangeFeed]) -> None:
+        """Назначить ленту изменений хранилищу."""
+        self.backend.feed = feed
+
+    def get_employee(self, emp_id: int) -> Optional[Any]:
+        """Получить из кэша или загрузить из хранилища."""
+        employee = self.cache.get(emp_id)
+        if employee is not None:
+            return employee
+        with self._lock:
+            flight = self._flights.get(emp_id)
+            leader = flight is None
+            if leader:
+                flight = self._flights[emp_id] = PendingLoad()
+        if not leader:
+            flight.done.wait()
+        else:
+            start = time.perf_counter()
+            try:
+                flight.result = self.backend.get_employee(emp_id)
+            except BaseException as error:
+                flight.error = error
+                raise
+            finally:
+                with self._lock:
+                    self.stats.record_load(time.perf_counter() - start)
+                    # Запись во время загрузки делает ее результат устаревшим
+                    if self._flights.get(emp_id) is flight:
+                        del self._flights[emp_id]
+                        if flight.error is None and flight.result is not None:
+                            self.cache.put(emp_id, flight.result)
+                flight.done.set()
+        if flight.error is not None:
+            raise flight.error
+        return flight.result
+
+    def get_employees(self, emp_ids: Iterable[int]) -> List[Optional[Any]]:
+        """Получить из кэша, недостающих - одним запросом к хранилищу.
+
+        Как и в get_employee(), загрузка каждого ID регистрируется в
+        _flights: запись во время загрузки снимает регистрацию, и
+        устаревший результат не попадает в кэш. ID, которые уже
+        загружает другой поток, не запрашиваются повторно.
+        """
+        emp_ids = list(emp_ids)
+        found = {emp_id: self.cache.get(emp_id) for emp_id in emp_ids}
+        missing = [emp_id for emp_id, employee in found.items() if employee is None]
+        own: Dict[int, PendingLoad] = {}
+        others: Dict[int, PendingLoad] = {}
+        with self._lock:
+            for emp_id in missing:
+                flight = self._flights.get(emp_id)
+                if flight is None:
+                    own[emp_id] = self._flights[emp_id] = PendingLoad()
+                else:
+                    others[emp_id] = flight
+        if own:
+            start = time.perf_counter()
+            loaded: List[Optional[Any]] = [None] * len(own)
+            error: Optional[BaseException] = None
+            try:
+                loaded = self.backend.get_employees(list(own))
+            except BaseException as exc:
+                error = exc
+                raise
+            finally:
+                with self._lock:
+                    self.stats.record_load(time.perf_counter() - start)
+                    for (emp_id, flight), employee in zip(own.items(), loaded):
+                        flight.result, flight.error = employee, error
+                        found[emp_id] = employee
+                        if self._flights.get(emp_id) is flight:
+                            del self._flights[emp_id]
+                            if error is None and employee is not None:
+                                self.cache.put(emp_id, employee)
+                for flight in own.values():
+                    flight.done.set()
+        for emp_id, flight in others.items():
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            found[emp_id] = flight.result
+        return [found[emp_id] for emp_id in emp_ids]
+
+    @contextmanager
+    def _writing(self, emp_ids: Iterable[int]) -> Iterator[None]:
+        """Удерживать блокировки записи сегментов этих ID.
+
+        Блокировки берутся в порядке номеров сегментов, поэтому
+        пакетные записи не блокируют друг друга взаимно.
+        """
+        count = len(self._write_locks)
+        stripes = sorted({hash(emp_id) % count for emp_id in emp_ids})
+        locks = [self._write_locks[stripe] for stripe in stripes]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def save_employee(self, employee: Any) -> None:
+        """Сохранить в хранилище и в кэш."""
+        with self._writing((employee.id,)):
+            self.backend.save_employee(employee)
+            with self._lock:
+                self._flights.pop(employee.id, None)
+                self.cache.put(employee.id, employee)
+
+    def save_employees(self, employees: Iterable[Any]) -> None:
+        """Сохранить пакет в хранилище и в кэш."""
+        employees = list(employees)
+        with self._writing(employee.id for employee in employees):
+            self.backend.save_employees(employees)
+            with self._lock:
+                for employee in employees:
+                    self._flights.pop(employee.id, None)
+                    self.cache.put(employee.id, employee)
+
+    def get_all_employees(self) -> List[Any]:
+        """Получить всех из хранилища (кэш не заполняется)."""
+        return self.backend.get_all_employees()
+
+    def iter_employees(self) -> Iterator[Any]:
+        """Итератор по сотрудникам хранилища."""
+        return self.backend.iter_employees()
+
+    def get_employee_ids(self) -> List[int]:
+        """ID сотрудников хранилища."""
+        return self.backend.get_employee_ids()
+
+    def delete_employee(self, emp_id: int) -> bool:
+        """Удалить из хранилища и из кэша."""
+        with self._writing((emp_id,)):
+            deleted = self.backend.delete_employee(emp_id)
+            with self._lock:
+                self._flights.pop(emp_id, None)
+                self.cache.invalidate(emp_id)
+        return deleted
+
+    def clear(self) -> None:
+        """Очистить кэш (хранилище не меняется)."""
+        with self._lock:
+            self._flights.clear()
+            self.cache.clear()
+
+    def close(self) -> None:
+        """Закрыть хранилище, если оно это поддерживает."""
+        close = getattr(self.backend, "close", None)
+        if close is not None:
+            close()
+
+    # Интерфейс patterns.EmployeeRepository, которым пользуется Company
+    add = save_employee
+    find_by_id = get_employee
+    get_all = get_all_employees
+    remove = delete_employee
@@ -0,0 +1,143 @@
+"""Преобразование сотрудников в словари и обратно."""
+
+from typing import Any, Dict
+
+from employee import BaseEmployee, Employee, Manager, Developer, Salesperson
+from compact import (
+    CompactEmployee,
+    CompactManager,
+    CompactDeveloper,
+    CompactSalesperson,
+)
+from strategies import (
+    BaseSalaryStrategy,
+    ManagerSalaryStrategy,
+    DeveloperSalaryStrategy,
+    SalespersonSalaryStrategy,
+)
+
+# Поля, специфичные для каждого типа (после id, name, department, base_salary)
+_EXTRA_FIELDS = {
+    "Employee": (),
+    "Manager": ("bonus",),
+    "Developer": ("skills", "level"),
+    "Salesperson": ("commission", "sales"),
+}
+
+_TYPES = {
+    "Employee": Employee,
+    "Manager": Manager,
+    "Developer": Developer,
+    "Salesperson": Salesperson,
+    "CompactEmployee": CompactEmployee,
+    "CompactManager": CompactManager,
+    "CompactDeveloper": CompactDeveloper,
+    "CompactSalesperson": CompactSalesperson,
+}
+
+
+# Стратегия, которую тип назначает сам (компактные типы - как обычные)
+_DEFAULT_STRATEGIES = {
+    "Employee": BaseSalaryStrategy,
+    "Manager": ManagerSalaryStrategy,
+    "Developer": DeveloperSalaryStrategy,
+    "Salesperson": SalespersonSalaryStrategy,
+}
+
+# Встроенные стратегии, которые можно сохранить по имени
+_STRATEGIES = {cls.__name__: cls for cls in _DEFAULT_STRATEGIES.values()}
+
+
+def _extra_fields(type_name: str) -> tuple:
+    """Дополнительные поля типа (компактные типы совпадают с обычными)."""
+    return _EXTRA_FIELDS[type_name.replace("Compact", "", 1)]
+
+
+def _default_strategy(type_name: str) -> type:
+    """Класс стратегии, которую тип сотрудника назначает сам."""
+    return _DEFAULT_STRATEGIES[type_name.replace("Compact", "", 1)]
+
+
+class EmployeeSerializer:
+    """Сериализатор сотрудников в словари из простых типов.
+
+    Стратегия расчета сохраняется по имени (ключ ``strategy``), только
+    если она отличается от стратегии типа. Сотрудники наследников
+    и сотрудники с пользовательскими стратегиями не сериализуются:
+    после восстановления их зарплата бы изменилась.
+    """
+
+    @staticmethod
+    def to_dict(employee: BaseEmployee) -> Dict[str, Any]:
+        """Преобразовать сотрудника в словарь.
+
+        Args:
+            employee: Объект сотрудника
+
+        Returns:
+            Словарь с типом и полями сотрудника
+
+        Raises:
+            ValueError: Если тип сотрудника или его стратегия
+                не поддерживаются
+        """
+        type_name = type(employee).__name__
+        if _TYPES.get(type_name) is not type(employee):
+            raise ValueError(f"Неизвестный тип сотрудника: {type_name}")
+        strategy_type = type(employee.salary_strategy)
+        strategy_name = strategy_type.__name__
+        if _STRATEGIES.get(strategy_name) is not strategy_type:
+            raise ValueError(
+                f"Стратегия {strategy_name} не сохраняется: "
+                f"сотрудник {employee.id} не может быть сериализован"
+            )
+        data = {
+            "type": type_name,
+            "id": employee.id,
+            "name": employee.name,
+            "department": employee.department,
+            "base_salary": employee.base_salary,
+        }
+        for field in _extra_fields(type_name):
+            data[field] = getattr(employee, field)
+        if strategy_type is not _default_strategy(type_name):
+            data["strategy"] = strategy_name
+            # Поля стратегии, которых нет у самого типа
+            for field in strategy_type.depends_on:
+                if field not in data and hasattr(employee, field):
+                    data[field] = getattr(employee, field)
+        return data
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> BaseEmployee:
+        """Восстановить сотрудника из словаря.
+
+        Args:
+            data: Словарь, полученный из to_dict()
+
+        Returns:
+            Объект сотрудника
+
+        Raises:
+            ValueError: Если тип сотрудника или стратегия не поддерживаются
+        """
+        type_name = data.get("type", "Employee")
+        cls = _TYPES.get(type_name)
+        if cls is None:
+            raise ValueError(f"Неизвестный тип сотрудника: {type_name}")
+        strategy_name = data.get("strategy")
+        strategy_type = None
+        if strategy_name is not None:
+            strategy_type = _STRATEGIES.get(strategy_name)
+            if strategy_type is None:
+                raise ValueError(f"Неизвестная стратегия: {strategy_name}")
+        extra = [data[field] for field in _extra_fields(type_name)]
+        employee = cls(
+            data["id"], data["name"], data["department"], data["base_salary"], *extra
+        )
+        if strategy_type is not None:
+            employee.salary_strategy = strategy_type()
+            for field in strategy_type.depends_on:
+                if field in data:
+                    setattr(employee, field, data[field])
+        return employee
@@ -1,84 +1,299 @@
-"""Стратегии расчета зарплаты для разных типов сотрудников."""
-
-from abc import ABC, abstractmethod
-
-
-class SalaryCalculationStrategy(ABC):
-    """Интерфейс для стратегии расчета зарплаты."""
-
-    @abstractmethod
-    def calculate(self, employee) -> float:
-        """Расчет зарплаты сотрудника.
-
-        Args:
-            employee: Объект сотрудника
-
-        Returns:
-            float: Размер зарплаты
-        """
-        pass
-
-
-class BaseSalaryStrategy(SalaryCalculationStrategy):
-    """Базовая зарплата без каких-либо бонусов."""
-
-    def calculate(self, employee) -> float:
-        """Возвращает только базовую зарплату.
-
-        Args:
-            employee: Объект сотрудника
-
-        Returns:
-            float: Базовая зарплата
-        """
-        return employee.base_salary
-
-
-class ManagerSalaryStrategy(SalaryCalculationStrategy):
-    """Зарплата менеджера с бонусом."""
-
-    def calculate(self, employee) -> float:
-        """Базовая зарплата + бонус.
-
-        Args:
-            employee: Объект сотрудника (Manager)
-
-        Returns:
-            float: Зарплата с бонусом
-        """
-        return employee.base_salary + getattr(employee, "bonus", 0)
-
-
-class DeveloperSalaryStrategy(SalaryCalculationStrategy):
-    """Зарплата разработчика с учетом уровня."""
-
-    def calculate(self, employee) -> float:
-        """Расчет зарплаты разработчика по уровню.
-
-        Args:
-            employee: Объект сотрудника (Developer)
-
-        Returns:
-            float: Зарплата с коэффициентом по уровню
-        """
-        level_multipliers = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
-        multiplier = level_multipliers.get(getattr(employee, "level", "junior"), 1.0)
-        return employee.base_salary * multiplier
-
-
-class SalespersonSalaryStrategy(SalaryCalculationStrategy):
-    """Зарплата продавца с комиссией."""
-
-    def calculate(self, employee) -> float:
-        """Базовая зарплата + комиссия от продаж.
-
-        Args:
-            employee: Объект сотрудника (Salesperson)
-
-        Returns:
-            float: Зарплата с комиссией
-        """
-        base = employee.base_salary
-        commission_rate = getattr(employee, "commission", 0)
-        sales = getattr(employee, "sales", 0)
-        return base + (sales * commission_rate)
+"""Стратегии расчета зарплаты для разных типов сотрудников."""
+
+from abc import ABC, abstractmethod
+from array import array
+from itertools import repeat
+from operator import add, attrgetter, mul
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+
+class SalaryCalculationStrategy(ABC):
+    """Интерфейс для стратегии расчета зарплаты."""
+
+    # Поля сотрудника, от которых зависит результат calculate()
+    depends_on: Tuple[str, ...] = ("base_salary",)
+    # True, если результат зависит только от стратегии и полей depends_on
+    # и calculate дороже чтения кэша (тогда сотрудник кэширует зарплату).
+    # Вызов calculate на Python уже примерно вдвое дороже чтения кэша
+    # (benchmarks/bench_salary_cache.py). Наследник, переопределивший
+    # calculate, должен объявить флаг сам, иначе кэш отключается.
+    cacheable: bool = False
+    # True, если стратегия не хранит состояния: тогда calculate_batch()
+    # считает сотрудников всех экземпляров класса стратегии одной группой.
+    # Флаг не наследуется: наследник объявляет его сам.
+    stateless: bool = False
+
+    @abstractmethod
+    def calculate(self, employee) -> float:
+        """Расчет зарплаты сотрудника.
+
+        Args:
+            employee: Объект сотрудника
+
+        Returns:
+            float: Размер зарплаты
+        """
+        pass
+
+    def __init_subclass__(cls, **kwargs):
+        """Сброс флагов, которые наследник не объявил сам.
+
+        stateless сбрасывается всегда, cacheable - если наследник
+        переопределил calculate.
+        """
+        super().__init_subclass__(**kwargs)
+        if "stateless" not in cls.__dict__:
+            cls.stateless = False
+        if "calculate" in cls.__dict__ and "cacheable" not in cls.__dict__:
+            cls.cacheable = False
+
+    def calculate_batch(self, employees: Sequence) -> array:
+        """Расчет зарплат пачкой.
+
+        По умолчанию - цикл по ``calculate``; встроенные стратегии
+        считают целыми колонками, если наследник не переопределил
+        ``calculate``.
+
+        Args:
+            employees: Сотрудники с этой стратегией
+
+        Returns:
+            Колонка зарплат в порядке сотрудников
+        """
+        return array("d", map(self.calculate, employees))
+
+
+def _column(employees: Sequence, field: str, default=None) -> list:
+    """Колонка значений атрибута сотрудников.
+
+    Args:
+        employees: Сотрудники
+        field: Имя атрибута
+        default: Значение для сотрудников без атрибута
+            (None - атрибут обязателен)
+
+    Returns:
+        Список значений в порядке сотрудников
+    """
+    try:
+        return list(map(attrgetter(field), employees))
+    except AttributeError:
+        if default is None:
+            raise
+        return [getattr(employee, field, default) for employee in employees]
+
+
+class BaseSalaryStrategy(SalaryCalculationStrategy):
+    """Базовая зарплата без каких-либо бонусов."""
+
+    cacheable = True
+    stateless = True
+
+    def calculate(self, employee) -> float:
+        """Возвращает только базовую зарплату.
+
+        Args:
+            employee: Объект сотрудника
+
+        Returns:
+            float: Базовая зарплата
+        """
+        return employee.base_salary
+
+    def calculate_batch(self, employees: Sequence) -> array:
+        """Колонка базовых зарплат."""
+        if type(self).calculate is not BaseSalaryStrategy.calculate:
+            return super().calculate_batch(employees)
+        return array("d", _column(employees, "base_salary"))
+
+
+class ManagerSalaryStrategy(SalaryCalculationStrategy):
+    """Зарплата менеджера с бонусом."""
+
+    depends_on = ("base_salary", "bonus")
+    cacheable = True
+    stateless = True
+
+    def calculate(self, employee) -> float:
+        """Базовая зарплата + бонус.
+
+        Args:
+            employee: Объект сотрудника (Manager)
+
+        Returns:
+            float: Зарплата с бонусом
+        """
+        return employee.base_salary + getattr(employee, "bonus", 0)
+
+    def calculate_batch(self, employees: Sequence) -> array:
+        """Колонка баз + колонка бонусов."""
+        if type(self).calculate is not ManagerSalaryStrategy.calculate:
+            return super().calculate_batch(employees)
+        return array(
+            "d",
+            map(
+                add,
+                _column(employees, "base_salary"),
+                _column(employees, "bonus", 0),
+            ),
+        )
+
+
+class DeveloperSalaryStrategy(SalaryCalculationStrategy):
+    """Зарплата разработчика с учетом уровня."""
+
+    depends_on = ("base_salary", "level")
+    cacheable = True
+    stateless = True
+    LEVEL_MULTIPLIERS: Dict[str, float] = {"junior": 1.0, "middle": 1.5, "senior": 2.0}
+
+    def calculate(self, employee) -> float:
+        """Расчет зарплаты разработчика по уровню.
+
+        Args:
+            employee: Объект сотрудника (Developer)
+
+        Returns:
+            float: Зарплата с коэффициентом по уровню
+        """
+        level = getattr(employee, "level", "junior")
+        return employee.base_salary * self.LEVEL_MULTIPLIERS.get(level, 1.0)
+
+    def calculate_batch(self, employees: Sequence) -> array:
+        """Колонка баз * колонка коэффициентов по уровням."""
+        if type(self).calculate is not DeveloperSalaryStrategy.calculate:
+            return super().calculate_batch(employees)
+        multipliers = map(
+            self.LEVEL_MULTIPLIERS.get,
+            _column(employees, "level", "junior"),
+            repeat(1.0),
+        )
+        return array("d", map(mul, _column(employees, "base_salary"), multipliers))
+
+
+class SalespersonSalaryStrategy(SalaryCalculationStrategy):
+    """Зарплата продавца с комиссией."""
+
+    depends_on = ("base_salary", "commission", "sales")
+    cacheable = True
+    stateless = True
+
+    def calculate(self, employee) -> float:
+        """Базовая зарплата + комиссия от продаж.
+
+        Args:
+            employee: Объект сотрудника (Salesperson)
+
+        Returns:
+            float: Зарплата с комиссией
+        """
+        base = employee.base_salary
+        commission_rate = getattr(employee, "commission", 0)
+        sales = getattr(employee, "sales", 0)
+        return base + (sales * commission_rate)
+
+    def calculate_batch(self, employees: Sequence) -> array:
+        """Колонка баз + колонка продаж * колонка комиссий."""
+        if type(self).calculate is not SalespersonSalaryStrategy.calculate:
+            return super().calculate_batch(employees)
+        commissions = map(
+            mul, _column(employees, "sales", 0), _column(employees, "commission", 0)
+        )
+        return array("d", map(add, _column(employees, "base_salary"), commissions))
+
+
+# Общие экземпляры стратегий: стратегии не хранят состояния,
+# поэтому один объект можно разделять между всеми сотрудниками.
+BASE_STRATEGY = BaseSalaryStrategy()
+MANAGER_STRATEGY = ManagerSalaryStrategy()
+DEVELOPER_STRATEGY = DeveloperSalaryStrategy()
+SALESPERSON_STRATEGY = SalespersonSalaryStrategy()
+
+
+# Класс сотрудника -> считается ли его зарплата только стратегией
+_STRATEGY_SALARY: Dict[type, bool] = {}
+
+
+def uses_strategy(employee_type: type) -> bool:
+    """Считается ли зарплата класса сотрудника только его стратегией.
+
+    Args:
+        employee_type: Класс сотрудника
+
+    Returns:
+        False, если класс переопределил calculate_salary()
+    """
+    uses = _STRATEGY_SALARY.get(employee_type)
+    if uses is None:
+        # employee импортирует этот модуль, поэтому импорт отложен
+        from employee import BaseEmployee
+
+        uses = _STRATEGY_SALARY[employee_type] = (
+            getattr(employee_type, "calculate_salary", None)
+            is BaseEmployee.calculate_salary
+        )
+    return uses
+
+
+def calculate_batch(employees: Iterable) -> array:
+    """Рассчитать зарплаты одним проходом на каждую стратегию.
+
+    Сотрудники группируются по стратегии (стратегии, объявившие
+    ``stateless`` в своем классе, - по классу), каждая группа
+    считается через ``calculate_batch``. Декорированные сотрудники
+    (``salary_transform()``) считаются по сотруднику под
+    декораторами, затем одним проходом по колонкам применяется
+    ``salary * scale + offset``. Объекты без стратегии и классы с
+    собственным ``calculate_salary()`` считаются через него.
+
+    Args:
+        employees: Сотрудники
+
+    Returns:
+        Колонка зарплат в порядке входных сотрудников
+    """
+    employees = list(employees)
+    scales = offsets = None
+    groups: Dict[object, Tuple[SalaryCalculationStrategy, List[int]]] = {}
+    for i, employee in enumerate(employees):
+        transform = getattr(employee, "salary_transform", None)
+        if transform is not None:
+            if scales is None:
+                scales = array("d", repeat(1.0, len(employees)))
+                offsets = array("d", bytes(8 * len(employees)))
+            employee, scales[i], offsets[i] = transform()
+            employees[i] = employee
+        strategy = getattr(employee, "salary_strategy", None)
+        if strategy is None or not uses_strategy(type(employee)):
+            strategy = owner = None
+        else:
+            owner = type(strategy) if strategy.stateless else strategy
+        group = groups.get(owner)
+        if group is None:
+            group = groups[owner] = (strategy, [])
+        group[1].append(i)
+
+    salaries = array("d", bytes(8 * len(employees)))
+    for strategy, positions in groups.values():
+        members = [employees[i] for i in positions]
+        if strategy is None:
+            column = [member.calculate_salary() for member in members]
+        else:
+            column = strategy.calculate_batch(members)
+        for i, salary in zip(positions, column):
+            salaries[i] = salary
+    if scales is not None:
+        salaries = array("d", map(add, map(mul, salaries, scales), offsets))
+    return salaries
+
+
+def calculate_many(employees: Iterable) -> List[float]:
+    """Рассчитать зарплаты пачкой.
+
+    Args:
+        employees: Сотрудники
+
+    Returns:
+        Зарплаты в порядке входных сотрудников
+    """
+    return calculate_batch(employees).tolist()
@@ -0,0 +1,146 @@
+import pytest
+from aggregates import SalaryAggregate
+from company import Company
+from repositories import CachingEmployeeRepository, SqliteEmployeeRepository
+from department import Department
+from employee import Employee, Manager, Developer, Salesperson
+
+
+class TestSalaryAggregate:
+    """Тестирование агрегатов зарплат"""
+
+    def test_min_max_after_remove(self):
+        """Тест: Минимум и максимум после удаления"""
+        agg = SalaryAggregate()
+        for value in (5000, 3000, 9000, 3000):
+            agg.add(value)
+
+        agg.remove(9000)
+        agg.remove(3000)
+
+        assert agg.count == 2
+        assert agg.total == 8000
+        assert agg.minimum == 3000
+        assert agg.maximum == 5000
+
+    def test_total_without_drift(self):
+        """Тест: Сумма не накапливает погрешность при удалениях"""
+        agg = SalaryAggregate()
+        for value in (1e16, 1.5, 0.1, 0.2):
+            agg.add(value)
+
+        agg.remove(1e16)
+        agg.replace(0.2, 0.3)
+
+        assert agg.total == 1.9
+        agg.remove(1.5)
+        agg.remove(0.1)
+        assert agg.total == 0.3
+
+    def test_empty(self):
+        """Тест: Пустой агрегат"""
+        agg = SalaryAggregate()
+
+        assert agg.average == 0
+        assert agg.minimum is None
+        assert agg.maximum is None
+
+
+class TestDepartmentAggregates:
+    """Тестирование агрегатов отдела"""
+
+    def test_stats_follow_salary_fields(self):
+        """Тест: Агрегаты обновляются при изменении полей"""
+        dept = Department("DEV")
+        mgr = Manager(1, "Alice", "DEV", 7000, 2000)
+        dev = Developer(2, "Bob", "DEV", 5000, ["Python"], "junior")
+        sales = Salesperson(3, "Charlie", "SAL", 4000, 0.15, 50000)
+        for emp in (mgr, dev, sales):
+            dept.add_employee(emp)
+
+        mgr.bonus = 3000
+        dev.level = "senior"
+        sales.sales = 60000
+
+        stats = dept.get_salary_stats()
+        assert stats["total"] == pytest.approx(10000 + 10000 + 13000)
+        assert stats["count"] == 3
+        assert stats["min"] == 10000
+        assert stats["max"] == pytest.approx(13000)
+
+        dept.remove_employee(sales)
+        assert dept.calculate_total_salary() == 20000
+        assert dept.calculate_average_salary() == 10000
+
+    def test_removed_employee_not_tracked(self):
+        """Тест: Удаленный сотрудник не влияет на агрегаты"""
+        dept = Department("IT")
+        emp = Employee(1, "John", "IT", 5000)
+        dept.add_employee(emp)
+        dept.remove_employee(emp)
+
+        emp.base_salary = 9000
+
+        assert dept.calculate_total_salary() == 0
+
+    def test_name_change_reindexed(self):
+        """Тест: Смена имени обновляет индекс имен"""
+        dept = Department("IT")
+        emp = Employee(1, "John", "IT", 5000)
+        dept.add_employee(emp)
+
+        emp.name = "Johnny"
+
+        assert dept.find_employee_by_name("John") is None
+        assert dept.find_employee_by_name("Johnny") is emp
+
+
+class TestCompanyAggregates:
+    """Тестирование агрегатов компании"""
+
+    def test_company_stats(self):
+        """Тест: Агрегаты компании без двойного учета"""
+        company = Company("TechCorp")
+        dept = Department("DEV")
+        mgr = Manager(1, "Alice", "DEV", 7000, 2000)
+        dept.add_employee(mgr)
+        company.add_department(dept)
+        company.add_employee(mgr)
+        company.add_employee(Employee(2, "John", "IT", 5000))
+
+        mgr.base_salary = 8000
+
+        stats = company.get_salary_stats()
+        assert stats["total"] == 15000
+        assert stats["count"] == 2
+        assert stats["min"] == 5000
+        assert stats["max"] == 10000
+
+    def test_repository_writes_counted(self):
+        """Тест: Сотрудники, сохраненные в repository напрямую, учитываются"""
+        company = Company("TechCorp")
+        dept = Department("DEV")
+        dept.add_employee(Employee(1, "Alice", "DEV", 7000))
+        company.add_department(dept)
+
+        company.repository.add(Employee(2, "John", "IT", 5000))
+        company.repository.add(Employee(3, "Bob", "IT", 3000))
+        assert company.get_total_salary() == 15000
+
+        company.repository.remove(3)
+        company.repository.add(Employee(2, "John", "IT", 6000))
+
+        assert company.get_total_salary() == 13000
+        assert company.get_salary_stats()["count"] == 2
+        assert "employees=2" in company.get_info()
+
+    def test_caching_repository_writes_counted(self, tmp_path):
+        """Тест: Запись через кэширующее хранилище учитывается"""
+        backend = SqliteEmployeeRepository(str(tmp_path / "staff.db"))
+        repository = CachingEmployeeRepository(backend)
+        company = Company("TechCorp", repository)
+
+        backend.save_employee(Employee(1, "John", "IT", 5000))
+
+        assert company.get_total_salary() == 5000
+        backend.close()
@@ -0,0 +1,155 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from employee import Employee, Manager
+from repositories import (
+    InMemoryEmployeeRepository,
+    FileEmployeeRepository,
+    MmapEmployeeRepository,
+    SqliteEmployeeRepository,
+)
+from async_repositories import ExecutorEmployeeRepository, EmployeeLoader
+
+
+class CountingRepository(ExecutorEmployeeRepository):
+    """Хранилище, запоминающее пакеты запросов"""
+
+    def __init__(self, repository):
+        super().__init__(repository)
+        self.batches = []
+
+    async def get_many(self, emp_ids):
+        emp_ids = list(emp_ids)
+        self.batches.append(emp_ids)
+        return await super().get_many(emp_ids)
+
+
+def make_staff(count):
+    return [Employee(i, f"Emp{i}", "IT", 1000 + i) for i in range(1, count + 1)]
+
+
+class TestExecutorEmployeeRepository:
+    """Тестирование асинхронной обертки над хранилищами"""
+
+    def test_sqlite_round_trip(self, tmp_path):
+        """Тест: Пакетные операции над SQLite выполняются в пуле"""
+        repo = SqliteEmployeeRepository(str(tmp_path / "staff.db"), pool_size=2)
+        store = ExecutorEmployeeRepository(repo, page_size=7)
+
+        async def scenario():
+            await store.save_many(make_staff(20) + [Manager(21, "A", "M", 7000, 2000)])
+            found = await store.get_many([3, 99, 21])
+            ids = [emp.id async for emp in store.iterate()]
+            return found, ids
+
+        found, ids = asyncio.run(scenario())
+        repo.close()
+        assert found[0].name == "Emp3"
+        assert found[1] is None
+        assert found[2].calculate_salary() == 9000
+        assert ids == list(range(1, 22))
+
+    def test_file_repository(self, tmp_path):
+        """Тест: Файловое хранилище сохраняет пакет надежно"""
+        path = str(tmp_path / "staff.log")
+        repo = FileEmployeeRepository(path, batch_size=1000)
+        store = ExecutorEmployeeRepository(repo)
+
+        async def scenario():
+            await store.save_many(make_staff(5))
+            return await store.get(4)
+
+        assert asyncio.run(scenario()).name == "Emp4"
+        # Пакет записан на диск без close()
+        with FileEmployeeRepository(path) as reopened:
+            assert len(reopened.get_all_employees()) == 5
+        repo.close()
+
+    def test_mmap_pages_in_thread_pool(self, tmp_path):
+        """Тест: Порции читаются независимыми вызовами из разных потоков"""
+        with MmapEmployeeRepository(str(tmp_path / "staff.dat")) as repo:
+            repo.save_employees(make_staff(23))
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                store = ExecutorEmployeeRepository(repo, pool, page_size=5)
+
+                async def scenario():
+                    ids = []
+                    async for emp in store.iterate():
+                        ids.append(emp.id)
+                        if emp.id == 1:
+                            repo.delete_employee(20)
+                    return ids
+
+                ids = asyncio.run(scenario())
+
+        assert ids == [i for i in range(1, 24) if i != 20]
+
+
+class TestEmployeeLoader:
+    """Тестирование пакетной загрузки сотрудников"""
+
+    def test_concurrent_loads_share_one_batch(self):
+        """Тест: Запросы одного шага цикла объединяются в один пакет"""
+        repo = InMemoryEmployeeRepository()
+        repo.save_employees(make_staff(10))
+        store = CountingRepository(repo)
+        loader = EmployeeLoader(store)
+
+        async def fetch(emp_id):
+            employee = await loader.load(emp_id)
+            return employee.name if employee else None
+
+        async def scenario():
+            return await asyncio.gather(*(fetch(i) for i in (1, 2, 2, 42, 5)))
+
+        names = asyncio.run(scenario())
+        assert names == ["Emp1", "Emp2", "Emp2", None, "Emp5"]
+        assert store.batches == [[1, 2, 42, 5]]
+
+    def test_cache_and_batch_size(self):
+        """Тест: Кэш и ограничение размера пакета"""
+        repo = InMemoryEmployeeRepository()
+        repo.save_employees(make_staff(10))
+        store = CountingRepository(repo)
+        loader = EmployeeLoader(store, max_batch_size=3)
+
+        async def scenario():
+            first = await loader.load_many(range(1, 8))
+            again = await loader.load_many([1, 2])
+            loader.clear(1)
+            await loader.load(1)
+            return first, again
+
+        first, again = asyncio.run(scenario())
+        assert [emp.id for emp in first] == list(range(1, 8))
+        assert again == first[:2]
+        assert store.batches == [[1, 2, 3], [4, 5, 6], [7], [1]]
+
+    def test_errors_are_not_cached(self):
+        """Тест: Ошибка загрузки передается всем ожидающим и не кэшируется"""
+
+        class FailingRepository(CountingRepository):
+            async def get_many(self, emp_ids):
+                employees = await super().get_many(emp_ids)
+                if len(self.batches) == 1:
+                    raise OSError("disk")
+                return employees
+
+        store = FailingRepository(InMemoryEmployeeRepository())
+        loader = EmployeeLoader(store)
+
+        async def scenario():
+            results = await asyncio.gather(
+                loader.load(1), loader.load(2), return_exceptions=True
+            )
+            retry = await loader.load(1)
+            return results, retry
+
+        results, retry = asyncio.run(scenario())
+        assert all(isinstance(result, OSError) for result in results)
+        assert retry is None
+
+    def test_invalid_batch_size(self):
+        """Тест: Размер пакета должен быть положительным"""
+        with pytest.raises(ValueError):
+            EmployeeLoader(ExecutorEmployeeRepository(InMemoryEmployeeRepository()), 0)
@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import pytest
+from cache import LRUCache, async_memoize, memoize
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache:
+    """Тестирование LRU-кэша"""
+
+    def test_evicts_least_recently_used(self):
+        """Тест: Вытесняется самая давно использованная запись"""
+        cache = LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1
+        cache.put("c", 3)
+        assert "b" not in cache
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiration(self):
+        """Тест: Устаревшие записи считаются отсутствующими"""
+        clock = FakeClock()
+        cache = LRUCache(maxsize=10, ttl=5, clock=clock)
+        cache.put("a", 1)
+        clock.now = 4.9
+        assert cache.get("a") == 1
+        clock.now = 5.0
+        assert cache.get("a", "missing") == "missing"
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_stats(self):
+        """Тест: Доля попаданий и сброс счетчиков"""
+        cache = LRUCache()
+        cache.put(1, "x")
+        cache.get(1)
+        cache.get(1)
+        cache.get(2)
+        assert cache.stats.hit_ratio == pytest.approx(2 / 3)
+        assert cache.stats.as_dict()["misses"] == 1
+        assert cache.invalidate(1) is True
+        assert cache.invalidate(1) is False
+        cache.stats.reset()
+        assert cache.stats.hit_ratio == 0.0
+
+    def test_invalid_arguments(self):
+        """Тест: Размер и время жизни должны быть положительными"""
+        with pytest.raises(ValueError):
+            LRUCache(maxsize=0)
+        with pytest.raises(ValueError):
+            LRUCache(ttl=0)
+
+
+class TestMemoize:
+    """Тестирование декораторов мемоизации"""
+
+    def test_keys_include_kwargs(self):
+        """Тест: Ключ учитывает именованные аргументы и их порядок не важен"""
+        calls = []
+
+        @memoize(maxsize=2)
+        def salary(base, bonus=0):
+            calls.append((base, bonus))
+            return base + bonus
+
+        assert salary(100, bonus=5) == 105
+        assert salary(100, bonus=5) == 105
+        assert salary(100) == 100
+        assert salary.cache.stats.hits == 1
+        salary(1)
+        salary(100, bonus=5)
+        assert calls == [(100, 5), (100, 0), (1, 0), (100, 5)]
+        assert salary.cache.stats.evictions == 2
+
+    def test_bare_decorator_and_none_result(self):
+        """Тест: @memoize без параметров кэширует и None"""
+        calls = []
+
+        @memoize
+        def lookup(emp_id):
+            calls.append(emp_id)
+            return None
+
+        lookup(1)
+        lookup(1)
+        assert calls == [1]
+        assert lookup.__name__ == "lookup"
+
+    def test_exceptions_are_not_cached(self):
+        """Тест: Исключение не кэшируется"""
+        attempts = []
+
+        @memoize
+        def flaky(x):
+            attempts.append(x)
+            if len(attempts) == 1:
+                raise OSError("timeout")
+            return x
+
+        with pytest.raises(OSError):
+            flaky(3)
+        assert flaky(3) == 3
+        assert len(attempts) == 2
+
+    def test_interrupt_releases_waiters(self):
+        """Тест: KeyboardInterrupt загрузки передается ждущим потокам"""
+        started = threading.Event()
+        release = threading.Event()
+
+        @memoize
+        def interrupted(x):
+            started.set()
+            release.wait(5)
+            raise KeyboardInterrupt
+
+        errors = []
+
+        def call():
+            try:
+                interrupted(1)
+            except KeyboardInterrupt as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        assert not any(thread.is_alive() for thread in threads)
+        assert len(errors) == 4
+        with pytest.raises(KeyboardInterrupt):
+            interrupted(1)
+
+    def test_concurrent_calls_run_once(self):
+        """Тест: Одновременные вызовы с одним ключом выполняются один раз"""
+        release = threading.Event()
+        calls = []
+
+        @memoize
+        def slow(x):
+            calls.append(x)
+            release.wait(5)
+            return x * 2
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(slow(21))) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        while not calls:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert results == [42] * 8
+        assert len(calls) <= 2
+
+    def test_async_variant(self):
+        """Тест: Асинхронные вызовы с одним ключом ждут одну задачу"""
+        calls = []
+
+        @async_memoize(maxsize=10)
+        async def fetch(emp_id):
+            calls.append(emp_id)
+            await asyncio.sleep(0.01)
+            return f"E{emp_id}"
+
+        async def scenario():
+            first = await asyncio.gather(fetch(1), fetch(1), fetch(2))
+            return first, await fetch(1)
+
+        first, again = asyncio.run(scenario())
+        assert first == ["E1", "E1", "E2"]
+        assert again == "E1"
+        assert calls == [1, 2]
+        assert fetch.cache.stats.loads == 2
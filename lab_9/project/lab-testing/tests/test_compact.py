@@ -0,0 +1,99 @@
+import pytest
+from compact import (
+    SKILLS,
+    CompactEmployee,
+    CompactManager,
+    CompactDeveloper,
+    CompactSalesperson,
+    to_compact,
+)
+from department import Department
+from employee import Employee, Developer, Manager
+
+
+class TestCompactEmployees:
+    """Тестирование компактных сотрудников"""
+
+    def test_no_instance_dict(self):
+        """Тест: У компактных объектов нет __dict__"""
+        emp = CompactManager(1, "Alice", "MAN", 7000, 2000)
+
+        assert not hasattr(emp, "__dict__")
+        with pytest.raises(AttributeError):
+            emp.extra = 1
+
+    def test_salaries_match_regular(self):
+        """Тест: Зарплаты совпадают с обычными классами"""
+        staff = [
+            CompactEmployee(1, "John", "IT", 5000),
+            CompactManager(2, "Alice", "MAN", 7000, 2000),
+            CompactDeveloper(3, "Bob", "DEV", 5000, ["Python"], "senior"),
+            CompactSalesperson(4, "Charlie", "SAL", 4000, 0.15, 50000),
+        ]
+
+        assert [emp.calculate_salary() for emp in staff] == [5000, 9000, 10000, 11500]
+
+    def test_shared_strategies(self):
+        """Тест: Стратегия общая для всех компактных менеджеров"""
+        first = CompactManager(1, "Alice", "MAN", 7000, 2000)
+        second = CompactManager(2, "Bob", "MAN", 6000, 1000)
+
+        assert first.salary_strategy is second.salary_strategy
+
+    def test_interned_skills(self):
+        """Тест: Навыки хранятся как ID из общего реестра"""
+        dev = CompactDeveloper(1, "Bob", "DEV", 5000, ["Python", "Go"], "junior")
+
+        dev.add_skill("Python")
+        dev.add_skill("Rust")
+
+        assert dev.skills == ["Python", "Go", "Rust"]
+        assert SKILLS.name(SKILLS.intern("Go")) == "Go"
+        assert "Rust" in dev.get_info()
+
+    def test_works_with_department(self):
+        """Тест: Компактные объекты совместимы с отделом"""
+        dept = Department("DEV")
+        mgr = CompactManager(1, "Alice", "DEV", 7000, 2000)
+        dept.add_employee(mgr)
+        dept.add_employee(Employee(2, "John", "DEV", 5000))
+
+        mgr.bonus = 3000
+
+        assert mgr in dept
+        assert dept.calculate_total_salary() == 15000
+
+    def test_to_compact(self):
+        """Тест: Преобразование обычного сотрудника"""
+        dev = Developer(1, "Bob", "DEV", 5000, ["Python"], "middle")
+
+        compact = to_compact(dev)
+
+        assert isinstance(compact, CompactDeveloper)
+        assert compact == dev
+        assert compact.calculate_salary() == dev.calculate_salary()
+
+    def test_to_compact_subclass(self):
+        """Тест: Наследник преобразуется по MRO и не теряет бонус"""
+
+        class TeamLead(Manager):
+            pass
+
+        lead = TeamLead(1, "Alice", "DEV", 7000, 2000)
+
+        compact = to_compact(lead)
+
+        assert isinstance(compact, CompactManager)
+        assert compact.bonus == 2000
+        assert compact.calculate_salary() == lead.calculate_salary()
+        assert to_compact(compact) is compact
+
+    def test_to_compact_rejects_custom_salary(self):
+        """Тест: Класс со своим calculate_salary() не преобразуется"""
+
+        class Contractor(Employee):
+            def calculate_salary(self):
+                return self.base_salary * 2
+
+        with pytest.raises(ValueError, match="Contractor"):
+            to_compact(Contractor(1, "Bob", "DEV", 5000))
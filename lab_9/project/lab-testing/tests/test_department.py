@@ -1,93 +1,158 @@
-import pytest
-from department import Department
-from employee import Employee, Manager, Developer
-
-
-class TestDepartment:
-    """Тестирование Department"""
-
-    def test_add_employee(self):
-        """Тест: Добавление сотрудника"""
-        dept = Department("IT")
-        emp = Employee(1, "John", "IT", 5000)
-
-        dept.add_employee(emp)
-
-        assert len(dept) == 1
-
-    def test_department_len(self):
-        """Тест: __len__"""
-        dept = Department("IT")
-        dept.add_employee(Employee(1, "John", "IT", 5000))
-        dept.add_employee(Employee(2, "Jane", "IT", 6000))
-
-        assert len(dept) == 2
-
-    def test_department_getitem(self):
-        """Тест: __getitem__"""
-        dept = Department("IT")
-        emp = Employee(1, "John", "IT", 5000)
-
-        dept.add_employee(emp)
-
-        assert dept[0].name == "John"
-
-    def test_department_contains(self):
-        """Тест: __contains__"""
-        dept = Department("IT")
-        emp1 = Employee(1, "John", "IT", 5000)
-        emp2 = Employee(2, "Jane", "IT", 6000)
-
-        dept.add_employee(emp1)
-
-        assert emp1 in dept
-        assert emp2 not in dept
-
-    def test_department_iteration(self):
-        """Тест: Итерация"""
-        dept = Department("IT")
-        for i in range(3):
-            dept.add_employee(Employee(i + 1, f"Emp{i + 1}", "IT", 5000))
-
-        count = 0
-        for emp in dept:
-            count += 1
-
-        assert count == 3
-
-    def test_calculate_total_salary_polymorphic(self):
-        """Тест: Полиморфный расчет"""
-        dept = Department("DEV")
-        dept.add_employee(Manager(1, "Alice", "DEV", 7000, 2000))
-        dept.add_employee(Developer(2, "Bob", "DEV", 5000, ["Python"], "senior"))
-
-        total = dept.calculate_total_salary()
-
-        assert total == 19000
-
-
-class TestEmployeeComparison:
-    """Тестирование операторов сравнения"""
-
-    def test_employee_equality(self):
-        """Тест: == по ID"""
-        emp1 = Employee(1, "John", "IT", 5000)
-        emp2 = Employee(1, "Jane", "HR", 6000)
-
-        assert emp1 == emp2
-
-    def test_employee_less_than(self):
-        """Тест: < по зарплате"""
-        emp1 = Employee(1, "John", "IT", 5000)
-        emp2 = Employee(2, "Jane", "HR", 6000)
-
-        assert emp1 < emp2
-
-    def test_employee_addition(self):
-        """Тест: + сложение зарплат"""
-        emp1 = Employee(1, "John", "IT", 5000)
-        emp2 = Employee(2, "Jane", "HR", 6000)
-
-        total = emp1 + emp2
-
-        assert total == 11000
+import pytest
+from department import Department
+from employee import Employee, Manager, Developer
+
+
+class TestDepartment:
+    """Тестирование Department"""
+
+    def test_add_employee(self):
+        """Тест: Добавление сотрудника"""
+        dept = Department("IT")
+        emp = Employee(1, "John", "IT", 5000)
+
+        dept.add_employee(emp)
+
+        assert len(dept) == 1
+
+    def test_department_len(self):
+        """Тест: __len__"""
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        dept.add_employee(Employee(2, "Jane", "IT", 6000))
+
+        assert len(dept) == 2
+
+    def test_department_getitem(self):
+        """Тест: __getitem__"""
+        dept = Department("IT")
+        emp = Employee(1, "John", "IT", 5000)
+
+        dept.add_employee(emp)
+
+        assert dept[0].name == "John"
+
+    def test_department_contains(self):
+        """Тест: __contains__"""
+        dept = Department("IT")
+        emp1 = Employee(1, "John", "IT", 5000)
+        emp2 = Employee(2, "Jane", "IT", 6000)
+
+        dept.add_employee(emp1)
+
+        assert emp1 in dept
+        assert emp2 not in dept
+
+    def test_department_iteration(self):
+        """Тест: Итерация"""
+        dept = Department("IT")
+        for i in range(3):
+            dept.add_employee(Employee(i + 1, f"Emp{i + 1}", "IT", 5000))
+
+        count = 0
+        for emp in dept:
+            count += 1
+
+        assert count == 3
+
+    def test_calculate_total_salary_polymorphic(self):
+        """Тест: Полиморфный расчет"""
+        dept = Department("DEV")
+        dept.add_employee(Manager(1, "Alice", "DEV", 7000, 2000))
+        dept.add_employee(Developer(2, "Bob", "DEV", 5000, ["Python"], "senior"))
+
+        total = dept.calculate_total_salary()
+
+        assert total == 19000
+
+    def test_remove_keeps_order(self):
+        """Тест: Удаление сохраняет порядок и индексы"""
+        dept = Department("IT")
+        emps = [Employee(i, f"Emp{i}", "IT", 5000) for i in range(1, 5)]
+        for emp in emps:
+            dept.add_employee(emp)
+
+        dept.remove_employee(emps[1])
+
+        assert [emp.id for emp in dept] == [1, 3, 4]
+        assert dept[1].id == 3
+        assert emps[1] not in dept
+        assert dept.find_employee_by_id(2) is None
+        assert dept.find_employee_by_name("Emp2") is None
+
+    def test_duplicate_id_not_added(self):
+        """Тест: Сотрудник с тем же ID не добавляется повторно"""
+        dept = Department("IT")
+        dept.add_employee(Employee(1, "John", "IT", 5000))
+        dept.add_employee(Employee(1, "Jane", "IT", 6000))
+
+        assert len(dept) == 1
+        assert dept.find_employee_by_name("Jane") is None
+
+    def test_employees_list_updates_indexes(self):
+        """Тест: Изменения списка employees проходят через отдел"""
+        dept = Department("IT")
+        john = Employee(1, "John", "IT", 5000)
+        jane = Employee(2, "Jane", "IT", 6000)
+        dept.employees.append(john)
+        dept.employees.append(jane)
+        dept.employees.append(Employee(1, "Copy", "IT", 1000))
+
+        assert dept.employees == [john, jane]
+        assert dept.find_employee_by_name("Jane") is jane
+        assert dept.calculate_total_salary() == 11000
+
+        dept.employees.remove(john)
+        assert dept.find_employee_by_id(1) is None
+        assert dept.calculate_total_salary() == 6000
+
+        dept.employees[0] = john
+        assert list(dept) == [john]
+        assert dept.find_employee_by_id(2) is None
+
+        dept.employees = [jane, john]
+        assert [emp.id for emp in dept] == [2, 1]
+        assert dept.calculate_total_salary() == 11000
+
+        del dept.employees[:]
+        assert len(dept) == 0
+        assert dept.get_salary_stats()["count"] == 0
+
+    def test_find_by_name_returns_first(self):
+        """Тест: Поиск по имени возвращает первого добавленного"""
+        dept = Department("IT")
+        first = Employee(1, "John", "IT", 5000)
+        second = Employee(2, "John", "IT", 6000)
+        dept.add_employee(first)
+        dept.add_employee(second)
+
+        assert dept.find_employee_by_name("John") is first
+        dept.remove_employee(first)
+        assert dept.find_employee_by_name("John") is second
+
+
+class TestEmployeeComparison:
+    """Тестирование операторов сравнения"""
+
+    def test_employee_equality(self):
+        """Тест: == по ID"""
+        emp1 = Employee(1, "John", "IT", 5000)
+        emp2 = Employee(1, "Jane", "HR", 6000)
+
+        assert emp1 == emp2
+
+    def test_employee_less_than(self):
+        """Тест: < по зарплате"""
+        emp1 = Employee(1, "John", "IT", 5000)
+        emp2 = Employee(2, "Jane", "HR", 6000)
+
+        assert emp1 < emp2
+
+    def test_employee_addition(self):
+        """Тест: + сложение зарплат"""
+        emp1 = Employee(1, "John", "IT", 5000)
+        emp2 = Employee(2, "Jane", "HR", 6000)
+
+        total = emp1 + emp2
+
+        assert total == 11000
@@ -1,51 +1,168 @@
-import pytest
-from employee import Employee
-
-
-class TestEmployeeCreation:
-    """Тестирование создания Employee"""
-
-    def test_employee_creation_valid_data(self):
-        """Тест 1: Создание с валидными данными"""
-        emp = Employee(1, "Alice", "IT", 5000)
-
-        assert emp.id == 1
-        assert emp.name == "Alice"
-        assert emp.department == "IT"
-        assert emp.base_salary == 5000
-
-
-class TestEmployeeValidation:
-    """Тестирование валидации"""
-
-    def test_invalid_id_negative(self):
-        """Тест 2: Отрицательный ID вызывает ошибку"""
-        with pytest.raises(ValueError):
-            Employee(-1, "Alice", "IT", 5000)
-
-    def test_empty_name(self):
-        """Тест 3: Пустое имя вызывает ошибку"""
-        with pytest.raises(ValueError):
-            Employee(1, "", "IT", 5000)
-
-    def test_negative_salary(self):
-        """Тест 4: Отрицательная зарплата вызывает ошибку"""
-        with pytest.raises(ValueError):
-            Employee(1, "Alice", "IT", -5000)
-
-
-class TestEmployeeMethods:
-    """Тестирование методов"""
-
-    def test_calculate_salary(self):
-        """Тест 5: Расчет зарплаты базового сотрудника"""
-        emp = Employee(1, "Alice", "IT", 5000)
-        assert emp.calculate_salary() == 5000
-
-    def test_str_representation(self):
-        """Тест 6: Строковое представление"""
-        emp = Employee(1, "Alice", "IT", 5000)
-        result = str(emp)
-
-        assert "Alice" in result
-        assert "5000" in result
+import pytest
+from employee import Employee, Manager
+from strategies import BaseSalaryStrategy, SalaryCalculationStrategy
+
+
+class TestEmployeeCreation:
+    """Тестирование создания Employee"""
+
+    def test_employee_creation_valid_data(self):
+        """Тест 1: Создание с валидными данными"""
+        emp = Employee(1, "Alice", "IT", 5000)
+
+        assert emp.id == 1
+        assert emp.name == "Alice"
+        assert emp.department == "IT"
+        assert emp.base_salary == 5000
+
+
+class TestEmployeeValidation:
+    """Тестирование валидации"""
+
+    def test_invalid_id_negative(self):
+        """Тест 2: Отрицательный ID вызывает ошибку"""
+        with pytest.raises(ValueError):
+            Employee(-1, "Alice", "IT", 5000)
+
+    def test_empty_name(self):
+        """Тест 3: Пустое имя вызывает ошибку"""
+        with pytest.raises(ValueError):
+            Employee(1, "", "IT", 5000)
+
+    def test_negative_salary(self):
+        """Тест 4: Отрицательная зарплата вызывает ошибку"""
+        with pytest.raises(ValueError):
+            Employee(1, "Alice", "IT", -5000)
+
+
+class TestEmployeeMethods:
+    """Тестирование методов"""
+
+    def test_calculate_salary(self):
+        """Тест 5: Расчет зарплаты базового сотрудника"""
+        emp = Employee(1, "Alice", "IT", 5000)
+        assert emp.calculate_salary() == 5000
+
+    def test_str_representation(self):
+        """Тест 6: Строковое представление"""
+        emp = Employee(1, "Alice", "IT", 5000)
+        result = str(emp)
+
+        assert "Alice" in result
+        assert "5000" in result
+
+
+class TestFromRows:
+    """Тестирование массового создания сотрудников классом"""
+
+    def test_matches_constructor(self):
+        """Тест: from_rows() дает тех же сотрудников, что конструктор"""
+        rows = [(1, "Alice", "IT", 5000, 1000), (2, "Bob", "IT", 6000, 500)]
+
+        staff = Manager.from_rows(rows)
+
+        assert [vars(emp) for emp in staff] == [vars(Manager(*row)) for row in rows]
+        assert staff[0].salary_strategy is not staff[1].salary_strategy
+        assert [emp.calculate_salary() for emp in staff] == [6000, 6500]
+
+    def test_subclass_with_own_init_uses_constructor(self):
+        """Тест: Наследник со своим __init__ создается конструктором"""
+
+        class Intern(Employee):
+            def __init__(self, emp_id, name, department, base_salary):
+                super().__init__(emp_id, name, department, base_salary)
+                self.mentor = None
+
+        (intern,) = Intern.from_rows([(1, "Alice", "IT", 1000)])
+
+        assert intern.mentor is None
+        assert Employee.from_rows([(2, "Bob", "IT", 2000)])[0].name == "Bob"
+
+
+@pytest.fixture
+def cache_stats():
+    Employee.enable_salary_cache_stats()
+    yield
+    Employee.enable_salary_cache_stats(False)
+
+
+class TestSalaryCache:
+    """Тестирование кэша зарплат"""
+
+    def test_cache_hits_and_misses(self, cache_stats):
+        """Тест: Повторный расчет берется из кэша"""
+        emp = Employee(1, "Alice", "IT", 5000)
+        Employee.reset_salary_cache_stats()
+
+        emp.calculate_salary()
+        emp.calculate_salary()
+
+        assert Employee.salary_cache_stats() == {"hits": 1, "misses": 1}
+
+    def test_stats_disabled_by_default(self):
+        """Тест: Без включения счетчики не ведутся"""
+        emp = Employee(1, "Alice", "IT", 5000)
+
+        emp.calculate_salary()
+        emp.calculate_salary()
+
+        assert Employee.salary_cache_stats() == {"hits": 0, "misses": 0}
+
+    @pytest.mark.parametrize(
+        "field,value,expected",
+        [
+            ("bonus", 3000, 10000),
+            ("base_salary", 6000, 8000),
+        ],
+    )
+    def test_manager_invalidation(self, manager, field, value, expected):
+        """Тест: Изменение полей менеджера сбрасывает кэш"""
+        assert manager.calculate_salary() == 9000
+
+        setattr(manager, field, value)
+
+        assert manager.calculate_salary() == expected
+
+    def test_developer_and_salesperson_invalidation(self, developer, salesperson):
+        """Тест: Уровень, продажи и комиссия сбрасывают кэш"""
+        assert developer.calculate_salary() == 10000
+        assert salesperson.calculate_salary() == 11500
+
+        developer.level = "middle"
+        salesperson.sales = 60000
+        salesperson.commission = 0.1
+
+        assert developer.calculate_salary() == 7500
+        assert salesperson.calculate_salary() == 10000
+
+    def test_strategy_swap_invalidation(self, manager):
+        """Тест: Замена стратегии сбрасывает кэш"""
+        assert manager.calculate_salary() == 9000
+
+        manager.salary_strategy = BaseSalaryStrategy()
+
+        assert manager.calculate_salary() == 7000
+
+    def test_unrelated_field_keeps_cache(self, developer, cache_stats):
+        """Тест: Поле вне стратегии не сбрасывает кэш"""
+        developer.calculate_salary()
+        Employee.reset_salary_cache_stats()
+
+        developer.name = "Robert"
+        developer.calculate_salary()
+
+        assert Employee.salary_cache_stats()["hits"] == 1
+
+    def test_custom_strategy_not_cached(self):
+        """Тест: Пользовательская стратегия по умолчанию не кэшируется"""
+
+        class ExtraStrategy(SalaryCalculationStrategy):
+            def calculate(self, employee) -> float:
+                return employee.base_salary + getattr(employee, "extra", 0)
+
+        emp = Employee(1, "Alice", "IT", 5000, ExtraStrategy())
+        assert emp.calculate_salary() == 5000
+
+        emp.extra = 500
+
+        assert emp.calculate_salary() == 5500
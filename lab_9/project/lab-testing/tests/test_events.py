@@ -0,0 +1,210 @@
+import threading
+
+import pytest
+from company import Company, Department
+from department import Department as BaseDepartment
+from employee import Employee, Manager
+from events import (
+    ChangeFeed,
+    ChangeFeedGapError,
+    DepartmentMoved,
+    EmployeeHired,
+    EmployeeRemoved,
+    SalaryFieldChanged,
+)
+from patterns import InMemoryEmployeeRepository
+from project import Project
+
+
+class TestChangeFeed:
+    """Тестирование ленты изменений"""
+
+    def test_ring_buffer_and_cursor(self):
+        """Тест: Номера растут, старые события вытесняются"""
+        feed = ChangeFeed(capacity=3)
+        cursor = feed.cursor(offset=1)
+        for emp_id in range(1, 6):
+            feed.publish(EmployeeHired, "test", emp_id)
+
+        assert feed.first_sequence == 3
+        assert feed.last_sequence == 5
+        assert [e.employee_id for e in feed.read(4)] == [4, 5]
+        with pytest.raises(ChangeFeedGapError):
+            cursor.poll()
+
+        cursor = feed.cursor(offset=3)
+        assert [e.sequence for e in cursor.poll(limit=2)] == [3, 4]
+        assert [e.sequence for e in cursor.poll()] == [5]
+        assert cursor.poll() == []
+
+    def test_subscribe_from_offset(self):
+        """Тест: Подписка получает накопленные и новые события"""
+        feed = ChangeFeed()
+        feed.publish(EmployeeHired, "test", 1)
+        feed.publish(EmployeeHired, "test", 2)
+        received = []
+
+        feed.subscribe(received.append, offset=2)
+        feed.publish(EmployeeRemoved, "test", 1)
+        feed.unsubscribe(received.append)
+        feed.publish(EmployeeRemoved, "test", 2)
+
+        assert [(e.kind, e.employee_id) for e in received] == [
+            ("hired", 2),
+            ("removed", 1),
+        ]
+
+    def test_subscribers_called_outside_lock(self):
+        """Тест: Подписчик может ждать публикацию из другого потока"""
+        feed = ChangeFeed()
+        received = []
+
+        def on_event(event):
+            received.append(event.employee_id)
+            if event.employee_id == 1:
+                worker = threading.Thread(
+                    target=feed.publish, args=(EmployeeHired, "test", 2)
+                )
+                worker.start()
+                worker.join(5)
+
+        feed.subscribe(on_event)
+        feed.publish(EmployeeHired, "test", 1)
+
+        assert received == [1, 2]
+
+
+class TestCompanyFeed:
+    """Тестирование публикации событий компанией"""
+
+    def test_company_events_without_duplicates(self):
+        """Тест: Найм, изменение зарплаты, перевод и удаление"""
+        feed = ChangeFeed()
+        company = Company("TechCorp", feed=feed)
+        dev = Department("DEV")
+        sales = Department("SAL")
+        mgr = Manager(1, "Alice", "DEV", 7000, 2000)
+        dev.add_employee(mgr)
+        company.add_department(dev)
+        company.add_department(sales)
+        cursor = feed.cursor(offset=1)
+
+        sales.add_employee(mgr)
+        mgr.bonus = 3000
+        mgr.name = "Alicia"
+        company.transfer_employee(1, sales)
+        sales.remove_employee(1)
+
+        events = cursor.poll()
+        assert [type(e) for e in events] == [
+            EmployeeHired,
+            SalaryFieldChanged,
+            DepartmentMoved,
+            EmployeeRemoved,
+        ]
+        assert (events[1].field, events[1].old_value, events[1].new_value) == (
+            "bonus",
+            2000,
+            3000,
+        )
+        assert events[2].new_value == "SAL"
+        assert {e.source for e in events} == {"company"}
+
+    def test_department_feed(self):
+        """Тест: Отдел публикует свои события"""
+        feed = ChangeFeed()
+        dept = Department("IT", feed=feed)
+        emp = Employee(1, "John", "IT", 5000)
+
+        dept.add_employee(emp)
+        emp.base_salary = 6000
+        dept.remove_employee(1)
+
+        assert [e.kind for e in feed.read(1)] == ["hired", "salary_changed", "removed"]
+        assert feed.read(1)[0].source == "department:IT"
+
+    def test_project_and_repository_feed(self):
+        """Тест: Проект и хранилище публикуют события"""
+        feed = ChangeFeed()
+        repo = InMemoryEmployeeRepository(feed=feed)
+        proj = Project(1, "AI", "AI", "2024-12-31", "planning", feed=feed)
+        emp = Employee(1, "John", "IT", 5000)
+
+        repo.add(emp)
+        proj.add_team_member(emp)
+        proj.remove_team_member(1)
+        proj.remove_team_member(1)
+        repo.remove(1)
+
+        assert [(e.source, e.kind) for e in feed.read(1)] == [
+            ("repository", "hired"),
+            ("project:AI", "hired"),
+            ("project:AI", "removed"),
+            ("repository", "removed"),
+        ]
+
+    def test_transfer_between_base_departments(self):
+        """Тест: Перевод между отделами без удаления по ID"""
+        feed = ChangeFeed()
+        company = Company("TechCorp", feed=feed)
+        dev = BaseDepartment("DEV")
+        sales = BaseDepartment("SAL")
+        emp = Employee(1, "John", "DEV", 5000)
+        dev.add_employee(emp)
+        company.add_department(dev)
+        company.add_department(sales)
+        cursor = feed.cursor()
+
+        assert company.transfer_employee(1, sales) is True
+
+        assert dev.find_employee_by_id(1) is None
+        assert sales.find_employee_by_id(1) is emp
+        assert [type(e) for e in cursor.poll()] == [DepartmentMoved]
+        assert company.get_total_salary() == 5000
+
+    def test_repository_feed_kept_and_released(self):
+        """Тест: Лента хранилища не заменяется, close() отписывает"""
+        feed = ChangeFeed()
+        repository = InMemoryEmployeeRepository(feed=feed)
+        company = Company("TechCorp", repository)
+        repository.add(Employee(1, "John", "IT", 5000))
+
+        assert repository.feed is feed
+        assert company.get_total_salary() == 5000
+
+        company.close()
+        repository.add(Employee(2, "Jane", "IT", 4000))
+        assert company.get_total_salary() == 5000
+
+    def test_own_repository_feed_removed_on_close(self):
+        """Тест: Назначенная компанией лента снимается при закрытии"""
+        repository = InMemoryEmployeeRepository()
+        with Company("TechCorp", repository):
+            assert repository.feed is not None
+
+        assert repository.feed is None
+
+    def test_repository_without_feed(self):
+        """Тест: Хранилище без атрибута feed"""
+
+        class PlainRepository:
+            def __init__(self):
+                self.staff = {}
+
+            def add(self, employee):
+                self.staff[employee.id] = employee
+
+            def find_by_id(self, emp_id):
+                return self.staff.get(emp_id)
+
+            def get_all(self):
+                return list(self.staff.values())
+
+        repository = PlainRepository()
+        repository.add(Employee(1, "John", "IT", 5000))
+        company = Company("TechCorp", repository)
+        company.add_employee(Employee(2, "Jane", "IT", 4000))
+
+        assert not hasattr(repository, "feed")
+        assert company.get_total_salary() == 9000
+        company.close()
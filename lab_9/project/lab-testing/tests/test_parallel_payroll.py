@@ -0,0 +1,82 @@
+import pytest
+from company import Company
+from department import Department
+from employee import Employee, Manager, Developer, Salesperson
+from parallel_payroll import ParallelPayrollRunner, payroll_row, MANAGER, PRECOMPUTED
+from patterns import BonusDecorator
+
+
+def make_company():
+    company = Company("TechCorp")
+    dev = Department("Development")
+    sales = Department("Sales")
+    shared = Developer(2, "Bob", "DEV", 5000, ["Python"], "senior")
+    dev.add_employee(Manager(1, "Alice", "DEV", 7000, 2000))
+    dev.add_employee(shared)
+    sales.add_employee(shared)
+    for i in range(3, 8):
+        sales.add_employee(Salesperson(i, f"Sales{i}", "SAL", 4000, 0.15, 10000 * i))
+    company.add_department(dev)
+    company.add_department(sales)
+    company.add_employee(Employee(100, "John", "HR", 3000))
+    return company
+
+
+class TestParallelPayroll:
+    """Тестирование параллельного расчета зарплат"""
+
+    def test_row_is_compact(self):
+        """Тест: Строка сотрудника - кортеж чисел"""
+        row = payroll_row(Manager(1, "Alice", "DEV", 7000, 2000))
+
+        assert row == (MANAGER, 7000, 2000, 0)
+
+    def test_overridden_salary_is_precomputed(self):
+        """Тест: Класс со своим calculate_salary() и декоратор"""
+
+        class FixedEmployee(Employee):
+            def calculate_salary(self):
+                return 42.0
+
+        fixed = FixedEmployee(1, "John", "IT", 5000)
+        company = Company("TechCorp")
+        dept = Department("IT")
+        dept.add_employee(fixed)
+        company.add_department(dept)
+        runner = ParallelPayrollRunner(workers=1)
+
+        assert payroll_row(fixed) == (PRECOMPUTED, 42.0, 0, 0)
+        assert payroll_row(BonusDecorator(fixed, 8)) == (PRECOMPUTED, 50.0, 0, 0)
+        assert runner.run_serial(company).total == 42.0
+        assert runner.run(company).total == 42.0
+
+    def test_parallel_matches_company_total(self):
+        """Тест: Итог пула совпадает с Company.get_total_salary"""
+        company = make_company()
+        runner = ParallelPayrollRunner(workers=2, chunk_size=2)
+
+        result = runner.run(company)
+
+        assert result.total == pytest.approx(company.get_total_salary())
+        assert result.count == 8
+        assert result.department_totals["Development"] == 19000
+        assert result.department_counts["Sales"] == 5
+        assert result.department_totals[None] == 3000
+
+    def test_serial_matches_parallel(self):
+        """Тест: Последовательный и параллельный расчет совпадают"""
+        company = make_company()
+        runner = ParallelPayrollRunner(workers=2, chunk_size=3)
+
+        serial = runner.run_serial(company)
+        parallel = runner.run(company)
+
+        assert serial.total == pytest.approx(parallel.total)
+        assert serial.department_averages() == pytest.approx(
+            parallel.department_averages()
+        )
+
+    def test_invalid_chunk_size(self):
+        """Тест: Неположительный размер порции"""
+        with pytest.raises(ValueError):
+            ParallelPayrollRunner(chunk_size=0)
@@ -1,74 +1,323 @@
-import pytest
-from patterns import (
-    SingletonDatabase,
-    EmployeeBuilder,
-    BonusDecorator,
-    InMemoryEmployeeRepository,
-)
-from employee import Employee, Developer, Manager, Salesperson
-
-
-class TestSingleton:
-    """Тестирование Singleton"""
-
-    def test_singleton_same_instance(self):
-        """Тест: Один экземпляр"""
-        db1 = SingletonDatabase.get_instance()
-        db2 = SingletonDatabase.get_instance()
-
-        assert db1 is db2
-        assert id(db1) == id(db2)
-
-
-class TestBuilder:
-    """Тестирование Builder"""
-
-    def test_employee_builder(self):
-        """Тест: Построение через Builder"""
-        developer = (EmployeeBuilder()
-                     .set_id(101)
-                     .set_name("John Doe")
-                     .set_department("DEV")
-                     .set_base_salary(5000)
-                     .set_skills(["Python", "Java"])
-                     .set_seniority("senior")
-                     .build())
-
-        assert developer.id == 101
-        assert developer.name == "John Doe"
-        assert isinstance(developer, Developer)
-
-
-class TestDecorator:
-    """Тестирование Decorator"""
-
-    def test_bonus_decorator(self):
-        """Тест: Decorator добавляет бонус"""
-        emp = Employee(1, "John", "IT", 5000)
-        decorated = BonusDecorator(emp, 1000)
-
-        assert decorated.calculate_salary() == 6000
-
-
-class TestRepository:
-    """Тесты Repository паттерна."""
-
-    def test_repository_add_and_find(self):
-        """Тест: Добавление и поиск"""
-        repo = InMemoryEmployeeRepository()
-
-        emp = Employee(1, "John", "DEV", 5000)
-        repo.add(emp)
-
-        found = repo.find_by_id(1)
-        assert found is not None
-        assert found.name == "John"
-        assert found.id == 1
-
-        not_found = repo.find_by_id(999)
-        assert not_found is None
-
-        all_employees = repo.get_all()
-        assert len(all_employees) == 1
-        assert all_employees[0].name == "John"
-
+import threading
+import time
+import pytest
+from patterns import (
+    SingletonMeta,
+    SingletonDatabase,
+    EmployeeBuilder,
+    EmployeeFactory,
+    BonusDecorator,
+    EmployeeDecorator,
+    TrainingDecorator,
+    InMemoryEmployeeRepository,
+)
+from strategies import calculate_batch
+from compact import CompactDeveloper, CompactManager
+from employee import Employee, Developer, Manager, Salesperson
+
+
+class TestSingleton:
+    """Тестирование Singleton"""
+
+    def test_singleton_same_instance(self):
+        """Тест: Один экземпляр"""
+        db1 = SingletonDatabase.get_instance()
+        db2 = SingletonDatabase.get_instance()
+
+        assert db1 is db2
+        assert id(db1) == id(db2)
+
+    def test_concurrent_first_calls_create_once(self):
+        """Тест: Одновременные первые вызовы создают один экземпляр"""
+        created = []
+
+        class Service(metaclass=SingletonMeta):
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.01)
+
+        start = threading.Barrier(8)
+        instances = []
+
+        def worker():
+            start.wait()
+            instances.append(Service())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(created) == 1
+        assert all(instance is created[0] for instance in instances)
+
+    def test_batch_operations(self):
+        """Тест: Пакетная запись и чтение"""
+        db = SingletonDatabase.get_instance()
+        db.add_many({"a": 1, "b": None})
+        db.add_many([(("tuple", 1), "t"), ("c", 3)])
+        assert db.get_many(["c", "missing", ("tuple", 1), "a"]) == [3, None, "t", 1]
+        assert "b" in db and db.remove("b") is True
+        assert db.remove("b") is False
+        assert db.data["a"] == 1
+
+    def test_data_is_live(self):
+        """Тест: Запись через data попадает в базу"""
+        db = SingletonDatabase.get_instance()
+        size = len(db)
+
+        db.data["live"] = 1
+        assert db.get("live") == 1
+        assert len(db) == len(db.data) == size + 1
+        del db.data["live"]
+        assert "live" not in db
+        with pytest.raises(KeyError):
+            del db.data["live"]
+
+    def test_concurrent_writers(self):
+        """Тест: Параллельные записи не теряются"""
+        db = SingletonDatabase.get_instance()
+
+        def worker(n):
+            db.add_many((f"w{n}-{i}", i) for i in range(500))
+            for i in range(500):
+                db.add(f"s{n}-{i}", i)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        keys = [f"{kind}{n}-{i}" for kind in "ws" for n in range(8) for i in range(500)]
+        assert db.get_many(keys) == list(range(500)) * 16
+
+
+class TestBuilder:
+    """Тестирование Builder"""
+
+    def test_employee_builder(self):
+        """Тест: Построение через Builder"""
+        developer = (
+            EmployeeBuilder()
+            .set_id(101)
+            .set_name("John Doe")
+            .set_department("DEV")
+            .set_base_salary(5000)
+            .set_skills(["Python", "Java"])
+            .set_seniority("senior")
+            .build()
+        )
+
+        assert developer.id == 101
+        assert developer.name == "John Doe"
+        assert isinstance(developer, Developer)
+
+
+class TestEmployeeFactory:
+    """Тестирование массового создания сотрудников"""
+
+    ROWS = [
+        {
+            "type": "manager",
+            "id": 1,
+            "name": "A",
+            "department": "M",
+            "base_salary": 7000,
+            "bonus": 2000,
+        },
+        {
+            "id": 2,
+            "name": "B",
+            "department": "D",
+            "base_salary": 5000,
+            "skills": ["Go"],
+            "seniority": "senior",
+        },
+        ("Salesperson", 3, "C", "S", 4000, 0.1, 10000),
+        ("employee", 4, "D", "IT", 3000),
+    ]
+
+    def test_rows_and_tuples(self):
+        """Тест: Словари и кортежи дают сотрудников нужных типов"""
+        staff = list(EmployeeFactory.create_many(self.ROWS, chunk_size=3))
+
+        assert [type(emp) for emp in staff] == [
+            Manager,
+            Developer,
+            Salesperson,
+            Employee,
+        ]
+        assert [emp.calculate_salary() for emp in staff] == [9000, 10000, 5000, 3000]
+        assert staff[1].skills == ["Go"]
+
+    def test_matches_constructor(self):
+        """Тест: Сотрудник фабрики ведет себя как созданный конструктором"""
+        (manager,) = EmployeeFactory.create_many([self.ROWS[0]])
+
+        assert vars(manager) == vars(Manager(1, "A", "M", 7000, 2000))
+        assert manager.calculate_salary() == 9000
+        manager.bonus = 3000
+        assert manager.calculate_salary() == 10000
+
+    def test_compact(self):
+        """Тест: Компактные сотрудники"""
+        staff = list(EmployeeFactory.create_many(self.ROWS, compact=True))
+
+        assert isinstance(staff[0], CompactManager)
+        assert isinstance(staff[1], CompactDeveloper)
+        assert staff[1].calculate_salary() == 10000
+
+    @pytest.mark.parametrize(
+        "row, message",
+        [
+            ({"type": "intern", "id": 9}, "Строка 4: неизвестный тип"),
+            (
+                {
+                    "type": "manager",
+                    "id": 9,
+                    "name": "X",
+                    "department": "M",
+                    "base_salary": 1,
+                },
+                "Строка 4: нет столбца bonus",
+            ),
+            (("employee", 1, "X", "IT", 1), "Строка 4: ID повторяется"),
+            (("employee", 9, "", "IT", 1), "Строка 4: Имя"),
+        ],
+    )
+    def test_invalid_rows(self, row, message):
+        """Тест: Ошибка содержит номер строки"""
+        with pytest.raises(ValueError, match=message):
+            list(EmployeeFactory.create_many(self.ROWS + [row], chunk_size=2))
+
+    def test_rejected_rows_are_skipped(self):
+        """Тест: Некорректные строки откладываются, остальные создаются"""
+        rows = self.ROWS + [
+            ("employee", 1, "X", "IT", 1),
+            ("intern", 9),
+            ("employee", -5, "", "IT", -1),
+            ("employee", 6, "F", "IT", 100),
+        ]
+        rejected = []
+        staff = list(EmployeeFactory.create_many(rows, 3, rejected=rejected))
+
+        assert [emp.id for emp in staff] == [1, 2, 3, 4, 6]
+        errors = {number: errors for number, _, errors in rejected}
+        assert sorted(errors) == [4, 5, 6]
+        assert errors[4] == ["ID повторяется"]
+        assert len(errors[6]) == 3
+
+
+class TestDecorator:
+    """Тестирование Decorator"""
+
+    def test_bonus_decorator(self):
+        """Тест: Decorator добавляет бонус"""
+        emp = Employee(1, "John", "IT", 5000)
+        decorated = BonusDecorator(emp, 1000)
+
+        assert decorated.calculate_salary() == 6000
+
+    def test_stack_is_flattened(self):
+        """Тест: Стек декораторов сворачивается в salary * a + b"""
+        emp = Employee(1, "John", "IT", 5000)
+        layers = TrainingDecorator(BonusDecorator(emp, 1000), 0.5)
+        decorated = BonusDecorator(layers, 200)
+
+        base, scale, offset = decorated.salary_transform()
+        assert base is emp
+        assert (scale, offset) == (1.5, 1700)
+        assert decorated.calculate_salary() == 9200
+        assert "обучение 50%" in decorated.get_info()
+
+    def test_recompiled_after_change(self):
+        """Тест: Изменение слоя или сотрудника учитывается"""
+        emp = Employee(1, "John", "IT", 5000)
+        inner = BonusDecorator(emp, 1000)
+        decorated = TrainingDecorator(inner, 0.1)
+        assert decorated.calculate_salary() == pytest.approx(6600)
+
+        inner.bonus_amount = 2000
+        assert decorated.calculate_salary() == pytest.approx(7700)
+        emp.base_salary = 6000
+        assert decorated.calculate_salary() == pytest.approx(8800)
+
+    def test_custom_layer_is_not_folded(self):
+        """Тест: Слой с собственным calculate_salary() вызывается как есть"""
+
+        class CapDecorator(EmployeeDecorator):
+            def calculate_salary(self):
+                return min(self.employee.calculate_salary(), 5500)
+
+        emp = Employee(1, "John", "IT", 5000)
+        decorated = BonusDecorator(CapDecorator(BonusDecorator(emp, 1000)), 100)
+        assert decorated.salary_transform()[1:] == (1.0, 100)
+        assert decorated.calculate_salary() == 5600
+
+    def test_subclass_calling_super(self):
+        """Тест: Наследник с super().calculate_salary() не зацикливается"""
+
+        class CappedBonusDecorator(BonusDecorator):
+            def calculate_salary(self):
+                return min(super().calculate_salary(), 5800)
+
+        emp = Employee(1, "John", "IT", 5000)
+        capped = CappedBonusDecorator(emp, 1000)
+        decorated = TrainingDecorator(capped, 0.5)
+
+        assert capped.calculate_salary() == 5800
+        assert decorated.calculate_salary() == pytest.approx(8700)
+        capped.bonus_amount = 500
+        assert decorated.calculate_salary() == pytest.approx(8250)
+        assert calculate_batch([decorated, capped]).tolist() == pytest.approx(
+            [8250, 5500]
+        )
+
+    def test_change_invalidates_only_own_stack(self):
+        """Тест: Изменение декоратора не сбрасывает чужие стеки"""
+        emp = Employee(1, "John", "IT", 5000)
+        inner = BonusDecorator(emp, 1000)
+        decorated = TrainingDecorator(inner, 0.5)
+        other = BonusDecorator(emp, 100)
+        other.salary_transform()
+        decorated.salary_transform()
+        other_token, token = other._token, decorated._token
+
+        inner.bonus_amount = 2000
+
+        assert other._token is other_token
+        assert decorated._token is not token
+        assert decorated.calculate_salary() == pytest.approx(10500)
+
+    def test_batch_applies_transform(self):
+        """Тест: Пакетный расчет учитывает декораторы"""
+        staff = [
+            Employee(1, "John", "IT", 5000),
+            TrainingDecorator(Manager(2, "Alice", "MAN", 7000, 2000), 0.5),
+            BonusDecorator(Developer(3, "Bob", "DEV", 5000, ["Go"], "senior"), 50),
+        ]
+        expected = [emp.calculate_salary() for emp in staff]
+        assert calculate_batch(staff).tolist() == expected
+
+
+class TestRepository:
+    """Тесты Repository паттерна."""
+
+    def test_repository_add_and_find(self):
+        """Тест: Добавление и поиск"""
+        repo = InMemoryEmployeeRepository()
+
+        emp = Employee(1, "John", "DEV", 5000)
+        repo.add(emp)
+
+        found = repo.find_by_id(1)
+        assert found is not None
+        assert found.name == "John"
+        assert found.id == 1
+
+        not_found = repo.find_by_id(999)
+        assert not_found is None
+
+        all_employees = repo.get_all()
+        assert len(all_employees) == 1
+        assert all_employees[0].name == "John"
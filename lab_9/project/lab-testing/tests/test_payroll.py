@@ -0,0 +1,114 @@
+import pytest
+from payroll import PayrollTable
+from department import Department
+from company import Company
+from employee import Employee, Manager, Developer, Salesperson
+from patterns import BonusDecorator
+from strategies import SalaryCalculationStrategy
+
+
+class DoubleSalaryStrategy(SalaryCalculationStrategy):
+    """Пользовательская стратегия для проверки запасного пути"""
+
+    def calculate(self, employee) -> float:
+        return employee.base_salary * 2
+
+
+def make_staff():
+    return [
+        Employee(1, "John", "IT", 5000),
+        Manager(2, "Alice", "MAN", 7000, 2000),
+        Developer(3, "Bob", "DEV", 5000, ["Python"], "middle"),
+        Developer(4, "Eve", "DEV", 4000, [], "unknown"),
+        Salesperson(5, "Charlie", "SAL", 4000, 0.15, 50000),
+        Employee(6, "Dan", "IT", 3000, DoubleSalaryStrategy()),
+    ]
+
+
+class TestPayrollTable:
+    """Тестирование колоночного движка"""
+
+    def test_total_matches_strategies(self):
+        """Тест: Итог совпадает с calculate_salary()"""
+        staff = make_staff()
+        table = PayrollTable.from_employees(staff)
+
+        expected = sum(emp.calculate_salary() for emp in staff)
+
+        assert len(table) == 6
+        assert table.total() == pytest.approx(expected)
+        assert table.average() == pytest.approx(expected / 6)
+
+    def test_totals_by_strategy(self):
+        """Тест: Суммы по стратегиям"""
+        table = PayrollTable.from_employees(make_staff())
+        totals = table.totals_by_strategy()
+
+        assert totals["ManagerSalaryStrategy"] == 9000
+        assert totals["DeveloperSalaryStrategy"] == 11500
+        assert totals["SalespersonSalaryStrategy"] == 11500
+        assert totals["DoubleSalaryStrategy"] == 6000
+
+    def test_department_breakdown(self):
+        """Тест: Разбивка по отделам"""
+        table = PayrollTable.from_employees(make_staff())
+
+        assert table.department_totals() == {
+            "IT": 11000,
+            "MAN": 9000,
+            "DEV": 11500,
+            "SAL": 11500,
+        }
+        assert table.department_averages()["IT"] == 5500
+
+    def test_overridden_salary_and_decorators(self):
+        """Тест: Классы со своим calculate_salary() и декораторы"""
+
+        class FixedEmployee(Employee):
+            def calculate_salary(self) -> float:
+                return 42.0
+
+        fixed = FixedEmployee(1, "Fix", "IT", 5000)
+        decorated = BonusDecorator(Manager(2, "Alice", "MAN", 7000, 2000), 500)
+        table = PayrollTable.from_employees([fixed, decorated])
+
+        assert table.total() == 9542
+        assert table.totals_by_strategy() == {
+            "FixedEmployee": 42,
+            "BonusDecorator": 9500,
+        }
+        assert table.department_totals() == {"IT": 42, "MAN": 9500}
+
+    def test_empty_department_name(self):
+        """Тест: Пустое название отдела не заменяется отделом сотрудника"""
+        table = PayrollTable.from_employees(make_staff()[:2], department="")
+
+        assert table.department_totals() == {"": 14000}
+
+    def test_empty_table(self):
+        """Тест: Пустая таблица"""
+        table = PayrollTable()
+
+        assert table.total() == 0
+        assert table.average() == 0
+
+
+class TestCompanyPayroll:
+    """Тестирование расчетов компании через движок"""
+
+    def test_salary_by_department(self):
+        """Тест: Разбивка компании по объектам отделов"""
+        company = Company("TechCorp")
+        dev_dept = Department("Development")
+        sales_dept = Department("Sales")
+        dev_dept.add_employee(Manager(1, "Alice", "DEV", 7000, 2000))
+        dev_dept.add_employee(Developer(2, "Bob", "DEV", 5000, [], "senior"))
+        sales_dept.add_employee(Salesperson(3, "Charlie", "SAL", 4000, 0.15, 50000))
+        company.add_department(dev_dept)
+        company.add_department(sales_dept)
+
+        assert company.get_salary_by_department() == {
+            "Development": 19000,
+            "Sales": 11500,
+        }
+        assert company.get_total_salary() == 30500
@@ -1,100 +1,228 @@
-import pytest
-from company import Company
-from project import Project
-from department import Department
-from employee import Employee, Manager, Developer, Salesperson
-
-
-class TestCompany:
-    """Тестирование Company"""
-
-    def test_add_department(self):
-        """Тест: Добавление отдела"""
-        company = Company("TechCorp")
-        dept = Department("Development")
-
-        company.add_department(dept)
-
-        assert len(company.get_departments()) == 1
-
-    def test_remove_empty_department(self):
-        """Тест: Удаление пустого отдела"""
-        company = Company("TechCorp")
-        dept = Department("Development")
-
-        company.add_department(dept)
-        company.remove_department("Development")
-
-        assert len(company.get_departments()) == 0
-
-    def test_cannot_delete_department_with_employees(self):
-        """Тест: Нельзя удалить отдел с сотрудниками"""
-        company = Company("TechCorp")
-        dept = Department("Development")
-        emp = Employee(1, "John", "DEV", 5000)
-
-        dept.add_employee(emp)
-        company.add_department(dept)
-
-        with pytest.raises(ValueError, match="Cannot delete"):
-            company.remove_department("Development")
-
-    def test_find_employee(self):
-        """Тест: Поиск сотрудника"""
-        company = Company("TechCorp")
-        dept = Department("Development")
-        emp = Employee(1, "John", "DEV", 5000)
-
-        dept.add_employee(emp)
-        company.add_department(dept)
-
-        found = company.find_employee_by_id(1)
-
-        assert found is not None
-        assert found.name == "John"
-
-    def test_complex_company_structure(self):
-        """Тест: Интеграционный тест"""
-        company = Company("TechInnovations")
-
-        dev_dept = Department("Development")
-        sales_dept = Department("Sales")
-
-        mgr = Manager(1, "Alice", "DEV", 7000, 2000)
-        dev = Developer(2, "Bob", "DEV", 5000, ["Python"], "senior")
-        sales = Salesperson(3, "Charlie", "SAL", 4000, 0.15, 50000)
-
-        dev_dept.add_employee(mgr)
-        dev_dept.add_employee(dev)
-        sales_dept.add_employee(sales)
-
-        company.add_department(dev_dept)
-        company.add_department(sales_dept)
-
-        assert len(company.get_all_employees()) == 3
-        assert company.calculate_total_monthly_cost() == 30500
-
-
-class TestProject:
-    """Тестирование Project"""
-
-    def test_add_team_member(self):
-        """Тест: Добавление в команду"""
-        proj = Project(1, "AI Platform", "Разработка AI", "2024-12-31", "planning")
-        dev = Developer(1, "John", "DEV", 5000, ["Python"], "senior")
-
-        proj.add_team_member(dev)
-
-        assert proj.get_team_size() == 1
-
-    def test_project_total_salary(self):
-        """Тест: Полиморфный расчет"""
-        proj = Project(1, "AI", "AI", "2024-12-31", "planning")
-
-        mgr = Manager(1, "Alice", "DEV", 7000, 2000)
-        dev = Developer(2, "Bob", "DEV", 5000, ["Python"], "senior")
-
-        proj.add_team_member(mgr)
-        proj.add_team_member(dev)
-
-        assert proj.calculate_total_salary() == 19000
+import pytest
+from company import Company, Department as CompanyDepartment
+from project import Project
+from department import Department
+from employee import Employee, Manager, Developer, Salesperson
+from patterns import EmployeeRepository
+
+
+class TestCompany:
+    """Тестирование Company"""
+
+    def test_add_department(self):
+        """Тест: Добавление отдела"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+
+        company.add_department(dept)
+
+        assert len(company.get_departments()) == 1
+
+    def test_remove_empty_department(self):
+        """Тест: Удаление пустого отдела"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+
+        company.add_department(dept)
+        company.remove_department("Development")
+
+        assert len(company.get_departments()) == 0
+
+    def test_cannot_delete_department_with_employees(self):
+        """Тест: Нельзя удалить отдел с сотрудниками"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+        emp = Employee(1, "John", "DEV", 5000)
+
+        dept.add_employee(emp)
+        company.add_department(dept)
+
+        with pytest.raises(ValueError, match="Cannot delete"):
+            company.remove_department("Development")
+
+    def test_find_employee(self):
+        """Тест: Поиск сотрудника"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+        emp = Employee(1, "John", "DEV", 5000)
+
+        dept.add_employee(emp)
+        company.add_department(dept)
+
+        found = company.find_employee_by_id(1)
+
+        assert found is not None
+        assert found.name == "John"
+
+    def test_complex_company_structure(self):
+        """Тест: Интеграционный тест"""
+        company = Company("TechInnovations")
+
+        dev_dept = Department("Development")
+        sales_dept = Department("Sales")
+
+        mgr = Manager(1, "Alice", "DEV", 7000, 2000)
+        dev = Developer(2, "Bob", "DEV", 5000, ["Python"], "senior")
+        sales = Salesperson(3, "Charlie", "SAL", 4000, 0.15, 50000)
+
+        dev_dept.add_employee(mgr)
+        dev_dept.add_employee(dev)
+        sales_dept.add_employee(sales)
+
+        company.add_department(dev_dept)
+        company.add_department(sales_dept)
+
+        assert len(company.get_all_employees()) == 3
+        assert company.calculate_total_monthly_cost() == 30500
+
+    def test_company_department_remove_by_id(self):
+        """Тест: Отдел компании удаляет сотрудника по ID"""
+        dept = CompanyDepartment("Development")
+        dept.add_employee(Employee(1, "John", "DEV", 5000))
+        dept.add_employee(Employee(2, "Jane", "DEV", 6000))
+
+        assert dept.remove_employee(1) is True
+        assert dept.remove_employee(1) is False
+        assert 2 in dept
+        assert dept.get_total_salary() == 6000
+
+    def test_company_department_ignores_duplicate_id(self):
+        """Тест: Отдел компании не добавляет сотрудника повторно"""
+        dept = CompanyDepartment("Development")
+        dept.add_employee(Employee(1, "John", "DEV", 5000))
+        dept.add_employee(Employee(1, "John", "DEV", 5000))
+
+        assert len(dept) == 1
+        assert dept.get_total_salary() == 5000
+
+    def test_all_employees_deduplicated(self):
+        """Тест: Сотрудник из нескольких источников учитывается один раз"""
+        company = Company("TechCorp")
+        first = Department("Development")
+        second = Department("Research")
+        shared = Employee(1, "John", "DEV", 5000)
+        first.add_employee(shared)
+        first.add_employee(Employee(2, "Jane", "DEV", 6000))
+        second.add_employee(shared)
+        second.add_employee(Employee(3, "Bob", "RES", 7000))
+        company.add_department(first)
+        company.add_department(second)
+        company.add_employee(Employee(4, "Eve", "HR", 4000))
+        company.add_employee(Employee(3, "Bob", "RES", 7000))
+
+        ids = [emp.id for emp in company.get_all_employees()]
+
+        assert ids == [4, 3, 1, 2]
+        assert [emp.id for emp in company.iter_all_employees()] == ids
+        assert company.get_total_salary() == 22000
+
+
+class TestCompanyIndex:
+    """Тестирование глобального индекса сотрудников"""
+
+    def test_index_follows_department_changes(self):
+        """Тест: Индекс обновляется при изменении отделов"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        emp = Employee(1, "John", "DEV", 5000)
+
+        dept.add_employee(emp)
+        assert company.find_employee_by_id(1) is emp
+
+        dept.remove_employee(emp)
+        assert company.find_employee_by_id(1) is None
+
+    def test_index_follows_repository(self):
+        """Тест: Индекс учитывает repository и ссылки из отделов"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+        company.add_department(dept)
+        emp = Employee(1, "John", "DEV", 5000)
+
+        company.add_employee(emp)
+        dept.add_employee(emp)
+        assert company.remove_employee(1) is True
+        assert company.find_employee_by_id(1) is emp
+
+        dept.remove_employee(emp)
+        assert company.find_employee_by_id(1) is None
+        assert company.remove_employee(1) is False
+
+    def test_department_added_twice(self):
+        """Тест: Повторное добавление отдела не дублирует ссылки"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+        emp = Employee(1, "John", "DEV", 5000)
+        dept.add_employee(emp)
+        company.add_department(dept)
+        company.add_department(dept)
+
+        dept.remove_employee(emp)
+
+        assert company.departments == [dept]
+        assert company.find_employee_by_id(1) is None
+        assert company.get_total_salary() == 0
+
+    def test_legacy_repository_without_remove(self):
+        """Тест: Хранилище без remove() по-прежнему создается"""
+
+        class LegacyRepository(EmployeeRepository):
+            def __init__(self):
+                self.staff = {}
+
+            def add(self, employee):
+                self.staff[employee.id] = employee
+
+            def find_by_id(self, emp_id):
+                return self.staff.get(emp_id)
+
+            def get_all(self):
+                return list(self.staff.values())
+
+        company = Company("TechCorp", LegacyRepository())
+        company.add_employee(Employee(1, "John", "DEV", 5000))
+
+        assert company.find_employee_by_id(1).name == "John"
+        with pytest.raises(NotImplementedError):
+            company.remove_employee(1)
+
+    def test_repository_preferred_over_department(self):
+        """Тест: Объект из repository имеет приоритет"""
+        company = Company("TechCorp")
+        dept = Department("Development")
+        in_dept = Employee(1, "John", "DEV", 5000)
+        in_repo = Employee(1, "John", "DEV", 6000)
+        dept.add_employee(in_dept)
+        company.add_department(dept)
+
+        company.add_employee(in_repo)
+        assert company.find_employee_by_id(1) is in_repo
+
+        company.remove_employee(1)
+        assert company.find_employee_by_id(1) is in_dept
+
+
+class TestProject:
+    """Тестирование Project"""
+
+    def test_add_team_member(self):
+        """Тест: Добавление в команду"""
+        proj = Project(1, "AI Platform", "Разработка AI", "2024-12-31", "planning")
+        dev = Developer(1, "John", "DEV", 5000, ["Python"], "senior")
+
+        proj.add_team_member(dev)
+
+        assert proj.get_team_size() == 1
+
+    def test_project_total_salary(self):
+        """Тест: Полиморфный расчет"""
+        proj = Project(1, "AI", "AI", "2024-12-31", "planning")
+
+        mgr = Manager(1, "Alice", "DEV", 7000, 2000)
+        dev = Developer(2, "Bob", "DEV", 5000, ["Python"], "senior")
+
+        proj.add_team_member(mgr)
+        proj.add_team_member(dev)
+
+        assert proj.calculate_total_salary() == 19000
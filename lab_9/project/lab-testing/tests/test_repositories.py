@@ -0,0 +1,505 @@
+import os
+import threading
+import time
+import pytest
+from compact import CompactDeveloper
+from employee import Employee, Manager, Developer, Salesperson
+from company import Company
+from strategies import BaseSalaryStrategy, ManagerSalaryStrategy
+from repositories import (
+    CachingEmployeeRepository,
+    FileEmployeeRepository,
+    InMemoryEmployeeRepository,
+    MmapEmployeeRepository,
+    SqliteEmployeeRepository,
+)
+
+
+class DoubleStrategy(BaseSalaryStrategy):
+    """Пользовательская стратегия"""
+
+    def calculate(self, employee) -> float:
+        return employee.base_salary * 2
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return str(tmp_path / "employees.log")
+
+
+class TestFileEmployeeRepository:
+    """Тестирование файлового хранилища сотрудников"""
+
+    def test_round_trip_types(self, log_path):
+        """Тест: Сотрудники разных типов сохраняются и читаются"""
+        staff = [
+            Employee(1, "John", "IT", 5000),
+            Manager(2, "Alice", "MAN", 7000, 2000),
+            Developer(3, "Bob", "DEV", 5000, ["Python"], "senior"),
+            Salesperson(4, "Charlie", "SAL", 4000, 0.15, 50000),
+            CompactDeveloper(5, "Dana", "DEV", 6000, ["Go"], "middle"),
+        ]
+        with FileEmployeeRepository(log_path, batch_size=2) as repo:
+            for emp in staff:
+                repo.save_employee(emp)
+
+            loaded = repo.get_employee(3)
+            assert isinstance(loaded, Developer)
+            assert loaded.calculate_salary() == 10000
+            assert repo.get_employee(5).skills == ["Go"]
+
+        with FileEmployeeRepository(log_path) as repo:
+            salaries = [emp.calculate_salary() for emp in repo.get_all_employees()]
+            assert salaries == [5000, 9000, 10000, 11500, 9000]
+
+    def test_overwrite_and_delete(self, log_path):
+        """Тест: Перезапись и удаление по ID"""
+        with FileEmployeeRepository(log_path) as repo:
+            repo.save_employee(Employee(1, "John", "IT", 5000))
+            repo.save_employee(Employee(1, "John", "IT", 6000))
+            repo.save_employee(Employee(2, "Jane", "IT", 4000))
+
+            assert repo.delete_employee(2) is True
+            assert repo.delete_employee(2) is False
+            assert repo.get_employee(1).base_salary == 6000
+            assert len(repo) == 1
+
+        with FileEmployeeRepository(log_path) as repo:
+            assert repo.get_employee(2) is None
+            assert repo.get_employee(1).base_salary == 6000
+
+    def test_recovery_without_checkpoint(self, log_path):
+        """Тест: Хвост журнала после индекса дочитывается при открытии"""
+        repo = FileEmployeeRepository(log_path)
+        repo.save_employee(Employee(1, "John", "IT", 5000))
+        repo.checkpoint()
+        repo.save_employee(Employee(2, "Jane", "IT", 4000))
+        repo.delete_employee(1)
+        repo.flush()
+        # Имитация сбоя: индекс не сохранен, последняя запись оборвана
+        repo._file.close()
+        with open(log_path, "ab") as file:
+            file.write(b"\x01\x02")
+
+        with FileEmployeeRepository(log_path) as reopened:
+            assert reopened.get_employee(1) is None
+            assert reopened.get_employee(2).name == "Jane"
+            reopened.save_employee(Employee(3, "Jim", "IT", 3000))
+        with FileEmployeeRepository(log_path) as reopened:
+            assert reopened.get_employee(3).name == "Jim"
+
+    def _crash_with_corruption(self, log_path, record):
+        """Три записи без индекса, в записи record испорчен байт данных"""
+        repo = FileEmployeeRepository(log_path)
+        offsets = []
+        for emp_id in (1, 2, 3):
+            repo.save_employee(Employee(emp_id, f"Emp{emp_id}", "IT", 5000))
+            offsets.append(repo._index[emp_id][0])
+        repo.flush()
+        repo._file.close()
+        with open(log_path, "r+b") as file:
+            file.seek(offsets[record] + 5)
+            byte = file.read(1)
+            file.seek(offsets[record] + 5)
+            file.write(bytes([byte[0] ^ 0xFF]))
+
+    def test_corrupted_last_record_truncated(self, log_path):
+        """Тест: Испорченная последняя запись отрезается как оборванная"""
+        self._crash_with_corruption(log_path, record=2)
+
+        with FileEmployeeRepository(log_path) as repo:
+            assert len(repo) == 2
+            assert repo.get_employee(2).name == "Emp2"
+
+    def test_corruption_in_the_middle_keeps_data(self, log_path):
+        """Тест: Порча в середине журнала не отрезает следующие записи"""
+        self._crash_with_corruption(log_path, record=0)
+        size = os.path.getsize(log_path)
+
+        with pytest.raises(ValueError):
+            FileEmployeeRepository(log_path)
+
+        assert os.path.getsize(log_path) == size
+
+    def test_strategy_round_trip(self, log_path):
+        """Тест: Встроенная стратегия, отличная от стратегии типа, сохраняется"""
+        emp = Employee(1, "John", "IT", 5000, ManagerSalaryStrategy())
+        emp.bonus = 1000
+        with FileEmployeeRepository(log_path) as repo:
+            repo.save_employee(emp)
+            repo.save_employee(Manager(2, "Alice", "MAN", 7000, 2000))
+            with pytest.raises(ValueError):
+                repo.save_employee(Employee(3, "Bob", "IT", 5000, DoubleStrategy()))
+
+        with FileEmployeeRepository(log_path) as repo:
+            assert repo.get_employee(1).calculate_salary() == 6000
+            assert repo.get_employee(2).calculate_salary() == 9000
+            assert repo.get_employee(3) is None
+
+    def test_compaction_drops_stale_records(self, log_path):
+        """Тест: Уплотнение удаляет устаревшие записи"""
+        with FileEmployeeRepository(log_path) as repo:
+            for salary in range(1000, 1100):
+                repo.save_employee(Employee(1, "John", "IT", salary))
+            repo.save_employee(Employee(2, "Jane", "IT", 4000))
+            repo.flush()
+            size_before = os.path.getsize(log_path)
+
+            repo.compact()
+
+            assert os.path.getsize(log_path) < size_before / 10
+            assert repo.get_employee(1).base_salary == 1099
+            repo.save_employee(Employee(3, "Jim", "IT", 3000))
+
+        with FileEmployeeRepository(log_path) as repo:
+            assert len(repo) == 3
+            assert repo.get_employee(3).base_salary == 3000
+
+    def test_background_compaction(self, log_path):
+        """Тест: Уплотнение запускается в фоне по порогу"""
+        repo = FileEmployeeRepository(
+            log_path, batch_size=10, compact_min_bytes=1000, compact_ratio=0.5
+        )
+        for salary in range(1000, 1200):
+            repo.save_employee(Employee(1, "John", "IT", salary))
+        repo.close()
+
+        with FileEmployeeRepository(log_path) as reopened:
+            assert reopened.get_employee(1).base_salary == 1199
+            assert os.path.getsize(log_path) < 5000
+
+
+class TestMmapEmployeeRepository:
+    """Тестирование хранилища на отображаемом в память файле"""
+
+    @pytest.fixture
+    def data_path(self, tmp_path):
+        return str(tmp_path / "employees.dat")
+
+    def test_totals_without_objects(self, data_path):
+        """Тест: Итоги и фильтры считаются по записям"""
+        with MmapEmployeeRepository(data_path) as repo:
+            repo.save_employee(Employee(1, "John", "IT", 5000))
+            repo.save_employee(Manager(2, "Alice", "MAN", 7000, 2000))
+            repo.save_employee(Developer(3, "Bob", "DEV", 5000, ["Python"], "senior"))
+            repo.save_employee(Salesperson(4, "Charlie", "SAL", 4000, 0.15, 50000))
+
+            assert repo.total_salary() == pytest.approx(35500)
+            assert repo.find_ids(min_salary=9500) == [3, 4]
+            assert repo.find_ids(max_salary=9000) == [1, 2]
+
+    def test_lazy_objects_after_reopen(self, data_path):
+        """Тест: Данные сохраняются, объекты создаются по запросу"""
+        with MmapEmployeeRepository(data_path) as repo:
+            repo.save_employee(Developer(1, "Боб", "DEV", 5000, ["Python"], "middle"))
+            repo.save_employee(Employee(2, "John", "IT", 5000))
+            repo.save_employee(Employee(2, "John", "IT", 6000))
+            assert repo.delete_employee(1) is True
+            assert repo.delete_employee(1) is False
+
+        with MmapEmployeeRepository(data_path) as repo:
+            assert repo.total_salary() == 6000
+            assert repo.get_employee(1) is None
+            assert repo.get_employee(2).base_salary == 6000
+            assert len(repo) == 1
+
+    def test_growth(self, data_path):
+        """Тест: Файл расширяется при заполнении"""
+        with MmapEmployeeRepository(data_path, capacity=2) as repo:
+            for i in range(1, 11):
+                repo.save_employee(
+                    Developer(i, f"Dev{i}", "DEV", 1000, ["Go"], "junior")
+                )
+
+            developers = list(repo.iter_employees())
+
+        assert [dev.id for dev in developers] == list(range(1, 11))
+        assert developers[-1].skills == ["Go"]
+        with MmapEmployeeRepository(data_path) as repo:
+            assert repo.total_salary() == 10000
+
+    def test_iteration_does_not_block_writers(self, data_path):
+        """Тест: Приостановленный перебор не держит блокировку"""
+        with MmapEmployeeRepository(data_path) as repo:
+            for i in range(1, 4):
+                repo.save_employee(Employee(i, f"Emp{i}", "IT", 1000))
+            employees = repo.iter_employees()
+            next(employees)
+
+            writer = threading.Thread(
+                target=repo.save_employee, args=(Employee(9, "New", "IT", 1),)
+            )
+            writer.start()
+            writer.join(timeout=5)
+
+            assert not writer.is_alive()
+            assert len(list(employees)) == 2
+
+    def test_strategies(self, data_path):
+        """Тест: Встроенная стратегия сохраняется, пользовательская - нет"""
+        emp = Employee(1, "John", "IT", 5000, ManagerSalaryStrategy())
+        emp.bonus = 1000
+        with MmapEmployeeRepository(data_path) as repo:
+            repo.save_employee(emp)
+            with pytest.raises(ValueError):
+                repo.save_employee(Employee(2, "Bob", "IT", 5000, DoubleStrategy()))
+
+            assert repo.total_salary() == 6000
+            assert repo.get_employee(1).calculate_salary() == 6000
+            assert repo.get_employee(2) is None
+
+
+class TestSqliteEmployeeRepository:
+    """Тестирование хранилища SQLite"""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        repository = SqliteEmployeeRepository(str(tmp_path / "employees.db"))
+        yield repository
+        repository.close()
+
+    def test_bulk_upsert_and_aggregates(self, repo):
+        """Тест: Массовая вставка, обновление и агрегаты по отделам"""
+        repo.save_employees(
+            [
+                Manager(1, "Alice", "DEV", 7000, 2000),
+                Developer(2, "Bob", "DEV", 5000, ["Python"], "senior"),
+                Salesperson(3, "Charlie", "SAL", 4000, 0.15, 50000),
+            ]
+        )
+        repo.save_employees([Manager(1, "Alice", "DEV", 8000, 2000)])
+
+        assert repo.get_employee(1).base_salary == 8000
+        assert repo.get_employee(2).skills == ["Python"]
+        assert repo.department_totals() == {"DEV": 20000, "SAL": 11500}
+        assert repo.department_averages()["DEV"] == 10000
+        assert repo.total_salary() == 31500
+        assert [e.id for e in repo.get_department_employees("DEV")] == [1, 2]
+
+    def test_delete(self, repo):
+        """Тест: Удаление сотрудника"""
+        repo.save_employee(Employee(1, "John", "IT", 5000))
+
+        assert repo.delete_employee(1) is True
+        assert repo.delete_employee(1) is False
+        assert repo.get_all_employees() == []
+        assert repo.total_salary() == 0
+
+    def test_concurrent_writers(self, repo):
+        """Тест: Запись из нескольких потоков через пул соединений"""
+
+        def worker(start):
+            repo.save_employees(
+                Employee(i, f"E{i}", "IT", 1000) for i in range(start, start + 50)
+            )
+
+        threads = [
+            threading.Thread(target=worker, args=(n * 50 + 1,)) for n in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(repo.get_all_employees()) == 200
+        assert repo.department_totals() == {"IT": 200000}
+
+    def test_iteration_releases_connection(self, tmp_path):
+        """Тест: Брошенный и вложенный обход не занимают пул"""
+        repo = SqliteEmployeeRepository(str(tmp_path / "small.db"), pool_size=1)
+        repo.save_employees(Employee(i, f"E{i}", "IT", 1000) for i in range(1, 6))
+        pairs = []
+
+        def scan():
+            abandoned = repo.iter_employees(page_size=2)
+            next(abandoned)
+            for outer in repo.iter_employees(page_size=2):
+                for inner in repo.iter_employees(page_size=3):
+                    pairs.append((outer.id, inner.id))
+            pairs.append(repo.get_employee(5).id)
+
+        thread = threading.Thread(target=scan)
+        thread.start()
+        thread.join(5)
+        repo.close()
+
+        assert not thread.is_alive()
+        assert len(pairs) == 26 and pairs[-1] == 5
+
+    def test_strategies(self, repo):
+        """Тест: Встроенная стратегия сохраняется, пользовательская - нет"""
+        emp = Employee(1, "John", "IT", 5000, ManagerSalaryStrategy())
+        emp.bonus = 1000
+        repo.save_employee(emp)
+
+        with pytest.raises(ValueError):
+            repo.save_employees([Employee(2, "Bob", "IT", 5000, DoubleStrategy())])
+
+        assert repo.total_salary() == 6000
+        assert repo.get_employee(1).calculate_salary() == 6000
+        assert repo.get_employee(2) is None
+
+
+class SlowRepository(InMemoryEmployeeRepository):
+    """Хранилище с медленным чтением и счетчиком обращений"""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+        self.release = threading.Event()
+
+    def get_employee(self, emp_id):
+        self.reads += 1
+        self.release.wait(5)
+        return super().get_employee(emp_id)
+
+
+class TestCachingEmployeeRepository:
+    """Тестирование кэширующей обертки над хранилищем"""
+
+    def test_write_through_and_invalidation(self, tmp_path):
+        """Тест: Запись обновляет кэш, удаление убирает запись"""
+        backend = SqliteEmployeeRepository(str(tmp_path / "staff.db"))
+        repo = CachingEmployeeRepository(backend, maxsize=2)
+        repo.save_employee(Employee(1, "John", "IT", 5000))
+        assert repo.get_employee(1).name == "John"
+        assert repo.stats.hits == 1 and repo.stats.loads == 0
+
+        repo.save_employee(Employee(1, "Jane", "IT", 5000))
+        assert repo.get_employee(1).name == "Jane"
+        assert backend.get_employee(1).name == "Jane"
+
+        assert repo.delete_employee(1) is True
+        assert repo.get_employee(1) is None
+        assert repo.stats.loads == 1
+        repo.close()
+
+    def test_batch_lookup_and_eviction(self):
+        """Тест: Пакетный запрос загружает только промахи"""
+        backend = InMemoryEmployeeRepository()
+        backend.save_employees(Employee(i, f"E{i}", "IT", 1000) for i in range(1, 6))
+        repo = CachingEmployeeRepository(backend, maxsize=3)
+        repo.get_employee(1)
+        names = [emp and emp.name for emp in repo.get_employees([1, 2, 9, 3, 4])]
+        assert names == ["E1", "E2", None, "E3", "E4"]
+        assert repo.stats.loads == 2
+        assert repo.stats.evictions == 1
+
+    def test_concurrent_misses_load_once(self):
+        """Тест: Одновременные промахи по одному ID - одна загрузка"""
+        backend = SlowRepository()
+        backend.save_employee(Employee(7, "John", "IT", 5000))
+        repo = CachingEmployeeRepository(backend)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(repo.get_employee(7)))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        while not repo._flights:
+            pass
+        backend.release.set()
+        for thread in threads:
+            thread.join()
+        assert [emp.name for emp in results] == ["John"] * 8
+        assert backend.reads <= 2
+        assert repo.get_employee(7) is results[0]
+
+    def test_interrupted_load_releases_waiters(self):
+        """Тест: KeyboardInterrupt загрузки не оставляет зависших ожиданий"""
+
+        class InterruptedRepository(SlowRepository):
+            def get_employee(self, emp_id):
+                super().get_employee(emp_id)
+                raise KeyboardInterrupt
+
+        backend = InterruptedRepository()
+        repo = CachingEmployeeRepository(backend)
+        errors = []
+
+        def lookup():
+            try:
+                repo.get_employee(1)
+            except KeyboardInterrupt as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=lookup) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        while not backend.reads:
+            pass
+        backend.release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert not any(thread.is_alive() for thread in threads)
+        assert len(errors) == 4
+        assert repo._flights == {}
+
+    def test_concurrent_saves_keep_latest(self):
+        """Тест: Параллельные записи одного ID не оставляют старый объект"""
+
+        class SlowWriteRepository(InMemoryEmployeeRepository):
+            def __init__(self):
+                super().__init__()
+                self.writing = threading.Event()
+                self.release = threading.Event()
+
+            def save_employee(self, employee):
+                super().save_employee(employee)
+                if employee.name == "Old":
+                    self.writing.set()
+                    self.release.wait(5)
+
+        backend = SlowWriteRepository()
+        repo = CachingEmployeeRepository(backend)
+        first = threading.Thread(
+            target=repo.save_employee, args=(Employee(1, "Old", "IT", 5000),)
+        )
+        first.start()
+        backend.writing.wait(5)
+        second = threading.Thread(
+            target=repo.save_employee, args=(Employee(1, "New", "IT", 6000),)
+        )
+        second.start()
+        time.sleep(0.05)
+        backend.release.set()
+        first.join()
+        second.join()
+
+        assert backend.get_employee(1).name == "New"
+        assert repo.get_employee(1).name == "New"
+
+    def test_batch_load_does_not_overwrite_write(self):
+        """Тест: Запись во время пакетной загрузки не затирается в кэше"""
+
+        class StaleRepository(SlowRepository):
+            def get_employee(self, emp_id):
+                employee = InMemoryEmployeeRepository.get_employee(self, emp_id)
+                self.reads += 1
+                self.release.wait(5)
+                return employee
+
+        backend = StaleRepository()
+        backend.save_employee(Employee(1, "Old", "IT", 5000))
+        repo = CachingEmployeeRepository(backend)
+        reader = threading.Thread(target=repo.get_employees, args=([1],))
+        reader.start()
+        while not backend.reads:
+            pass
+
+        repo.save_employee(Employee(1, "New", "IT", 6000))
+        backend.release.set()
+        reader.join()
+
+        assert repo.get_employee(1).name == "New"
+
+    def test_company_uses_cache(self):
+        """Тест: Компания работает с кэширующим хранилищем"""
+        repo = CachingEmployeeRepository(InMemoryEmployeeRepository())
+        company = Company("Acme", repository=repo)
+        company.add_employee(Employee(1, "John", "IT", 5000))
+        assert company.find_employee(1).name == "John"
+        assert company.remove_employee(1) is True
+        assert company.find_employee(1) is None
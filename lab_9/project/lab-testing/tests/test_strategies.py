@@ -0,0 +1,126 @@
+import pytest
+from compact import CompactManager, CompactDeveloper
+from department import Department
+from employee import Employee, Manager, Developer, Salesperson
+from strategies import (
+    DeveloperSalaryStrategy,
+    ManagerSalaryStrategy,
+    SalespersonSalaryStrategy,
+    calculate_batch,
+    calculate_many,
+)
+
+
+class FlatBonusStrategy(ManagerSalaryStrategy):
+    """Наследник с переопределенным calculate"""
+
+    def calculate(self, employee) -> float:
+        return employee.base_salary + 100
+
+
+class RateStrategy(ManagerSalaryStrategy):
+    """Наследник с состоянием"""
+
+    def __init__(self, rate):
+        self.rate = rate
+
+    def calculate(self, employee) -> float:
+        return employee.base_salary * self.rate
+
+
+class TestCalculateMany:
+    """Тестирование пакетного расчета по стратегиям"""
+
+    def test_matches_calculate(self):
+        """Тест: Результаты совпадают с calculate() поэлементно"""
+        staff = [
+            Employee(1, "John", "IT", 5000),
+            Manager(2, "Alice", "MAN", 7000, 2000),
+            Developer(3, "Bob", "DEV", 5000, ["Python"], "middle"),
+            Developer(4, "Eve", "DEV", 4000, [], "lead"),
+            Salesperson(5, "Charlie", "SAL", 4000, 0.15, 50000),
+            CompactManager(6, "Dan", "MAN", 6000, 500),
+            CompactDeveloper(7, "Kim", "DEV", 3000, [], "senior"),
+            Employee(8, "Ann", "IT", 4000, ManagerSalaryStrategy()),
+            Employee(9, "Tom", "IT", 4000, FlatBonusStrategy()),
+        ]
+
+        expected = [emp.salary_strategy.calculate(emp) for emp in staff]
+
+        assert calculate_many(staff) == expected
+
+    def test_missing_attribute_uses_defaults(self):
+        """Тест: Без нужных атрибутов действуют значения по умолчанию"""
+        emp = Employee(1, "John", "IT", 5000, SalespersonSalaryStrategy())
+
+        assert calculate_many([emp]) == [5000]
+
+
+class TestCalculateBatch:
+    """Тестирование пакетного интерфейса стратегий"""
+
+    @pytest.mark.parametrize(
+        "strategy",
+        [
+            ManagerSalaryStrategy(),
+            DeveloperSalaryStrategy(),
+            SalespersonSalaryStrategy(),
+        ],
+    )
+    def test_batch_matches_calculate(self, strategy):
+        """Тест: calculate_batch совпадает с calculate()"""
+        staff = [
+            Manager(1, "Alice", "MAN", 7000, 2000),
+            Developer(2, "Bob", "DEV", 5000, [], "senior"),
+            Salesperson(3, "Charlie", "SAL", 4000, 0.15, 50000),
+        ]
+
+        result = strategy.calculate_batch(staff)
+
+        assert list(result) == [strategy.calculate(emp) for emp in staff]
+
+    def test_fallback_for_overridden_calculate(self):
+        """Тест: Наследник без calculate_batch считается своим calculate"""
+        staff = [
+            Employee(i, f"Emp{i}", "IT", 1000 * i, FlatBonusStrategy())
+            for i in range(1, 4)
+        ]
+
+        assert list(calculate_batch(staff)) == [1100, 2100, 3100]
+
+    def test_stateful_subclass(self):
+        """Тест: Экземпляры наследника с состоянием считаются по отдельности"""
+        staff = [
+            Employee(1, "John", "IT", 1000, RateStrategy(2)),
+            Employee(2, "Ann", "IT", 1000, RateStrategy(3)),
+        ]
+
+        assert not RateStrategy.stateless
+        assert list(calculate_batch(staff)) == [2000, 3000]
+        assert list(staff[1].salary_strategy.calculate_batch(staff)) == [3000, 3000]
+
+    def test_overridden_calculate_salary(self):
+        """Тест: Собственный calculate_salary() сотрудника не пропускается"""
+
+        class Intern(Employee):
+            def calculate_salary(self) -> float:
+                return super().calculate_salary() / 2
+
+        staff = [Intern(1, "John", "IT", 1000), Employee(2, "Ann", "IT", 1000)]
+
+        assert list(calculate_batch(staff)) == [500, 1000]
+
+    def test_department_bulk_add(self):
+        """Тест: Пакетное добавление в отдел"""
+        dept = Department("DEV")
+        staff = [
+            Manager(1, "Alice", "DEV", 7000, 2000),
+            Developer(2, "Bob", "DEV", 5000, [], "senior"),
+            Manager(1, "Alice", "DEV", 7000, 2000),
+        ]
+
+        dept.add_employees(staff)
+
+        assert len(dept) == 2
+        assert dept.calculate_total_salary() == 19000
+        assert dept.recalculate_salary_stats()["total"] == 19000
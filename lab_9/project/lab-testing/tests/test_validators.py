@@ -0,0 +1,46 @@
+import pytest
+from validators import EmployeeValidator
+
+
+class TestValidateBatch:
+    """Тестирование пакетной проверки колонок"""
+
+    def test_valid_columns(self):
+        """Тест: Корректные колонки дают нулевые коды"""
+        codes = EmployeeValidator.validate_batch([1, 2, 3], ["A", "B", "C"], [0, 1, 2])
+
+        assert list(codes) == [0, 0, 0]
+
+    def test_error_codes(self):
+        """Тест: Коды ошибок по строкам"""
+        validator = EmployeeValidator
+        codes = validator.validate_batch(
+            [1, -2, 3, 1, "x", 7],
+            ["A", "B", "", "D", "E", None],
+            [100, 100, 100, -1, 100, "много"],
+        )
+
+        assert list(codes) == [
+            0,
+            validator.ERROR_ID,
+            validator.ERROR_NAME,
+            validator.ERROR_SALARY | validator.ERROR_DUPLICATE_ID,
+            validator.ERROR_ID,
+            validator.ERROR_NAME | validator.ERROR_SALARY,
+        ]
+        assert validator.describe(codes[3]) == [
+            "Зарплата не может быть отрицательной",
+            "ID повторяется",
+        ]
+        assert validator.describe(0) == []
+
+    def test_known_ids(self):
+        """Тест: ID, загруженные ранее, считаются повторами"""
+        codes = EmployeeValidator.validate_batch([5, 6], ["A", "B"], [1, 1], [6, 9])
+
+        assert list(codes) == [0, EmployeeValidator.ERROR_DUPLICATE_ID]
+
+    def test_column_lengths(self):
+        """Тест: Колонки должны быть одной длины"""
+        with pytest.raises(ValueError):
+            EmployeeValidator.validate_batch([1, 2], ["A"], [1, 2])
@@ -0,0 +1,120 @@
+import os
+import pytest
+from employee import Employee, Manager
+from patterns import BonusDecorator, InMemoryEmployeeRepository
+from repositories import InMemoryEmployeeRepository as SimpleRepository
+from wal import WalCorruptedError, WriteAheadLog
+
+
+@pytest.fixture
+def wal_path(tmp_path):
+    return str(tmp_path / "employees.wal")
+
+
+class TestWriteAheadLog:
+    """Тестирование журнала упреждающей записи"""
+
+    def test_recover_after_restart(self, wal_path):
+        """Тест: Состояние восстанавливается после перезапуска"""
+        repo = InMemoryEmployeeRepository(wal=WriteAheadLog(wal_path))
+        repo.add(Employee(1, "John", "IT", 5000))
+        repo.add(Manager(2, "Alice", "MAN", 7000, 2000))
+        repo.add(Employee(1, "John", "IT", 6000))
+        repo.remove(2)
+        repo.close()
+
+        restored = InMemoryEmployeeRepository(wal=WriteAheadLog(wal_path))
+        restored.close()
+
+        assert list(restored.employees) == [1]
+        assert restored.find_by_id(1).base_salary == 6000
+
+    def test_group_commit(self, wal_path):
+        """Тест: Операции попадают на диск группами"""
+        wal = WriteAheadLog(wal_path, group_size=3)
+        repo = InMemoryEmployeeRepository(wal=wal)
+        for i in range(1, 5):
+            repo.add(Employee(i, f"E{i}", "IT", 1000))
+
+        # Без close(): на диске только первая группа из трех операций
+        assert sorted(wal.recover()) == [1, 2, 3]
+        wal.flush()
+        assert sorted(wal.recover()) == [1, 2, 3, 4]
+        wal.close()
+
+    def test_checkpoint_truncates_log(self, wal_path):
+        """Тест: Снимок обрезает журнал, хвост дочитывается"""
+        wal = WriteAheadLog(wal_path, group_size=1, checkpoint_every=5)
+        repo = SimpleRepository(wal=wal)
+        for i in range(1, 6):
+            repo.save_employee(Employee(i, f"E{i}", "IT", 1000))
+        assert os.path.getsize(wal_path) == 0
+
+        repo.delete_employee(3)
+        repo.save_employee(Employee(6, "E6", "IT", 1000))
+        repo.close()
+        # Оборванная запись в конце журнала
+        with open(wal_path, "ab") as file:
+            file.write(b"\x01\x00")
+
+        restored = SimpleRepository(wal=WriteAheadLog(wal_path))
+        assert sorted(restored.employees) == [1, 2, 4, 5, 6]
+        restored.save_employee(Employee(7, "E7", "IT", 1000))
+        restored.close()
+        with WriteAheadLog(wal_path) as wal:
+            assert 7 in wal.recover()
+
+    def test_corruption_before_tail_raises(self, wal_path):
+        """Тест: Поврежденная запись в середине журнала не отрезается"""
+        with WriteAheadLog(wal_path) as wal:
+            for i in range(1, 4):
+                wal.log_save(Employee(i, f"E{i}", "IT", 1000))
+        size = os.path.getsize(wal_path)
+        with open(wal_path, "r+b") as file:
+            # Байт данных первой записи
+            file.seek(WriteAheadLog._RECORD.size + 2)
+            file.write(b"#")
+
+        with pytest.raises(WalCorruptedError):
+            WriteAheadLog(wal_path)
+        assert os.path.getsize(wal_path) == size
+
+    def test_corrupted_last_record_truncated(self, wal_path):
+        """Тест: Поврежденная последняя запись отрезается"""
+        with WriteAheadLog(wal_path) as wal:
+            wal.log_save(Employee(1, "John", "IT", 1000))
+            wal.log_save(Employee(2, "Jane", "IT", 1000))
+        with open(wal_path, "r+b") as file:
+            file.seek(-2, os.SEEK_END)
+            file.write(b"##")
+
+        with WriteAheadLog(wal_path) as wal:
+            assert sorted(wal.recover()) == [1]
+
+    def test_recover_has_no_side_effects(self, wal_path):
+        """Тест: Повторное восстановление не меняет счетчик снимков"""
+        with WriteAheadLog(wal_path, checkpoint_every=3) as wal:
+            wal.log_save(Employee(1, "John", "IT", 5000))
+            wal.log_save(Employee(2, "Jane", "IT", 5000))
+
+        with WriteAheadLog(wal_path, checkpoint_every=3) as wal:
+            for _ in range(5):
+                assert sorted(wal.recover()) == [1, 2]
+            assert not wal.needs_checkpoint
+
+    def test_unsupported_employee_rejected(self, wal_path):
+        """Тест: Декорированный сотрудник отклоняется до записи"""
+        with WriteAheadLog(wal_path) as wal:
+            repo = InMemoryEmployeeRepository(wal=wal)
+            decorated = BonusDecorator(Employee(1, "John", "IT", 5000), 500)
+
+            with pytest.raises(ValueError, match="журнал"):
+                repo.add(decorated)
+
+            assert repo.find_by_id(1) is None
+            assert wal.recover() == {}
+
+    def test_invalid_parameters(self, wal_path):
+        """Тест: Неположительный размер группы"""
+        with pytest.raises(ValueError):
+            WriteAheadLog(wal_path, group_size=0)
@@ -1,60 +1,183 @@
-"""Валидация данных сотрудников."""
-
-
-class EmployeeValidator:
-    """Валидатор для данных сотрудников."""
-
-    @staticmethod
-    def validate_id(emp_id: int) -> None:
-        """Проверка ID сотрудника.
-
-        Args:
-            emp_id: Идентификатор сотрудника
-
-        Raises:
-            ValueError: Если ID <= 0
-        """
-        if emp_id <= 0:
-            raise ValueError("ID должен быть положительным числом")
-
-    @staticmethod
-    def validate_name(name: str) -> None:
-        """Проверка имени сотрудника.
-
-        Args:
-            name: Имя сотрудника
-
-        Raises:
-            ValueError: Если имя пусто или не строка
-        """
-        if not name or not isinstance(name, str):
-            raise ValueError("Имя должно быть непустой строкой")
-
-    @staticmethod
-    def validate_salary(salary: float) -> None:
-        """Проверка зарплаты.
-
-        Args:
-            salary: Размер зарплаты
-
-        Raises:
-            ValueError: Если зарплата < 0
-        """
-        if salary < 0:
-            raise ValueError("Зарплата не может быть отрицательной")
-
-    @staticmethod
-    def validate_employee(emp_id: int, name: str, salary: float) -> None:
-        """Полная валидация данных сотрудника.
-
-        Args:
-            emp_id: Идентификатор
-            name: Имя
-            salary: Зарплата
-
-        Raises:
-            ValueError: Если что-то неправильно
-        """
-        EmployeeValidator.validate_id(emp_id)
-        EmployeeValidator.validate_name(name)
-        EmployeeValidator.validate_salary(salary)
+"""Валидация данных сотрудников."""
+
+from array import array
+from itertools import repeat
+from typing import AbstractSet, Any, Callable, Iterable, List, Optional, Sequence
+
+
+def _bad_id(emp_id: Any) -> bool:
+    """ID не является положительным числом."""
+    try:
+        return not emp_id > 0
+    except TypeError:
+        return True
+
+
+def _bad_name(name: Any) -> bool:
+    """Имя пусто или не строка."""
+    return not name or not isinstance(name, str)
+
+
+def _bad_salary(salary: Any) -> bool:
+    """Зарплата отрицательна или не число."""
+    try:
+        return salary < 0
+    except TypeError:
+        return True
+
+
+class EmployeeValidator:
+    """Валидатор для данных сотрудников."""
+
+    # Коды ошибок validate_batch (битовые флаги, 0 - строка корректна)
+    ERROR_ID = 1
+    ERROR_NAME = 2
+    ERROR_SALARY = 4
+    ERROR_DUPLICATE_ID = 8
+
+    ERROR_MESSAGES = {
+        ERROR_ID: "ID должен быть положительным числом",
+        ERROR_NAME: "Имя должно быть непустой строкой",
+        ERROR_SALARY: "Зарплата не может быть отрицательной",
+        ERROR_DUPLICATE_ID: "ID повторяется",
+    }
+
+    @staticmethod
+    def validate_id(emp_id: int) -> None:
+        """Проверка ID сотрудника.
+
+        Args:
+            emp_id: Идентификатор сотрудника
+
+        Raises:
+            ValueError: Если ID <= 0
+        """
+        if emp_id <= 0:
+            raise ValueError("ID должен быть положительным числом")
+
+    @staticmethod
+    def validate_name(name: str) -> None:
+        """Проверка имени сотрудника.
+
+        Args:
+            name: Имя сотрудника
+
+        Raises:
+            ValueError: Если имя пусто или не строка
+        """
+        if not name or not isinstance(name, str):
+            raise ValueError("Имя должно быть непустой строкой")
+
+    @staticmethod
+    def validate_salary(salary: float) -> None:
+        """Проверка зарплаты.
+
+        Args:
+            salary: Размер зарплаты
+
+        Raises:
+            ValueError: Если зарплата < 0
+        """
+        if salary < 0:
+            raise ValueError("Зарплата не может быть отрицательной")
+
+    @staticmethod
+    def validate_employee(emp_id: int, name: str, salary: float) -> None:
+        """Полная валидация данных сотрудника.
+
+        Args:
+            emp_id: Идентификатор
+            name: Имя
+            salary: Зарплата
+
+        Raises:
+            ValueError: Если что-то неправильно
+        """
+        EmployeeValidator.validate_id(emp_id)
+        EmployeeValidator.validate_name(name)
+        EmployeeValidator.validate_salary(salary)
+
+    @staticmethod
+    def _mark(codes: array, flags: Iterable[bool], code: int) -> None:
+        """Добавить код ошибки строкам с истинным флагом."""
+        for row, bad in enumerate(flags):
+            if bad:
+                codes[row] |= code
+
+    @staticmethod
+    def _column_ok(check: Callable[[], bool]) -> bool:
+        """Проверка колонки целиком (False, если значения несравнимы)."""
+        try:
+            return check()
+        except TypeError:
+            return False
+
+    @classmethod
+    def validate_batch(
+        cls,
+        ids: Sequence[int],
+        names: Sequence[str],
+        salaries: Sequence[float],
+        known_ids: Optional[Iterable[int]] = None,
+    ) -> array:
+        """Проверка колонок данных сотрудников без исключений.
+
+        Каждая колонка сначала проверяется целиком встроенными
+        функциями (min, all, set); построчный проход выполняется только
+        для колонок, в которых есть ошибки. ID проверяются на повторы
+        в том же проходе: повтором считается ID из более ранней строки
+        или из known_ids.
+
+        Args:
+            ids: Колонка идентификаторов
+            names: Колонка имен
+            salaries: Колонка зарплат
+            known_ids: Уже загруженные ID (опционально)
+
+        Returns:
+            Коды ошибок по строкам (сумма флагов ERROR_*, 0 - строка
+            корректна)
+
+        Raises:
+            ValueError: Если колонки разной длины
+        """
+        count = len(ids)
+        if len(names) != count or len(salaries) != count:
+            raise ValueError("Колонки должны быть одной длины")
+        codes = array("B", bytes(count))
+        if not count:
+            return codes
+        if not cls._column_ok(lambda: min(ids) > 0):
+            cls._mark(codes, map(_bad_id, ids), cls.ERROR_ID)
+        if not (all(names) and all(map(isinstance, names, repeat(str)))):
+            cls._mark(codes, map(_bad_name, names), cls.ERROR_NAME)
+        if not cls._column_ok(lambda: min(salaries) >= 0):
+            cls._mark(codes, map(_bad_salary, salaries), cls.ERROR_SALARY)
+
+        known = known_ids
+        if not isinstance(known, AbstractSet):
+            known = set(known or ())
+        if not cls._column_ok(lambda: len(set(ids)) == count and known.isdisjoint(ids)):
+            seen = set(known)
+            for row, emp_id in enumerate(ids):
+                try:
+                    if emp_id in seen:
+                        codes[row] |= cls.ERROR_DUPLICATE_ID
+                    else:
+                        seen.add(emp_id)
+                except TypeError:
+                    # Нехэшируемый ID уже отмечен как некорректный
+                    codes[row] |= cls.ERROR_ID
+        return codes
+
+    @classmethod
+    def describe(cls, code: int) -> List[str]:
+        """Сообщения об ошибках по коду validate_batch.
+
+        Args:
+            code: Код ошибок строки
+
+        Returns:
+            Список сообщений (пустой для корректной строки)
+        """
+        return [message for flag, message in cls.ERROR_MESSAGES.items() if code & flag]
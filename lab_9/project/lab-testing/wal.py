@@ -0,0 +1,262 @@
+"""Журнал упреждающей записи (WAL) для хранилищ сотрудников в памяти."""
+
+import json
+import os
+import struct
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+from serializers import EmployeeSerializer
+
+
+class WalCorruptedError(ValueError):
+    """Поврежденная запись в середине журнала или снимка.
+
+    Такую запись нельзя объяснить оборванной при сбое последней
+    записью, поэтому данные после нее не отрезаются молча.
+    """
+
+
+class WriteAheadLog:
+    """Журнал операций со снимками состояния.
+
+    Каждая операция дописывается в журнал ``path`` записью
+    (операция, ID, длина, CRC32, JSON). Записи копятся в буфере и
+    сбрасываются на диск группой с одним fsync: каждые ``group_size``
+    операций или при flush(). После ``checkpoint_every`` операций
+    хранилище сохраняет снимок ``path + ".snapshot"`` и журнал
+    обрезается, поэтому восстановление читает снимок и только хвост
+    журнала после него.
+
+    Операции из незаписанной группы при сбое теряются; flush()
+    делает их надежными немедленно. Оборванная при сбое последняя
+    запись журнала отрезается при открытии; поврежденная запись, за
+    которой есть другие, вызывает WalCorruptedError.
+    """
+
+    _SAVE = 1
+    _DELETE = 2
+    # операция, ID, длина данных, CRC32 данных
+    _RECORD = struct.Struct("<BqII")
+
+    def __init__(self, path: str, group_size: int = 64, checkpoint_every: int = 10_000):
+        """Открыть журнал.
+
+        Args:
+            path: Путь к файлу журнала
+            group_size: Количество операций в одной группе записи
+            checkpoint_every: Количество операций между снимками
+
+        Raises:
+            ValueError: Если group_size или checkpoint_every не положительны
+            WalCorruptedError: Если журнал поврежден не только в конце
+        """
+        if group_size <= 0 or checkpoint_every <= 0:
+            raise ValueError("Размер группы и интервал снимков должны быть > 0")
+        self.path = path
+        self.snapshot_path = path + ".snapshot"
+        self.group_size = group_size
+        self.checkpoint_every = checkpoint_every
+        self._buffer = bytearray()
+        self._pending = 0
+        self._since_checkpoint = 0
+        self._file = open(path, "ab")
+        try:
+            self._repair()
+        except BaseException:
+            self._file.close()
+            raise
+
+    def _repair(self) -> None:
+        """Отрезать оборванную запись и посчитать операции после снимка."""
+        log = self._read(self.path)
+        end = 0
+        for _, _, payload in self._records(log, self.path):
+            end += self._RECORD.size + len(payload)
+            self._since_checkpoint += 1
+        if end < len(log):
+            self._file.truncate(end)
+
+    def _encode(self, op: int, emp_id: int, payload: bytes) -> bytes:
+        """Заголовок и данные одной записи."""
+        return (
+            self._RECORD.pack(op, emp_id, len(payload), zlib.crc32(payload)) + payload
+        )
+
+    def _records(
+        self, data: bytes, path: str, torn_tail: bool = True
+    ) -> Iterator[Tuple[int, int, bytes]]:
+        """Целые записи из байтов файла.
+
+        Args:
+            data: Содержимое журнала или снимка
+            path: Путь к файлу (для сообщения об ошибке)
+            torn_tail: Пропускать оборванную последнюю запись
+
+        Yields:
+            Кортежи (операция, ID, данные)
+
+        Raises:
+            WalCorruptedError: Если поврежденная запись не последняя
+                (или torn_tail=False)
+        """
+        record = self._RECORD
+        offset = 0
+        while offset < len(data):
+            if offset + record.size > len(data):
+                end = len(data)
+            else:
+                op, emp_id, length, crc = record.unpack_from(data, offset)
+                start = offset + record.size
+                end = start + length
+                payload = data[start:end]
+                if end <= len(data) and zlib.crc32(payload) == crc:
+                    yield op, emp_id, payload
+                    offset = end
+                    continue
+            # Оборванной при сбое может быть только последняя запись
+            if torn_tail and end >= len(data):
+                return
+            raise WalCorruptedError(f"{path}: поврежденная запись по смещению {offset}")
+
+    @staticmethod
+    def _read(path: str) -> bytes:
+        """Содержимое файла или пустые байты, если его нет."""
+        try:
+            with open(path, "rb") as file:
+                return file.read()
+        except FileNotFoundError:
+            return b""
+
+    def recover(self) -> Dict[int, Any]:
+        """Восстановить состояние из снимка и хвоста журнала.
+
+        Только читает файлы: журнал и счетчики не меняются, поэтому
+        вызов можно повторять.
+
+        Returns:
+            Словарь {ID: сотрудник}
+
+        Raises:
+            WalCorruptedError: Если снимок поврежден или журнал
+                поврежден не только в конце
+        """
+        state: Dict[int, bytes] = {}
+        # Снимок заменяется атомарно, оборванных записей в нем не бывает
+        snapshot = self._read(self.snapshot_path)
+        for _, emp_id, payload in self._records(
+            snapshot, self.snapshot_path, torn_tail=False
+        ):
+            state[emp_id] = payload
+        for op, emp_id, payload in self._records(self._read(self.path), self.path):
+            if op == self._SAVE:
+                state[emp_id] = payload
+            else:
+                state.pop(emp_id, None)
+        return {
+            emp_id: EmployeeSerializer.from_dict(json.loads(payload))
+            for emp_id, payload in state.items()
+        }
+
+    def _append(self, op: int, emp_id: int, payload: bytes) -> None:
+        """Добавить запись в текущую группу."""
+        self._buffer += self._encode(op, emp_id, payload)
+        self._pending += 1
+        self._since_checkpoint += 1
+        if self._pending >= self.group_size:
+            self.flush()
+
+    def log_save(self, employee: Any) -> None:
+        """Записать сохранение сотрудника.
+
+        Args:
+            employee: Объект сотрудника
+
+        Raises:
+            ValueError: Если сотрудника нельзя восстановить из журнала
+                (декоратор, наследник, пользовательская стратегия)
+        """
+        try:
+            data = EmployeeSerializer.to_dict(employee)
+        except ValueError as error:
+            raise ValueError(
+                f"{type(employee).__name__} не записывается в журнал "
+                f"{self.path}: {error}"
+            ) from error
+        payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self._append(self._SAVE, employee.id, payload)
+
+    def log_delete(self, emp_id: int) -> None:
+        """Записать удаление сотрудника.
+
+        Args:
+            emp_id: ID сотрудника
+        """
+        self._append(self._DELETE, emp_id, b"")
+
+    def flush(self) -> None:
+        """Надежно записать текущую группу операций."""
+        if not self._buffer:
+            return
+        self._file.write(self._buffer)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._buffer = bytearray()
+        self._pending = 0
+
+    @property
+    def needs_checkpoint(self) -> bool:
+        """Пора ли сохранить снимок."""
+        return self._since_checkpoint >= self.checkpoint_every
+
+    def checkpoint(self, employees: Iterable[Any]) -> None:
+        """Сохранить снимок состояния и обрезать журнал.
+
+        Журнал обрезается только после надежной записи снимка;
+        повтор операций поверх нового снимка дает то же состояние.
+
+        Args:
+            employees: Все сотрудники хранилища
+        """
+        temp = self.snapshot_path + ".tmp"
+        with open(temp, "wb") as file:
+            for employee in employees:
+                data = EmployeeSerializer.to_dict(employee)
+                payload = json.dumps(data, ensure_ascii=False).encode("utf-8")
+                file.write(self._encode(self._SAVE, employee.id, payload))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp, self.snapshot_path)
+        self._fsync_directory()
+        # Операции текущей группы уже вошли в снимок
+        self._buffer = bytearray()
+        self._pending = 0
+        self._file.truncate(0)
+        os.fsync(self._file.fileno())
+        self._since_checkpoint = 0
+
+    def _fsync_directory(self) -> None:
+        """Надежно записать каталог снимка (переименование файла)."""
+        if not hasattr(os, "O_DIRECTORY"):
+            # Windows: каталог нельзя открыть для fsync
+            return
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def close(self) -> None:
+        """Записать текущую группу и закрыть журнал."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "WriteAheadLog":
+        """Вход в контекстный менеджер."""
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Закрытие журнала при выходе из контекста."""
+        self.close()